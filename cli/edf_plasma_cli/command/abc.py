@@ -22,6 +22,22 @@ class FileFormat(Enum):
 
     CSV = 'csv'
     JSONL = 'jsonl'
+    ARROW = 'arrow'
+    PARQUET = 'parquet'
+
+
+class Executor(Enum):
+    """Surgeon executor"""
+
+    THREAD = 'thread'
+    PROCESS = 'process'
+
+
+class Scheduler(Enum):
+    """Dissection scheduler"""
+
+    DISSECTOR = 'dissector'
+    GLOBAL = 'global'
 
 
 def _display_table_rich(headers, rows, **kwargs):
@@ -1,42 +1,218 @@
 """dissect command implementation"""
 
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
 from fnmatch import fnmatchcase
 from functools import cached_property
+from heapq import heappop, heappush
+from importlib import import_module
+from itertools import chain, count
+from multiprocessing import get_context
+from multiprocessing.managers import SyncManager
 from pathlib import Path
 from platform import node
-from queue import Queue
-from threading import Thread
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Semaphore, Thread
+from time import monotonic, sleep
+from typing import Any
 
 from edf_plasma_core.dissector import (
     DissectionContext,
     DissectionContextQueue,
     Dissector,
+    DissectorEntryList,
     DissectorList,
-    get_dissectors,
+    get_dissector,
+    get_dissector_entries,
+    get_unavailable_dissector_entries,
 )
-from edf_plasma_core.helper.csv import write_csv_gz
-from edf_plasma_core.helper.json import write_jsonl_gz
+from edf_plasma_core.helper.arrow import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_COMPRESSION,
+    PYARROW_AVAILABLE,
+    write_arrow,
+    write_parquet,
+)
+from edf_plasma_core.helper.compressing import (
+    Codec,
+    Compression,
+    codec_available,
+    codec_level_range,
+)
+from edf_plasma_core.helper.csv import write_csv_batches
+from edf_plasma_core.helper.importing import import_from_directory
+from edf_plasma_core.helper.indexing import index_directory
+from edf_plasma_core.helper.json import write_jsonl_batches
 from edf_plasma_core.helper.logging import get_logger
+from edf_plasma_core.helper.manifest import MANIFEST_FILENAME, Manifest
 from edf_plasma_core.helper.matching import regexp
 from edf_plasma_core.helper.perfmeter import PerformanceMeter
-from edf_plasma_core.helper.typing import RecordQueue
+from edf_plasma_core.helper.table import Table
+from edf_plasma_core.helper.typing import (
+    RecordBatch,
+    RecordBatchIterator,
+    RecordBatchQueue,
+)
 
-from .abc import FileFormat, display_table
+from .abc import Executor, FileFormat, Scheduler, display_table
 
 _LOGGER = get_logger('cli.command.dissect')
 _HOSTNAME_REPL_PATTERN = regexp(r'[^\w]+')
 _EXTENSION_STRATEGY = {
-    FileFormat.CSV: '.csv.gz',
-    FileFormat.JSONL: '.jsonl.gz',
+    FileFormat.CSV: '.csv',
+    FileFormat.JSONL: '.jsonl',
+    FileFormat.ARROW: '.arrow',
+    FileFormat.PARQUET: '.parquet',
 }
 _WRITE_FUNC_STRATEGY = {
-    FileFormat.CSV: write_csv_gz,
+    FileFormat.CSV: (
+        lambda dissector_ctx, filepath, table, batches: write_csv_batches(
+            filepath, table.names, batches, dissector_ctx.compression
+        )
+    ),
     FileFormat.JSONL: (
-        lambda filepath, _, records: write_jsonl_gz(filepath, records)
+        lambda dissector_ctx, filepath, table, batches: write_jsonl_batches(
+            filepath, batches, dissector_ctx.compression
+        )
+    ),
+    FileFormat.ARROW: (
+        lambda dissector_ctx, filepath, table, batches: write_arrow(
+            filepath,
+            table,
+            chain.from_iterable(batches),
+            batch_size=dissector_ctx.row_group_size,
+            compression=dissector_ctx.columnar_compression,
+        )
+    ),
+    FileFormat.PARQUET: (
+        lambda dissector_ctx, filepath, table, batches: write_parquet(
+            filepath,
+            table,
+            chain.from_iterable(batches),
+            row_group_size=dissector_ctx.row_group_size,
+            compression=dissector_ctx.columnar_compression,
+        )
     ),
 }
+_COLUMNAR_FILE_FORMATS = {FileFormat.ARROW, FileFormat.PARQUET}
+_COLUMNAR_COMPRESSIONS = ('none', 'lz4', 'zstd')
+_DEFAULT_BATCH_SIZE = 1000
+_DEFAULT_QUEUE_DEPTH = 50 * _DEFAULT_BATCH_SIZE
+_DEFAULT_FLUSH_INTERVAL = 1.0
+_SCHEDULER_WINDOW = 4096
+
+FamilyTargets = Iterable[tuple[Path, DissectorList]]
+
+
+class RecordBatcher:
+    """Group records in batches of at most batch_size records sent to
+    batch_queue
+
+    Incomplete batches are flushed by the flusher thread once
+    flush_interval seconds elapsed since their first record, even when
+    the dissector stalls.
+    """
+
+    def __init__(
+        self,
+        batch_queue: RecordBatchQueue,
+        batch_size: int,
+        flush_interval: float,
+    ):
+        self._batch_queue = batch_queue
+        self._batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = Lock()
+        self._batch = []
+        self._started = 0.0
+        self.records = 0
+
+    def _flush(self, block: bool = True):
+        if self._batch:
+            # lock is held while putting to keep batches in order
+            self._batch_queue.put(self._batch, block=block)
+            self.records += len(self._batch)
+            self._batch = []
+
+    def add(self, record) -> bool:
+        """Add record, return True if a full batch was sent"""
+        with self._lock:
+            if not self._batch:
+                self._started = monotonic()
+            self._batch.append(record)
+            if len(self._batch) < self._batch_size:
+                return False
+            self._flush()
+            return True
+
+    def flush_stale(self):
+        """Send incomplete batch if it is older than flush interval"""
+        # a batcher busy sending a batch has nothing stale to flush
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if monotonic() - self._started >= self.flush_interval:
+                # a full queue must not stall the flusher thread shared by
+                # every batcher, batch is sent again on next period
+                self._flush(block=False)
+        except Full:
+            pass
+        finally:
+            self._lock.release()
+
+    def __enter__(self):
+        _BATCH_FLUSHER.register(self)
+        return self
+
+    def __exit__(self, *_):
+        _BATCH_FLUSHER.unregister(self)
+        with self._lock:
+            self._flush()
+
+
+class BatchFlusher:
+    """Background thread flushing stale batches of registered batchers,
+    started on first registration in each process
+    """
+
+    _PERIOD_DIVISOR = 4
+    _MIN_PERIOD = 0.01
+
+    def __init__(self):
+        self._lock = Lock()
+        self._batchers = set()
+        self._period = None
+
+    def register(self, batcher: RecordBatcher):
+        """Register batcher"""
+        with self._lock:
+            if self._period is None:
+                Thread(target=self._flush_routine, daemon=True).start()
+            # flush latency stays within 1.25 flush interval
+            period = max(
+                self._MIN_PERIOD,
+                batcher.flush_interval / self._PERIOD_DIVISOR,
+            )
+            self._period = min(self._period or period, period)
+            self._batchers.add(batcher)
+
+    def unregister(self, batcher: RecordBatcher):
+        """Unregister batcher"""
+        with self._lock:
+            self._batchers.discard(batcher)
+
+    def _flush_routine(self):
+        while True:
+            sleep(self._period or self._MIN_PERIOD)
+            with self._lock:
+                batchers = list(self._batchers)
+            for batcher in batchers:
+                batcher.flush_stale()
+
+
+_BATCH_FLUSHER = BatchFlusher()
 
 
 @dataclass(kw_only=True)
@@ -49,11 +225,26 @@ class DissectorContext:
     prefix: bool
     output_directory: Path
     parallel_surgeons: int
+    row_group_size: int = DEFAULT_BATCH_SIZE
+    columnar_compression: str = DEFAULT_COMPRESSION
+    compression: Compression = Compression()
+    batch_size: int = _DEFAULT_BATCH_SIZE
+    queue_depth: int = _DEFAULT_QUEUE_DEPTH
+    flush_interval: float = _DEFAULT_FLUSH_INTERVAL
+    manifest: Manifest | None = None
+    shards: dict[str, int] = field(default_factory=dict)
+    manager: SyncManager | None = None
+    process_pool: ProcessPoolExecutor | None = None
+    writer_failures: list[str] = field(default_factory=list)
+    outputs: set[str] = field(default_factory=set)
 
     @cached_property
     def extension(self) -> str:
         """File format extension"""
-        return _EXTENSION_STRATEGY[self.file_format]
+        extension = _EXTENSION_STRATEGY[self.file_format]
+        if self.file_format in _COLUMNAR_FILE_FORMATS:
+            return extension
+        return f'{extension}{self.compression.extension}'
 
     @cached_property
     def sanitized_hostname(self) -> str:
@@ -66,20 +257,98 @@ class DissectorContext:
             return dissector.select(self.target)
         return [self.target]
 
+    @property
+    def queue_size(self) -> int:
+        """Record queue size in batches, queue depth being in records"""
+        return max(1, self.queue_depth // self.batch_size)
+
+    def batcher(self, batch_queue: RecordBatchQueue) -> RecordBatcher:
+        """Record batcher sending batches to batch_queue"""
+        return RecordBatcher(batch_queue, self.batch_size, self.flush_interval)
+
+    def write(
+        self, filepath: Path, table: Table, batches: RecordBatchIterator
+    ):
+        """Write batches of records to filepath using selected file format"""
+        _WRITE_FUNC_STRATEGY[self.file_format](self, filepath, table, batches)
+
+    def output_key(self, dissector: Dissector) -> str:
+        """Output file name without shard and extension"""
+        prefix = f'{self.sanitized_hostname}_' if self.prefix else ''
+        return f'{prefix}{dissector.slug}'
+
+    def _suffix(self, dissector: Dissector) -> str:
+        shard = self.shards.get(self.output_key(dissector))
+        shard = f'.{shard:04d}' if shard else ''
+        return f'{shard}{self.extension}'
+
     def out_filepath(self, dissector: Dissector) -> Path:
         """Output file path"""
-        prefix = f'{self.sanitized_hostname}_' if self.prefix else ''
-        filename = f'{prefix}{dissector.slug}{self.extension}'
+        filename = f'{self.output_key(dissector)}{self._suffix(dissector)}'
         return self.output_directory / filename
 
     def err_filepath(self, dissector: Dissector) -> Path:
         """Error file path"""
-        prefix = f'{self.sanitized_hostname}_' if self.prefix else ''
-        filename = f'{prefix}{dissector.slug}_error{self.extension}'
+        key = self.output_key(dissector)
+        filename = f'{key}_error{self._suffix(dissector)}'
         return self.output_directory / filename
 
+    def has_output(self, dissector: Dissector) -> bool:
+        """Determine if dissector output was written during this run"""
+        return self.output_key(dissector) in self.outputs
 
-def _select_tags(values: list[str], dissectors: DissectorList):
+    def pending_targets(self, dissector: Dissector) -> Iterable[Path]:
+        """Selected targets not dissected yet in their current state"""
+        if self.manifest is None:
+            return self.selected_targets(dissector)
+        key = self.output_key(dissector)
+        targets = []
+        unchanged = 0
+        for target in self.selected_targets(dissector):
+            if self.manifest.is_unchanged(key, target):
+                unchanged += 1
+                continue
+            targets.append(target)
+        _LOGGER.info(
+            "dissector=%s, state=incremental, unchanged=%d, pending=%d",
+            dissector.slug,
+            unchanged,
+            len(targets),
+        )
+        return targets
+
+    def open_shard(self, dissector: Dissector):
+        """Allocate output shard of dissector for this run"""
+        if self.manifest is None:
+            return
+        key = self.output_key(dissector)
+        self.shards[key] = self.manifest.open_shard(key)
+
+    def record(
+        self, dissector: Dissector, ctx: DissectionContext, records: int
+    ):
+        """Record dissection of ctx source in manifest"""
+        if self.manifest is None:
+            return
+        self.manifest.record(
+            self.output_key(dissector),
+            ctx.source,
+            records,
+            len(ctx.errors),
+            self.out_filepath(dissector).name,
+        )
+
+    def commit(self, dissector: Dissector):
+        """Commit dissector output shard in manifest"""
+        if self.manifest is None:
+            return
+        key = self.output_key(dissector)
+        self.manifest.commit(
+            key, self.shards[key], self.output_directory / MANIFEST_FILENAME
+        )
+
+
+def _select_tags(values: list[str], entries: DissectorEntryList):
     or_tags = set()
     and_tags = set()
     not_tags = set()
@@ -91,15 +360,15 @@ def _select_tags(values: list[str], dissectors: DissectorList):
         else:
             or_tags.add(val)
     selection = []
-    for dissector in dissectors:
-        tags = {tag.value for tag in dissector.tags}
+    for entry in entries:
+        tags = {tag.value for tag in entry.tags}
         if not_tags and not_tags.intersection(tags):
             continue
         if and_tags and len(and_tags.intersection(tags)) != len(and_tags):
             continue
         if or_tags and not or_tags.intersection(tags):
             continue
-        selection.append(dissector)
+        selection.append(entry)
     return selection
 
 
@@ -110,7 +379,7 @@ def _match_slug(candidate, slugs):
     return False
 
 
-def _select_slug(values: list[str], dissectors: DissectorList):
+def _select_slug(values: list[str], entries: DissectorEntryList):
     slugs = []
     not_slugs = []
     for val in values:
@@ -119,12 +388,12 @@ def _select_slug(values: list[str], dissectors: DissectorList):
         else:
             slugs.append(val)
     selection = []
-    for dissector in dissectors:
-        if not_slugs and _match_slug(dissector.slug, not_slugs):
+    for entry in entries:
+        if not_slugs and _match_slug(entry.slug, not_slugs):
             continue
-        if slugs and not _match_slug(dissector.slug, slugs):
+        if slugs and not _match_slug(entry.slug, slugs):
             continue
-        selection.append(dissector)
+        selection.append(entry)
     return selection
 
 
@@ -134,113 +403,377 @@ _SELECT_STRATEGY = {
 }
 
 
-def _select(filter_val: str, dissectors: DissectorList) -> DissectorList:
+def _select(
+    filter_val: str, entries: DissectorEntryList
+) -> DissectorEntryList:
     attr, values = filter_val.strip().split(':', 1)
     values = values.split(',')
-    return _SELECT_STRATEGY[attr](values, dissectors)
+    return _SELECT_STRATEGY[attr](values, entries)
 
 
-def _selection_routine(
-    processing_queue: Queue,
+def _dissection_context(
     dissector_ctx: DissectorContext,
     dissector: Dissector,
-    perfmeter: PerformanceMeter,
-):
-    for target in dissector_ctx.selected_targets(dissector):
-        ctx = DissectionContext(
-            dissector=dissector.slug,
-            hostname=dissector_ctx.hostname,
-            source=str(target),
-            filepath=target,
-            state=dissector.state,
+    target: Path,
+    family: list[str] | None = None,
+) -> DissectionContext:
+    return DissectionContext(
+        dissector=dissector.slug,
+        hostname=dissector_ctx.hostname,
+        source=str(target),
+        filepath=target,
+        state=dissector.state,
+        family=family or [],
+    )
+
+
+def _families(dissectors: DissectorList) -> list[DissectorList]:
+    """Group dissectors of the same family keeping selection order"""
+    families = {}
+    for dissector in dissectors:
+        key = (
+            ('family', dissector.family)
+            if dissector.family
+            else ('slug', dissector.slug)
         )
-        processing_queue.put(ctx)
-        perfmeter.tick()
-    processing_queue.put(None)
+        families.setdefault(key, []).append(dissector)
+    return list(families.values())
 
 
-def _dissection_routine(
-    record_queue: RecordQueue,
-    pre_dissection_queue: DissectionContextQueue,
-    post_dissection_queue: DissectionContextQueue,
-    dissector: Dissector,
-):
-    while True:
-        ctx = pre_dissection_queue.get()
-        if not ctx:
-            break
-        for record in dissector.dissect(ctx):
-            record_queue.put(record)
-        post_dissection_queue.put(ctx)
+def _family_slugs(family: DissectorList) -> str:
+    return ','.join(dissector.slug for dissector in family)
 
 
-def _consume_records(record_queue: RecordQueue):
-    while True:
-        record = record_queue.get()
-        if not record:
-            break
-        yield record
+def _family_targets(
+    dissector_ctx: DissectorContext, family: DissectorList
+) -> FamilyTargets:
+    """Pending targets and dissectors of family which shall dissect them
 
+    Dissectors of a family share their selector, targets are selected once
+    for the whole family unless dissection is incremental.
+    """
+    if dissector_ctx.manifest is None:
+        return (
+            (target, family)
+            for target in dissector_ctx.selected_targets(family[0])
+        )
+    pending = {}
+    for dissector in family:
+        targets = dissector_ctx.pending_targets(dissector)
+        if not targets:
+            _LOGGER.info("dissector=%s, state=unchanged", dissector.slug)
+        for target in targets:
+            pending.setdefault(target, []).append(dissector)
+    return list(pending.items())
 
-def _write_records_routine(
-    record_queue: RecordQueue,
+
+def _started_dissectors(
+    dissector_ctx: DissectorContext,
+    family: DissectorList,
+    targets: FamilyTargets,
+) -> DissectorList:
+    """Dissectors of family having pending targets"""
+    if dissector_ctx.manifest is None:
+        return family
+    slugs = {
+        dissector.slug for _, dissectors in targets for dissector in dissectors
+    }
+    return [dissector for dissector in family if dissector.slug in slugs]
+
+
+def _init_surgeon_process(plugin_directory: Path | None):
+    import_module('edf_plasma_dissectors')
+    import_from_directory(plugin_directory)
+
+
+def _surgeon_process_routine(
+    tasks: list[tuple[str, DissectionContext, Any]],
+    batch_size: int,
+    flush_interval: float,
+) -> list[tuple[DissectionContext, int]]:
+    results = []
+    for slug, ctx, batch_queue in tasks:
+        dissector = get_dissector(slug)
+        with RecordBatcher(batch_queue, batch_size, flush_interval) as batcher:
+            for record in dissector.dissect(ctx):
+                batcher.add(record)
+        results.append((ctx, batcher.records))
+    return results
+
+
+class BatchConsumer:
+    """Consume batches from a queue until the end of stream marker"""
+
+    def __init__(self, batch_queue: RecordBatchQueue):
+        self._batch_queue = batch_queue
+        self.ended = False
+
+    def __iter__(self) -> RecordBatchIterator:
+        while not self.ended:
+            batch = self._batch_queue.get()
+            if not batch:
+                self.ended = True
+                break
+            yield batch
+
+    def drain(self):
+        """Discard remaining batches"""
+        for _ in self:
+            pass
+
+
+def _writer_failed(
     dissector_ctx: DissectorContext,
     dissector: Dissector,
+    failed: Event,
+    filepath: Path,
 ):
-    write_records_to_file = _WRITE_FUNC_STRATEGY[dissector_ctx.file_format]
-    write_records_to_file(
-        dissector_ctx.out_filepath(dissector),
-        dissector.table_schema.names,
-        _consume_records(record_queue),
+    _LOGGER.exception(
+        "dissector=%s, writer failed: %s", dissector.slug, filepath
     )
+    failed.set()
+    dissector_ctx.writer_failures.append(str(filepath))
+
+
+def _write_records_routine(
+    record_queue: RecordBatchQueue,
+    dissector_ctx: DissectorContext,
+    dissector: Dissector,
+    failed: Event,
+):
+    filepath = dissector_ctx.out_filepath(dissector)
+    consumer = BatchConsumer(record_queue)
+    try:
+        dissector_ctx.write(filepath, dissector.table_schema, consumer)
+    except:
+        _writer_failed(dissector_ctx, dissector, failed, filepath)
+        # surgeons shall never block on a queue nobody consumes
+        consumer.drain()
 
 
-def _consume_errors(post_dissection_queue: DissectionContextQueue):
+def _consume_errors(
+    post_dissection_queue: DissectionContextQueue,
+) -> RecordBatchIterator:
     while True:
         ctx = post_dissection_queue.get()
         if not ctx:
             break
-        yield from ctx.errors_as_records()
+        batch: RecordBatch = list(ctx.errors_as_records())
+        if batch:
+            yield batch
 
 
 def _write_errors_routine(
     post_dissection_queue: Queue,
     dissector_ctx: DissectorContext,
     dissector: Dissector,
+    failed: Event,
 ):
-    write_records_to_file = _WRITE_FUNC_STRATEGY[dissector_ctx.file_format]
-    write_records_to_file(
-        dissector_ctx.err_filepath(dissector),
-        dissector.error_table_schema.names,
-        _consume_errors(post_dissection_queue),
+    filepath = dissector_ctx.err_filepath(dissector)
+    errors = _consume_errors(post_dissection_queue)
+    try:
+        dissector_ctx.write(filepath, dissector.error_table_schema, errors)
+    except:
+        _writer_failed(dissector_ctx, dissector, failed, filepath)
+        for _ in errors:
+            pass
+
+
+@dataclass(kw_only=True)
+class DissectorWriters:
+    """Record and error writers of a running dissector"""
+
+    record_queue: Any
+    post_dissection_queue: DissectionContextQueue
+    record_writer_thread: Thread
+    error_writer_thread: Thread
+    failed: Event
+
+
+def _start_writers(
+    dissector_ctx: DissectorContext, dissector: Dissector
+) -> DissectorWriters:
+    post_dissection_queue = Queue()
+    if dissector_ctx.process_pool is None:
+        record_queue = Queue(maxsize=dissector_ctx.queue_size)
+    else:
+        # surgeon processes send batches of records through a managed queue
+        record_queue = dissector_ctx.manager.Queue(
+            maxsize=dissector_ctx.queue_size
+        )
+    dissector_ctx.outputs.add(dissector_ctx.output_key(dissector))
+    failed = Event()
+    writers = DissectorWriters(
+        record_queue=record_queue,
+        post_dissection_queue=post_dissection_queue,
+        record_writer_thread=Thread(
+            target=_write_records_routine,
+            args=(record_queue, dissector_ctx, dissector, failed),
+        ),
+        error_writer_thread=Thread(
+            target=_write_errors_routine,
+            args=(post_dissection_queue, dissector_ctx, dissector, failed),
+        ),
+        failed=failed,
     )
+    writers.error_writer_thread.start()
+    writers.record_writer_thread.start()
+    return writers
 
 
-def _run_dissector(
-    dissector: Dissector,
+def _stop_writers(writers: DissectorWriters):
+    writers.record_queue.put(None)
+    writers.record_writer_thread.join()
+    writers.post_dissection_queue.put(None)
+    writers.error_writer_thread.join()
+
+
+def _start_family_writers(
+    dissector_ctx: DissectorContext, dissectors: DissectorList
+) -> dict[str, DissectorWriters]:
+    writers = {}
+    for dissector in dissectors:
+        dissector_ctx.open_shard(dissector)
+        writers[dissector.slug] = _start_writers(dissector_ctx, dissector)
+    return writers
+
+
+def _stop_family_writers(
+    dissector_ctx: DissectorContext,
+    dissectors: DissectorList,
+    writers: dict[str, DissectorWriters],
+):
+    for dissector in dissectors:
+        dissector_writers = writers[dissector.slug]
+        _stop_writers(dissector_writers)
+        # output of a failed writer is incomplete
+        if not dissector_writers.failed.is_set():
+            dissector_ctx.commit(dissector)
+
+
+@dataclass(kw_only=True)
+class SurgeonTask:
+    """Dissection of a single file by a single dissector"""
+
+    ctx: DissectionContext
+    dissector: Dissector
+    writers: DissectorWriters
+
+
+SurgeonTaskList = list[SurgeonTask]
+
+
+def _surgeon_tasks(
+    dissector_ctx: DissectorContext,
+    dissectors: DissectorList,
+    target: Path,
+    writers: dict[str, DissectorWriters],
+) -> SurgeonTaskList:
+    family = [dissector.slug for dissector in dissectors]
+    return [
+        SurgeonTask(
+            ctx=_dissection_context(dissector_ctx, dissector, target, family),
+            dissector=dissector,
+            writers=writers[dissector.slug],
+        )
+        for dissector in dissectors
+    ]
+
+
+def _selection_routine(
+    processing_queue: Queue,
     dissector_ctx: DissectorContext,
+    targets: FamilyTargets,
+    writers: dict[str, DissectorWriters],
     perfmeter: PerformanceMeter,
-) -> tuple[Path, Path]:
-    record_queue = Queue(maxsize=50)
-    pre_dissection_queue = Queue(maxsize=dissector_ctx.parallel_surgeons)
-    post_dissection_queue = Queue()
-    error_writer_thread = Thread(
-        target=_write_errors_routine,
-        args=(post_dissection_queue, dissector_ctx, dissector),
-    )
-    record_writer_thread = Thread(
-        target=_write_records_routine,
-        args=(record_queue, dissector_ctx, dissector),
+):
+    for target, dissectors in targets:
+        processing_queue.put(
+            _surgeon_tasks(dissector_ctx, dissectors, target, writers)
+        )
+        perfmeter.tick()
+    processing_queue.put(None)
+
+
+def _dissect(dissector_ctx: DissectorContext, tasks: SurgeonTaskList):
+    """Dissect a file with one or more dissectors of a family, in order
+
+    Dissectors which writer failed are skipped and removed from the family
+    of the others so that no record is prepared for them.
+    """
+    tasks = [task for task in tasks if not task.writers.failed.is_set()]
+    if not tasks:
+        return
+    family = [task.dissector.slug for task in tasks]
+    for task in tasks:
+        task.ctx.family = family
+    if dissector_ctx.process_pool is None:
+        for task in tasks:
+            failed = task.writers.failed
+            with dissector_ctx.batcher(task.writers.record_queue) as batcher:
+                for record in task.dissector.dissect(task.ctx):
+                    if batcher.add(record) and failed.is_set():
+                        task.ctx.register_error("writer failed")
+                        break
+            dissector_ctx.record(task.dissector, task.ctx, batcher.records)
+            task.writers.post_dissection_queue.put(task.ctx)
+        return
+    # tasks are submitted together for the file to be parsed once per family
+    future = dissector_ctx.process_pool.submit(
+        _surgeon_process_routine,
+        [
+            (task.dissector.slug, task.ctx, task.writers.record_queue)
+            for task in tasks
+        ],
+        dissector_ctx.batch_size,
+        dissector_ctx.flush_interval,
     )
+    try:
+        results = future.result()
+    except:
+        _LOGGER.exception(
+            "surgeon process failed: %s",
+            _family_slugs([task.dissector for task in tasks]),
+        )
+        for task in tasks:
+            task.ctx.register_error(
+                "surgeon process failed, please create an issue!"
+            )
+            task.writers.post_dissection_queue.put(task.ctx)
+        return
+    for task, (ctx, records) in zip(tasks, results):
+        if task.writers.failed.is_set():
+            ctx.register_error("writer failed")
+        dissector_ctx.record(task.dissector, ctx, records)
+        task.writers.post_dissection_queue.put(ctx)
+
+
+def _dissection_routine(
+    pre_dissection_queue: Queue[SurgeonTaskList | None],
+    dissector_ctx: DissectorContext,
+):
+    while True:
+        tasks = pre_dissection_queue.get()
+        if not tasks:
+            break
+        _dissect(dissector_ctx, tasks)
+
+
+def _run_family(
+    family: DissectorList,
+    dissector_ctx: DissectorContext,
+    perfmeter: PerformanceMeter,
+):
+    targets = _family_targets(dissector_ctx, family)
+    dissectors = _started_dissectors(dissector_ctx, family, targets)
+    if not dissectors:
+        return
+    pre_dissection_queue = Queue(maxsize=dissector_ctx.parallel_surgeons)
+    writers = _start_family_writers(dissector_ctx, dissectors)
     surgeon_threads = [
         Thread(
             target=_dissection_routine,
-            args=(
-                record_queue,
-                pre_dissection_queue,
-                post_dissection_queue,
-                dissector,
-            ),
+            args=(pre_dissection_queue, dissector_ctx),
         )
         for i in range(dissector_ctx.parallel_surgeons)
     ]
@@ -249,17 +782,16 @@ def _run_dissector(
         args=(
             pre_dissection_queue,
             dissector_ctx,
-            dissector,
+            targets,
+            writers,
             perfmeter,
         ),
     )
     _LOGGER.info(
         "dissector=%s, state=starting, surgeons=%d",
-        dissector.slug,
+        _family_slugs(dissectors),
         len(surgeon_threads),
     )
-    error_writer_thread.start()
-    record_writer_thread.start()
     for surgeon_thread in surgeon_threads:
         surgeon_thread.start()
     selector_thread.start()
@@ -268,70 +800,390 @@ def _run_dissector(
         pre_dissection_queue.put(None)
     for surgeon_thread in surgeon_threads:
         surgeon_thread.join()
-    record_queue.put(None)
-    record_writer_thread.join()
-    post_dissection_queue.put(None)
-    error_writer_thread.join()
+    _stop_family_writers(dissector_ctx, dissectors, writers)
 
 
 def _dissector_routine(
-    dissector_queue: Queue[Dissector],
+    family_queue: Queue[DissectorList | None],
     dissector_ctx: DissectorContext,
 ):
     while True:
-        dissector = dissector_queue.get()
-        if not dissector:
+        family = family_queue.get()
+        if not family:
             break
         perfmeter = PerformanceMeter()
         with perfmeter:
-            _LOGGER.info("dissector=%s, state=init", dissector.slug)
-            dissector.set_state(dissector_ctx.target)
-            _run_dissector(dissector, dissector_ctx, perfmeter)
+            for dissector in family:
+                _LOGGER.info("dissector=%s, state=init", dissector.slug)
+                dissector.set_state(dissector_ctx.target)
+            _run_family(family, dissector_ctx, perfmeter)
         _LOGGER.info(
             "dissector=%s, state=stopping, files=%s, elapsed=%s",
-            dissector.slug,
+            _family_slugs(family),
             perfmeter.count,
             perfmeter.elapsed,
         )
 
 
+def _run_dissectors(
+    dissectors: DissectorList,
+    dissector_ctx: DissectorContext,
+    parallel_dissectors: int,
+):
+    family_queue = Queue(maxsize=parallel_dissectors)
+    dissector_threads = [
+        Thread(
+            target=_dissector_routine,
+            args=(family_queue, dissector_ctx),
+        )
+        for i in range(parallel_dissectors)
+    ]
+    for dissector_thread in dissector_threads:
+        dissector_thread.start()
+    for family in _families(dissectors):
+        family_queue.put(family)
+    for _ in dissector_threads:
+        family_queue.put(None)
+    for dissector_thread in dissector_threads:
+        dissector_thread.join()
+
+
+@dataclass(kw_only=True)
+class WorkItem:
+    """Dissection of a single file by dissectors of a family"""
+
+    size: int
+    target: Path
+    dissectors: DissectorList
+    writers: dict[str, DissectorWriters]
+
+
+WorkItemIterator = Iterator[WorkItem]
+
+
+class WorkScheduler:
+    """Hand out work items largest first while capping heavy items
+
+    Items are produced by a feeder thread into a bounded queue and moved
+    into a look-ahead window, largest first ordering holds within the
+    window. Workers never wait for a heavy slot while light items remain,
+    they take the largest light item instead.
+    """
+
+    def __init__(
+        self,
+        items: WorkItemIterator,
+        heavy_size: int,
+        heavy_slots: int,
+        window: int = _SCHEDULER_WINDOW,
+    ):
+        self._window = window
+        self._feed = Queue(maxsize=window)
+        self._exhausted = False
+        self._order = count()
+        self._lock = Lock()
+        self._heavy_size = heavy_size
+        self._heavy_slots = Semaphore(heavy_slots)
+        self._heavy = []
+        self._light = []
+        self.item_count = 0
+        # selection, sniffing and fingerprinting run outside of the lock
+        Thread(
+            target=self._feed_routine, args=(items,), daemon=True
+        ).start()
+
+    def _feed_routine(self, items: WorkItemIterator):
+        try:
+            for item in items:
+                self._feed.put(item)
+        except:
+            _LOGGER.exception("work item production failed!")
+        finally:
+            self._feed.put(None)
+
+    def is_heavy(self, item: WorkItem) -> bool:
+        """Determine if item is a heavy item"""
+        return item.size >= self._heavy_size
+
+    def _push(self, item: WorkItem | None):
+        """Push fed item to the window, lock is held"""
+        if item is None:
+            self._exhausted = True
+            # wake up the next worker waiting for the feeder
+            self._feed.put_nowait(None)
+            return
+        self.item_count += 1
+        heap = self._heavy if self.is_heavy(item) else self._light
+        heappush(heap, (-item.size, next(self._order), item))
+
+    def _refill(self):
+        """Move fed items to the window without waiting, lock is held"""
+        while (
+            not self._exhausted
+            and len(self._heavy) < self._window
+            and len(self._light) < self._window
+        ):
+            try:
+                item = self._feed.get_nowait()
+            except Empty:
+                break
+            self._push(item)
+
+    def next_item(self) -> WorkItem | None:
+        """Next item to process or None when there is nothing left"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._heavy and self._heavy_slots.acquire(blocking=False):
+                    return heappop(self._heavy)[-1]
+                if self._light:
+                    return heappop(self._light)[-1]
+                if not self._heavy and self._exhausted:
+                    return None
+                wait_for_feeder = not self._heavy
+            if wait_for_feeder:
+                item = self._feed.get()
+                with self._lock:
+                    self._push(item)
+                continue
+            # only heavy items remain, wait for a heavy slot
+            self._heavy_slots.acquire()
+            with self._lock:
+                if self._heavy:
+                    return heappop(self._heavy)[-1]
+            self._heavy_slots.release()
+
+    def release(self, item: WorkItem):
+        """Release resources held by item"""
+        if self.is_heavy(item):
+            self._heavy_slots.release()
+
+
+class LazyWriters(dict):
+    """Writers of dissectors started when a dissector is looked up for the
+    first time, that is when it receives its first work item
+    """
+
+    def __init__(
+        self, dissector_ctx: DissectorContext, dissectors: DissectorList
+    ):
+        super().__init__()
+        self._dissector_ctx = dissector_ctx
+        self._dissectors = {
+            dissector.slug: dissector for dissector in dissectors
+        }
+        self._lock = Lock()
+
+    def __missing__(self, slug: str) -> DissectorWriters:
+        with self._lock:
+            if slug not in self:
+                dissector = self._dissectors[slug]
+                self._dissector_ctx.open_shard(dissector)
+                self[slug] = _start_writers(self._dissector_ctx, dissector)
+            return super().__getitem__(slug)
+
+    def started(self) -> DissectorList:
+        """Dissectors which writers were started"""
+        return [self._dissectors[slug] for slug in list(self)]
+
+
+def _file_size(filepath: Path) -> int:
+    try:
+        return filepath.stat().st_size
+    except OSError:
+        return 0
+
+
+def _work_items(
+    dissector_ctx: DissectorContext,
+    dissectors: DissectorList,
+    writers: LazyWriters,
+) -> WorkItemIterator:
+    """Stream work items family by family from target selection"""
+    for family in _families(dissectors):
+        for dissector in family:
+            _LOGGER.info("dissector=%s, state=init", dissector.slug)
+            dissector.set_state(dissector_ctx.target)
+        files = 0
+        for target, family_dissectors in _family_targets(
+            dissector_ctx, family
+        ):
+            files += 1
+            yield WorkItem(
+                size=_file_size(target),
+                target=target,
+                dissectors=family_dissectors,
+                writers=writers,
+            )
+        _LOGGER.info(
+            "dissector=%s, state=selected, files=%d",
+            _family_slugs(family),
+            files,
+        )
+
+
+def _worker_routine(
+    scheduler: WorkScheduler, dissector_ctx: DissectorContext
+):
+    while True:
+        item = scheduler.next_item()
+        if item is None:
+            break
+        try:
+            # contexts are built when the item is handed out
+            tasks = _surgeon_tasks(
+                dissector_ctx, item.dissectors, item.target, item.writers
+            )
+            _dissect(dissector_ctx, tasks)
+        finally:
+            scheduler.release(item)
+
+
+def _run_global_scheduler(
+    dissectors: DissectorList,
+    dissector_ctx: DissectorContext,
+    workers: int,
+    heavy_size: int,
+    heavy_slots: int,
+):
+    writers = LazyWriters(dissector_ctx, dissectors)
+    scheduler = WorkScheduler(
+        _work_items(dissector_ctx, dissectors, writers),
+        heavy_size,
+        heavy_slots,
+    )
+    worker_threads = [
+        Thread(target=_worker_routine, args=(scheduler, dissector_ctx))
+        for i in range(workers)
+    ]
+    _LOGGER.info(
+        "scheduler=global, state=starting, workers=%d", len(worker_threads)
+    )
+    for worker_thread in worker_threads:
+        worker_thread.start()
+    for worker_thread in worker_threads:
+        worker_thread.join()
+    _stop_family_writers(dissector_ctx, writers.started(), writers)
+    _LOGGER.info(
+        "scheduler=global, state=stopping, items=%d", scheduler.item_count
+    )
+
+
+@contextmanager
+def _surgeon_processes(
+    dissector_ctx: DissectorContext,
+    max_workers: int,
+    plugin_directory: Path | None,
+):
+    # forkserver avoids forking a parent process running many threads
+    mp_context = get_context('forkserver')
+    with (
+        mp_context.Manager() as manager,
+        ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_surgeon_process,
+            initargs=(plugin_directory,),
+        ) as process_pool,
+    ):
+        dissector_ctx.manager = manager
+        dissector_ctx.process_pool = process_pool
+        _LOGGER.info("surgeon processes: %d", max_workers)
+        try:
+            yield
+        finally:
+            dissector_ctx.manager = None
+            dissector_ctx.process_pool = None
+
+
 def _dissect_cmd(args):
-    dissectors = get_dissectors()
+    entries = get_dissector_entries()
     parallel_surgeons = max(1, args.parallel_surgeons)
     parallel_dissectors = max(1, args.parallel_dissectors)
     if args.filter:
-        dissectors = _select(args.filter, dissectors)
-    if not dissectors:
+        entries = _select(args.filter, entries)
+        # selected dissectors which cannot run are reported to the user
+        for entry in _select(args.filter, get_unavailable_dissector_entries()):
+            _LOGGER.warning(
+                "dissector %s requires missing modules: %s",
+                entry.slug,
+                ', '.join(entry.requires),
+            )
+    if not entries:
         _LOGGER.warning("dissector selection is empty!")
-        return
+        return 0
+    # only selected dissector modules are imported
+    dissectors = [get_dissector(entry.slug) for entry in entries]
     _LOGGER.info("selected %d dissectors.", len(dissectors))
+    file_format = FileFormat(args.file_format)
+    if file_format in _COLUMNAR_FILE_FORMATS and not PYARROW_AVAILABLE:
+        _LOGGER.error("%s file format requires pyarrow", file_format.value)
+        return 1
+    codec = Codec(args.compression)
+    if file_format not in _COLUMNAR_FILE_FORMATS:
+        if not codec_available(codec):
+            _LOGGER.error(
+                "%s compression codec is not available", codec.value
+            )
+            return 1
+        level_range = codec_level_range(codec)
+        if (
+            args.compression_level is not None
+            and level_range is not None
+            and not level_range[0] <= args.compression_level <= level_range[1]
+        ):
+            _LOGGER.error(
+                "%s compression level shall be in range [%d, %d]",
+                codec.value,
+                *level_range,
+            )
+            return 1
     args.output_directory.mkdir(parents=True, exist_ok=True)
+    if args.target.is_dir() and not args.no_index:
+        index_directory(args.target)
+    manifest = None
+    if args.incremental:
+        manifest = Manifest.from_filepath(
+            args.output_directory / MANIFEST_FILENAME
+        )
     dissector_ctx = DissectorContext(
         target=args.target,
         hostname=args.hostname,
-        file_format=FileFormat(args.file_format),
+        file_format=file_format,
         prefix=args.prefix,
         output_directory=args.output_directory,
         parallel_surgeons=parallel_surgeons,
+        row_group_size=max(1, args.row_group_size),
+        columnar_compression=args.columnar_compression,
+        compression=Compression(
+            codec=codec,
+            level=args.compression_level,
+            threads=max(1, args.compression_threads),
+        ),
+        batch_size=max(1, args.batch_size),
+        queue_depth=max(1, args.queue_depth),
+        flush_interval=args.flush_interval,
+        manifest=manifest,
     )
-    dissector_queue = Queue(maxsize=parallel_dissectors)
-    dissector_threads = [
-        Thread(
-            target=_dissector_routine,
-            args=(dissector_queue, dissector_ctx),
-        )
-        for i in range(parallel_dissectors)
-    ]
+    workers = parallel_surgeons * parallel_dissectors
     perfmeter = PerformanceMeter()
-    with perfmeter:
-        for dissector_thread in dissector_threads:
-            dissector_thread.start()
-        for dissector in dissectors:
-            dissector_queue.put(dissector)
-        for _ in dissector_threads:
-            dissector_queue.put(None)
-        for dissector_thread in dissector_threads:
-            dissector_thread.join()
+    with perfmeter, ExitStack() as stack:
+        if Executor(args.executor) == Executor.PROCESS:
+            stack.enter_context(
+                _surgeon_processes(
+                    dissector_ctx, workers, args.plugin_directory
+                )
+            )
+        if Scheduler(args.scheduler) == Scheduler.GLOBAL:
+            _run_global_scheduler(
+                dissectors,
+                dissector_ctx,
+                workers,
+                max(0, args.heavy_size) * 1024 * 1024,
+                max(1, args.parallel_heavy),
+            )
+        else:
+            _run_dissectors(dissectors, dissector_ctx, parallel_dissectors)
     _LOGGER.info(
         "dissectors=%d, elapsed=%s", len(dissectors), perfmeter.elapsed
     )
@@ -349,9 +1201,16 @@ def _dissect_cmd(args):
                 str(dissector_ctx.err_filepath(dissector).resolve()),
             ]
             for dissector in dissectors
+            if dissector_ctx.has_output(dissector)
         ],
         show_header=False,
     )
+    if dissector_ctx.writer_failures:
+        _LOGGER.error(
+            "writers failed: %s", ', '.join(dissector_ctx.writer_failures)
+        )
+        return 1
+    return 0
 
 
 def setup_command(cmd):
@@ -364,6 +1223,56 @@ def setup_command(cmd):
         default=FileFormat.CSV.value,
         help="Output file format",
     )
+    dissect.add_argument(
+        '--row-group-size',
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Rows per parquet row group or arrow record batch",
+    )
+    dissect.add_argument(
+        '--columnar-compression',
+        choices=_COLUMNAR_COMPRESSIONS,
+        default=DEFAULT_COMPRESSION,
+        help="Compression codec for parquet and arrow file formats",
+    )
+    dissect.add_argument(
+        '--compression',
+        choices=[codec.value for codec in Codec],
+        default=Codec.GZIP.value,
+        help="Compression codec for csv and jsonl file formats",
+    )
+    dissect.add_argument(
+        '--compression-level',
+        type=int,
+        help=(
+            "Compression level, codec default if not given (gzip: 0-9, "
+            "zstd: 1-22, lz4: 0-16)"
+        ),
+    )
+    dissect.add_argument(
+        '--compression-threads',
+        type=int,
+        default=1,
+        help="Threads compressing blocks of each csv or jsonl file",
+    )
+    dissect.add_argument(
+        '--batch-size',
+        type=int,
+        default=_DEFAULT_BATCH_SIZE,
+        help="Records per batch sent from surgeons to writers",
+    )
+    dissect.add_argument(
+        '--queue-depth',
+        type=int,
+        default=_DEFAULT_QUEUE_DEPTH,
+        help="Records buffered between surgeons and writer of a dissector",
+    )
+    dissect.add_argument(
+        '--flush-interval',
+        type=float,
+        default=_DEFAULT_FLUSH_INTERVAL,
+        help="Seconds after which an incomplete batch is sent to writer",
+    )
     dissect.add_argument(
         '--prefix',
         action='store_true',
@@ -388,6 +1297,48 @@ def setup_command(cmd):
         default=1,
         help="Define how many dissectors are running in parallel",
     )
+    dissect.add_argument(
+        '--executor',
+        choices=[executor.value for executor in Executor],
+        default=Executor.THREAD.value,
+        help="Run surgeons in threads or in worker processes",
+    )
+    dissect.add_argument(
+        '--scheduler',
+        choices=[scheduler.value for scheduler in Scheduler],
+        default=Scheduler.DISSECTOR.value,
+        help=(
+            "Schedule files dissector by dissector or share parallel "
+            "surgeons times parallel dissectors workers across all files, "
+            "largest files first within a look-ahead window"
+        ),
+    )
+    dissect.add_argument(
+        '--heavy-size',
+        type=int,
+        default=1024,
+        help="Size in MiB from which a file is heavy (global scheduler)",
+    )
+    dissect.add_argument(
+        '--parallel-heavy',
+        type=int,
+        default=1,
+        help="Define how many heavy files are dissected in parallel",
+    )
+    dissect.add_argument(
+        '--no-index',
+        action='store_true',
+        help="Walk target directory once per dissector instead of indexing it",
+    )
+    dissect.add_argument(
+        '--incremental',
+        '--resume',
+        action='store_true',
+        help="Only dissect files which are new or modified since last run "
+        "according to output directory manifest, output is written to "
+        "a new shard, rows of modified files in previous shards are listed "
+        "as superseded in manifest and shall be dropped by readers",
+    )
     dissect.add_argument(
         'target', type=Path, help="Filepath or directory to dissect"
     )
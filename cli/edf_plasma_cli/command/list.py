@@ -1,6 +1,6 @@
 """list command implementation"""
 
-from edf_plasma_core.dissector import get_dissectors
+from edf_plasma_core.dissector import get_dissector_entries
 
 from .abc import display_table
 
@@ -11,11 +11,11 @@ def _list_cmd(args):
         ['slug', 'tags', 'description'],
         (
             [
-                dissector.slug,
-                ','.join(sorted(tag.value for tag in dissector.tags)),
-                dissector.description,
+                entry.slug,
+                ','.join(sorted(tag.value for tag in entry.tags)),
+                entry.description,
             ]
-            for dissector in get_dissectors()
+            for entry in get_dissector_entries()
         ),
         show_header=False,
     )
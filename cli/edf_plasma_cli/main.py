@@ -6,7 +6,7 @@ from sys import exit as sys_exit
 
 # load dissectors
 import edf_plasma_dissectors as _
-from edf_plasma_core.helper.importing import import_from_file
+from edf_plasma_core.helper.importing import import_from_directory
 from edf_plasma_core.helper.logging import get_logger
 
 from .__version__ import version
@@ -39,24 +39,14 @@ def _parse_args():
     return args
 
 
-def _import_from_directory(plugin_directory: Path):
-    if not plugin_directory:
-        return
-    if not plugin_directory.is_dir():
-        return
-    for plugin in plugin_directory.glob('*.py'):
-        if not plugin.is_file():
-            continue
-        import_from_file(plugin)
-
-
 def app():
     """Application entrypoint"""
     args = _parse_args()
-    _import_from_directory(args.plugin_directory)
+    import_from_directory(args.plugin_directory)
     exit_code = 0
     try:
-        args.func(args)
+        # commands return a non-zero exit code on failure
+        exit_code = args.func(args) or 0
     except:
         _LOGGER.exception("exception caught in main handler!")
         exit_code = 1
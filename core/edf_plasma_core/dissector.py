@@ -2,8 +2,11 @@
 
 from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
+from importlib import import_module
+from importlib.util import find_spec
 from pathlib import Path
 from queue import Queue
+from threading import RLock
 
 from .concept import Tag
 from .helper.datetime import datetime, to_iso_fmt, utc_now
@@ -23,6 +26,9 @@ from .helper.typing import (
 
 _LOGGER = get_logger('core.dissector')
 _DISSECTORS = {}
+_ENTRIES = {}
+_UNAVAILABLE_ENTRIES = {}
+_ENTRIES_LOCK = RLock()
 
 
 @dataclass(kw_only=True)
@@ -35,7 +41,11 @@ class DissectionError:
 
 @dataclass(kw_only=True)
 class DissectionContext:
-    """Dissection context"""
+    """Dissection context
+
+    Family holds slugs of dissectors of the same family dissecting the same
+    file, in the order they dissect it.
+    """
 
     dissector: str
     hostname: str
@@ -43,6 +53,7 @@ class DissectionContext:
     filepath: Path
     errors: list[DissectionError] = field(default_factory=list)
     state: dict
+    family: StringList = field(default_factory=list)
 
     def register_error(self, reason: str):
         """Register and log an error"""
@@ -66,7 +77,11 @@ DissectionContextQueue = Queue[DissectionContext | None]
 
 @dataclass(kw_only=True)
 class Dissector:
-    """Dissector"""
+    """Dissector
+
+    Dissectors of the same family share their selector and are dissected
+    file by file together, they can share the result of parsing a file.
+    """
 
     slug: str
     tags: set[Tag]
@@ -76,6 +91,7 @@ class Dissector:
     select_impl: Callable[[Path], PathIterator]
     dissect_impl: Callable[[DissectionContext], RecordIterator]
     set_state_impl: Callable[[Path], dict] | None = None
+    family: str | None = None
 
     @property
     def table_schema(self) -> Table:
@@ -129,6 +145,9 @@ class Dissector:
             yield from self._dissect(ctx)
         except PermissionError:
             ctx.register_error(f"permission error: {ctx.filepath}")
+        except GeneratorExit:
+            # consumer stopped iterating early
+            raise
         except:
             _LOGGER.exception("dissector exception: %s", self.slug)
             ctx.register_error("unhandled exception, please create an issue!")
@@ -144,6 +163,44 @@ DissectorMapping = dict[str, Dissector]
 DissectorIterator = Iterator[Dissector]
 
 
+@dataclass(kw_only=True)
+class DissectorEntry:
+    """Dissector metadata registered without importing its module
+
+    Module is imported when dissector is retrieved for the first time,
+    it shall register a dissector with the same slug.
+    """
+
+    slug: str
+    module: str
+    tags: set[Tag]
+    columns: ColumnList
+    description: str
+    requires: StringList = field(default_factory=list)
+
+    @property
+    def available(self) -> bool:
+        """Determine if modules required by dissector can be imported"""
+        return all(find_spec(name) is not None for name in self.requires)
+
+    @classmethod
+    def from_dissector(
+        cls, dissector: Dissector, requires: StringList | None = None
+    ):
+        """Build entry describing a registered dissector"""
+        return cls(
+            slug=dissector.slug,
+            module=dissector.dissect_impl.__module__,
+            tags=dissector.tags,
+            columns=dissector.columns,
+            description=dissector.description,
+            requires=requires or [],
+        )
+
+
+DissectorEntryList = list[DissectorEntry]
+
+
 def register_dissector(dissector: Dissector):
     """Register dissector"""
     if dissector.slug in _DISSECTORS:
@@ -153,21 +210,84 @@ def register_dissector(dissector: Dissector):
     _DISSECTORS[dissector.slug] = dissector
 
 
+def register_dissector_entry(entry: DissectorEntry):
+    """Register dissector entry, skipped if required modules are missing"""
+    if entry.slug in _DISSECTORS or entry.slug in _ENTRIES:
+        _LOGGER.warning("skipped duplicate dissector: %s", entry.slug)
+        return
+    if not entry.available:
+        _LOGGER.debug(
+            "dissector %s requires missing modules: %s",
+            entry.slug,
+            ', '.join(entry.requires),
+        )
+        _UNAVAILABLE_ENTRIES[entry.slug] = entry
+        return
+    _LOGGER.debug("dissector entry registered: %s", entry.slug)
+    _ENTRIES[entry.slug] = entry
+
+
+def _load_entry(slug: str) -> Dissector | None:
+    with _ENTRIES_LOCK:
+        dissector = _DISSECTORS.get(slug)
+        if dissector is not None:
+            return dissector
+        entry = _ENTRIES.get(slug)
+        if entry is None:
+            return None
+        import_module(entry.module)
+        dissector = _DISSECTORS.get(slug)
+        if dissector is None:
+            _LOGGER.error(
+                "module %s did not register dissector %s", entry.module, slug
+            )
+        return dissector
+
+
 def get_dissector(slug: str) -> Dissector:
     """Retrieve dissector matching given slug"""
-    return _DISSECTORS[slug]
+    dissector = _load_entry(slug)
+    if dissector is None:
+        raise KeyError(slug)
+    return dissector
 
 
 def get_dissector_or_none(slug: str) -> Dissector | None:
     """Retrieve dissector matching given slug"""
-    return _DISSECTORS.get(slug)
+    return _load_entry(slug)
 
 
 def get_dissectors() -> DissectorList:
-    """Iterate dissectors"""
+    """Iterate dissectors, importing all registered entries"""
+    for slug in list(_ENTRIES):
+        _load_entry(slug)
     return list(_DISSECTORS.values())
 
 
+def get_registered_dissectors() -> DissectorList:
+    """List dissectors registered so far without importing entries"""
+    return list(_DISSECTORS.values())
+
+
+def get_dissector_entries() -> DissectorEntryList:
+    """List dissector entries without importing dissector modules"""
+    entries = []
+    for slug, entry in list(_ENTRIES.items()):
+        dissector = _DISSECTORS.get(slug)
+        if dissector is not None:
+            entry = DissectorEntry.from_dissector(dissector, entry.requires)
+        entries.append(entry)
+    for slug, dissector in list(_DISSECTORS.items()):
+        if slug not in _ENTRIES:
+            entries.append(DissectorEntry.from_dissector(dissector))
+    return entries
+
+
+def get_unavailable_dissector_entries() -> DissectorEntryList:
+    """List dissector entries skipped because required modules are missing"""
+    return list(_UNAVAILABLE_ENTRIES.values())
+
+
 def get_dissector_slugs() -> StringList:
     """List dissector slugs"""
-    return list(_DISSECTORS.keys())
+    return [entry.slug for entry in get_dissector_entries()]
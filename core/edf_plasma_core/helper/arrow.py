@@ -0,0 +1,198 @@
+"""Arrow and Parquet operations helper"""
+
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+
+from .importing import lazy_import, load_lazy_modules
+from .logging import get_logger
+from .table import DataType, Table
+from .typing import Record, RecordIterator
+
+lazy_pa = lazy_import('pyarrow')
+lazy_ipc = lazy_import('pyarrow.ipc')
+lazy_pq = lazy_import('pyarrow.parquet')
+PYARROW_AVAILABLE = lazy_pa is not None
+
+_LOGGER = get_logger('core.helper.arrow')
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+_UINT64_MAX = 2**64 - 1
+_TRUE_STRINGS = {'true', '1', 'yes'}
+_FALSE_STRINGS = {'false', '0', 'no'}
+
+DEFAULT_BATCH_SIZE = 128 * 1024
+DEFAULT_COMPRESSION = 'zstd'
+
+
+def _to_str(value) -> str | None:
+    if value is None:
+        return None
+    return str(value)
+
+
+def _parse_int(value) -> int | None:
+    if value is None or value == '':
+        return None
+    if isinstance(value, (bool, float)):
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            # hexadecimal, octal or binary notation
+            return int(value, 0)
+    return value
+
+
+def _to_int(value) -> int | None:
+    value = _parse_int(value)
+    if value is not None and not _INT64_MIN <= value <= _INT64_MAX:
+        raise OverflowError("value does not fit in int64")
+    return value
+
+
+def _to_uint(value) -> int | None:
+    value = _parse_int(value)
+    if value is not None and not 0 <= value <= _UINT64_MAX:
+        raise OverflowError("value does not fit in uint64")
+    return value
+
+
+def _to_bool(value) -> bool | None:
+    if value is None or value == '':
+        return None
+    if isinstance(value, (bool, int)):
+        return bool(value)
+    value = str(value).lower()
+    if value in _TRUE_STRINGS:
+        return True
+    if value in _FALSE_STRINGS:
+        return False
+    raise ValueError("value is not a boolean")
+
+
+def _to_float(value) -> float | None:
+    if value is None or value == '':
+        return None
+    return float(value)
+
+
+_CONVERTER_STRATEGY = {
+    DataType.STR: _to_str,
+    DataType.INT: _to_int,
+    DataType.UINT: _to_uint,
+    DataType.BOOL: _to_bool,
+    DataType.INET: _to_str,
+    DataType.FLOAT: _to_float,
+}
+
+
+def _arrow_type(data_type: DataType):
+    return {
+        DataType.STR: lazy_pa.string,
+        DataType.INT: lazy_pa.int64,
+        DataType.UINT: lazy_pa.uint64,
+        DataType.BOOL: lazy_pa.bool_,
+        DataType.INET: lazy_pa.string,
+        DataType.FLOAT: lazy_pa.float64,
+    }[data_type]()
+
+
+def arrow_schema(table: Table) -> 'pyarrow.Schema':
+    """Build arrow schema from table schema
+
+    INT columns are stored as int64 and UINT columns, holding unsigned 64-bit
+    values such as addresses, offsets or inodes, as uint64.
+    """
+    return lazy_pa.schema(
+        [
+            lazy_pa.field(column.name, _arrow_type(column.data_type))
+            for column in table.columns
+        ]
+    )
+
+
+def _build_batch(
+    schema: 'pyarrow.Schema',
+    table: Table,
+    rows: list[Record],
+    invalid: Counter,
+) -> 'pyarrow.RecordBatch':
+    arrays = []
+    for column, field in zip(table.columns, schema):
+        convert = _CONVERTER_STRATEGY[column.data_type]
+        values = []
+        for row in rows:
+            try:
+                values.append(convert(row.get(column.name)))
+            except (TypeError, ValueError, OverflowError):
+                invalid[column.name] += 1
+                values.append(None)
+        arrays.append(lazy_pa.array(values, type=field.type))
+    return lazy_pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def iter_record_batches(
+    schema: 'pyarrow.Schema',
+    table: Table,
+    records: RecordIterator,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator['pyarrow.RecordBatch']:
+    """Convert records to typed record batches of at most batch_size rows
+
+    Values which cannot be converted to their column data type are stored
+    as null and reported once per column when records are exhausted.
+    """
+    invalid = Counter()
+    rows = []
+    for record in records:
+        rows.append(record)
+        if len(rows) >= batch_size:
+            yield _build_batch(schema, table, rows, invalid)
+            rows = []
+    if rows:
+        yield _build_batch(schema, table, rows, invalid)
+    for name, count in invalid.items():
+        _LOGGER.warning(
+            "%d values of column '%s' could not be converted", count, name
+        )
+
+
+def _compression(compression: str) -> str | None:
+    return None if compression == 'none' else compression
+
+
+def write_parquet(
+    filepath: Path,
+    table: Table,
+    records: RecordIterator,
+    row_group_size: int = DEFAULT_BATCH_SIZE,
+    compression: str = DEFAULT_COMPRESSION,
+):
+    """Write records to Parquet file, one row group per batch"""
+    load_lazy_modules(lazy_pa, lazy_ipc, lazy_pq)
+    schema = arrow_schema(table)
+    with lazy_pq.ParquetWriter(
+        str(filepath), schema, compression=_compression(compression)
+    ) as writer:
+        for batch in iter_record_batches(
+            schema, table, records, row_group_size
+        ):
+            writer.write_batch(batch, row_group_size=row_group_size)
+
+
+def write_arrow(
+    filepath: Path,
+    table: Table,
+    records: RecordIterator,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression: str = DEFAULT_COMPRESSION,
+):
+    """Write records to Arrow IPC file"""
+    load_lazy_modules(lazy_pa, lazy_ipc, lazy_pq)
+    schema = arrow_schema(table)
+    options = lazy_ipc.IpcWriteOptions(compression=_compression(compression))
+    with lazy_ipc.new_file(str(filepath), schema, options=options) as writer:
+        for batch in iter_record_batches(schema, table, records, batch_size):
+            writer.write_batch(batch)
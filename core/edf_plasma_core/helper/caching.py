@@ -0,0 +1,39 @@
+"""Caching helper"""
+
+from collections import OrderedDict
+from threading import Lock
+
+
+class LRUCache:
+    """Thread-safe bounded mapping evicting least recently used items"""
+
+    def __init__(self, maxsize: int):
+        self._lock = Lock()
+        self._items = OrderedDict()
+        self._maxsize = max(0, maxsize)
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        """Retrieve item and mark it as recently used"""
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """Store item and evict least recently used items if needed"""
+        if not self._maxsize:
+            return
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        """Remove all items"""
+        with self._lock:
+            self._items.clear()
@@ -0,0 +1,208 @@
+"""Compression helper"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from gzip import compress as gzip_compress
+from gzip import open as gzip_open
+from io import BufferedIOBase, TextIOWrapper
+from pathlib import Path
+
+from .importing import lazy_import, load_lazy_modules
+
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+
+
+class Codec(Enum):
+    """Compression codec"""
+
+    GZIP = 'gzip'
+    ZSTD = 'zstd'
+    LZ4 = 'lz4'
+    NONE = 'none'
+
+
+_CODEC_EXTENSION = {
+    Codec.GZIP: '.gz',
+    Codec.ZSTD: '.zst',
+    Codec.LZ4: '.lz4',
+    Codec.NONE: '',
+}
+_CODEC_DEFAULT_LEVEL = {
+    Codec.GZIP: 9,
+    Codec.ZSTD: 3,
+    Codec.LZ4: 0,
+    Codec.NONE: 0,
+}
+_CODEC_LEVEL_RANGE = {
+    Codec.GZIP: (0, 9),
+    Codec.ZSTD: (1, 22),
+    Codec.LZ4: (0, 16),
+}
+# optional codec modules are imported only when codec is selected
+_CODEC_MODULE = {
+    Codec.ZSTD: 'zstandard',
+    Codec.LZ4: 'lz4.frame',
+}
+
+
+@lru_cache(maxsize=None)
+def _codec_module(codec: Codec):
+    name = _CODEC_MODULE.get(codec)
+    if name is None:
+        return None
+    return lazy_import(name)
+
+
+def codec_available(codec: Codec) -> bool:
+    """Determine if codec dependency is available"""
+    if codec not in _CODEC_MODULE:
+        return True
+    return _codec_module(codec) is not None
+
+
+def codec_level_range(codec: Codec) -> tuple[int, int] | None:
+    """Minimum and maximum compression levels of codec, None if codec does
+    not take a level
+    """
+    return _CODEC_LEVEL_RANGE.get(codec)
+
+
+@dataclass(frozen=True)
+class Compression:
+    """Compression settings"""
+
+    codec: Codec = Codec.GZIP
+    level: int | None = None
+    threads: int = 1
+    block_size: int = DEFAULT_BLOCK_SIZE
+
+    @property
+    def extension(self) -> str:
+        """Compressed file extension"""
+        return _CODEC_EXTENSION[self.codec]
+
+    @property
+    def effective_level(self) -> int:
+        """Compression level, codec default when unset"""
+        if self.level is None:
+            return _CODEC_DEFAULT_LEVEL[self.codec]
+        return self.level
+
+
+class ParallelGzipWriter(BufferedIOBase):
+    """Gzip writer compressing fixed size blocks on a pool of threads
+
+    Each block is compressed as an independent gzip member and members are
+    written in submission order, the result is a valid multi-member gzip
+    file which any gzip reader decompresses as a single stream. zlib
+    releases the GIL while compressing so blocks really run in parallel.
+    """
+
+    def __init__(
+        self,
+        fobj,
+        level: int,
+        threads: int,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ):
+        super().__init__()
+        self._fobj = fobj
+        self._level = level
+        self._block_size = max(1, block_size)
+        self._buffer = bytearray()
+        self._pending: deque[Future] = deque()
+        self._max_pending = 2 * threads
+        self._members = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix='gzip'
+        )
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to closed file")
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[: self._block_size])
+            del self._buffer[: self._block_size]
+            self._submit(block)
+        return len(data)
+
+    def _submit(self, block: bytes):
+        self._pending.append(
+            self._executor.submit(gzip_compress, block, self._level, mtime=0)
+        )
+        self._members += 1
+        while len(self._pending) > self._max_pending:
+            self._fobj.write(self._pending.popleft().result())
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._buffer or not self._members:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._fobj.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+            self._fobj.close()
+            super().close()
+
+
+def _open_gzip(filepath: Path, compression: Compression):
+    if compression.threads > 1:
+        return ParallelGzipWriter(
+            filepath.open('wb'),
+            compression.effective_level,
+            compression.threads,
+            compression.block_size,
+        )
+    return gzip_open(
+        filepath, 'wb', compresslevel=compression.effective_level
+    )
+
+
+def _open_zstd(filepath: Path, compression: Compression):
+    compressor = _codec_module(Codec.ZSTD).ZstdCompressor(
+        level=compression.effective_level,
+        threads=compression.threads if compression.threads > 1 else 0,
+    )
+    return compressor.stream_writer(filepath.open('wb'), closefd=True)
+
+
+def _open_lz4(filepath: Path, compression: Compression):
+    return _codec_module(Codec.LZ4).open(
+        filepath, 'wb', compression_level=compression.effective_level
+    )
+
+
+def _open_none(filepath: Path, _compression: Compression):
+    return filepath.open('wb')
+
+
+_OPEN_STRATEGY = {
+    Codec.GZIP: _open_gzip,
+    Codec.ZSTD: _open_zstd,
+    Codec.LZ4: _open_lz4,
+    Codec.NONE: _open_none,
+}
+
+
+def open_compressed(filepath: Path, compression: Compression):
+    """Open filepath for binary writing using given compression"""
+    load_lazy_modules(_codec_module(compression.codec))
+    return _OPEN_STRATEGY[compression.codec](filepath, compression)
+
+
+def open_compressed_text(filepath: Path, compression: Compression):
+    """Open filepath for UTF-8 text writing using given compression"""
+    return TextIOWrapper(
+        open_compressed(filepath, compression), encoding='utf-8', newline=''
+    )
@@ -5,7 +5,8 @@ from gzip import open as gzip_open
 from pathlib import Path
 from sys import maxsize
 
-from ..helper.typing import RecordIterator, StringList
+from ..helper.typing import RecordBatchIterator, RecordIterator, StringList
+from .compressing import Compression, open_compressed_text
 
 field_size_limit(maxsize)
 
@@ -23,8 +24,8 @@ def _read_csv_fobj(fobj) -> RecordIterator:
     yield from csv_reader
 
 
-def _write_csv_fobj(fobj, fieldnames: StringList, records: RecordIterator):
-    csv_writer = DictWriter(
+def _csv_writer(fobj, fieldnames: StringList) -> DictWriter:
+    return DictWriter(
         fobj,
         fieldnames=fieldnames,
         restval='',
@@ -35,11 +36,24 @@ def _write_csv_fobj(fobj, fieldnames: StringList, records: RecordIterator):
         doublequote=True,
         extrasaction='ignore',
     )
+
+
+def _write_csv_fobj(fobj, fieldnames: StringList, records: RecordIterator):
+    csv_writer = _csv_writer(fobj, fieldnames)
     csv_writer.writeheader()
     for record in records:
         csv_writer.writerow(record)
 
 
+def _write_csv_batches_fobj(
+    fobj, fieldnames: StringList, batches: RecordBatchIterator
+):
+    csv_writer = _csv_writer(fobj, fieldnames)
+    csv_writer.writeheader()
+    for batch in batches:
+        csv_writer.writerows(batch)
+
+
 def read_csv_gz(filepath: Path) -> RecordIterator:
     """Iterate over gzipped CSV records"""
     with gzip_open(filepath, 'rt', encoding='utf-8', newline='') as fobj:
@@ -52,3 +66,14 @@ def write_csv_gz(
     """Write records to gzipped CSV"""
     with gzip_open(filepath, 'wt', encoding='utf-8', newline='') as fobj:
         _write_csv_fobj(fobj, fieldnames, records)
+
+
+def write_csv_batches(
+    filepath: Path,
+    fieldnames: StringList,
+    batches: RecordBatchIterator,
+    compression: Compression,
+):
+    """Write batches of records to CSV compressed using given compression"""
+    with open_compressed_text(filepath, compression) as fobj:
+        _write_csv_batches_fobj(fobj, fieldnames, batches)
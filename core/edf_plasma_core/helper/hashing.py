@@ -1,10 +1,14 @@
 """Hashing helpers"""
 
+from collections.abc import Iterable
 from enum import Enum
 from hashlib import md5, sha1, sha256
+from os import getenv
 from pathlib import Path
 
-from .streaming import chunks_from_filepath
+from .caching import LRUCache
+
+_BUFFER_SIZE = 1024 * 1024
 
 
 class HashingAlgorithm(Enum):
@@ -15,11 +19,14 @@ class HashingAlgorithm(Enum):
     SHA256 = 'sha256'
 
 
+DigestMapping = dict[HashingAlgorithm, str]
+
 _HASH_ALGORITHM_MAP = {
     HashingAlgorithm.MD5: md5,
     HashingAlgorithm.SHA1: sha1,
     HashingAlgorithm.SHA256: sha256,
 }
+_DIGEST_CACHE = LRUCache(int(getenv('PLASMA_DIGEST_CACHE_SIZE', '65536')))
 
 
 def digest_from_bytes(hash_algo: HashingAlgorithm, data: bytes) -> str:
@@ -29,9 +36,45 @@ def digest_from_bytes(hash_algo: HashingAlgorithm, data: bytes) -> str:
     return mda.hexdigest()
 
 
+def _digests_from_fobj(
+    hash_algos: Iterable[HashingAlgorithm], fobj
+) -> DigestMapping:
+    mdas = {
+        hash_algo: _HASH_ALGORITHM_MAP[hash_algo]() for hash_algo in hash_algos
+    }
+    buffer = bytearray(_BUFFER_SIZE)
+    view = memoryview(buffer)
+    while True:
+        size = fobj.readinto(buffer)
+        if not size:
+            break
+        chunk = view[:size]
+        for mda in mdas.values():
+            mda.update(chunk)
+    return {hash_algo: mda.hexdigest() for hash_algo, mda in mdas.items()}
+
+
+def digests_from_filepath(
+    hash_algos: Iterable[HashingAlgorithm], filepath: Path
+) -> DigestMapping:
+    """Digests from file path using given hashing algorithms
+
+    File is read once and digests of every supported algorithm are
+    computed in this single pass, dissectors of a family requesting
+    distinct algorithms for the same file do not read it again. Digests
+    are cached (see PLASMA_DIGEST_CACHE_SIZE) by path, size, modification
+    time and inode.
+    """
+    stat = filepath.stat()
+    key = (str(filepath), stat.st_size, stat.st_mtime_ns, stat.st_ino)
+    digests = _DIGEST_CACHE.get(key)
+    if digests is None:
+        with filepath.open('rb', buffering=0) as fobj:
+            digests = _digests_from_fobj(HashingAlgorithm, fobj)
+        _DIGEST_CACHE.put(key, digests)
+    return {hash_algo: digests[hash_algo] for hash_algo in hash_algos}
+
+
 def digest_from_filepath(hash_algo: HashingAlgorithm, filepath: Path) -> str:
     """Digest from file path using given hashing algorithm"""
-    mda = _HASH_ALGORITHM_MAP[hash_algo]()
-    for chunk in chunks_from_filepath(filepath):
-        mda.update(chunk)
-    return mda.hexdigest()
+    return digests_from_filepath([hash_algo], filepath)[hash_algo]
@@ -2,10 +2,14 @@
 
 from dataclasses import dataclass
 from pathlib import Path
+from threading import Lock
 
 from magic import from_buffer, from_file
 from magika import Magika
 
+_MAGIKA = None
+_MAGIKA_LOCK = Lock()
+
 
 @dataclass
 class IdentificationResult:
@@ -25,6 +29,15 @@ def instanciate_magika() -> Magika:
     return Magika()
 
 
+def shared_magika() -> Magika:
+    """Magika model instanciated on first use and shared afterwards"""
+    global _MAGIKA
+    with _MAGIKA_LOCK:
+        if _MAGIKA is None:
+            _MAGIKA = instanciate_magika()
+        return _MAGIKA
+
+
 def identify_bytes(
     data: bytes, magika: Magika | None = None
 ) -> IdentificationResult:
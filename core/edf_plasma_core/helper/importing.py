@@ -8,11 +8,13 @@ from importlib.util import (
 )
 from pathlib import Path
 from sys import modules
+from threading import Lock
 from typing import Any
 
 from .logging import get_logger
 
 _LOGGER = get_logger('core.helper.importing')
+_LOAD_LOCK = Lock()
 
 
 def _exec_module(name, spec):
@@ -39,6 +41,18 @@ def lazy_import(name: str) -> Any:
     return _exec_module(name, spec)
 
 
+def load_lazy_modules(*lazy_modules):
+    """Force loading of lazy imported modules
+
+    LazyLoader is not thread-safe, modules used from concurrent threads
+    shall be loaded by calling this function first.
+    """
+    with _LOAD_LOCK:
+        for module in lazy_modules:
+            if module is not None:
+                getattr(module, '__name__')
+
+
 def import_from_file(filepath: Path) -> Any:
     """Import python module from filepath"""
     if not filepath.is_file():
@@ -49,3 +63,15 @@ def import_from_file(filepath: Path) -> Any:
         return modules[name]
     spec = spec_from_file_location(name, filepath)
     return _exec_module(name, spec)
+
+
+def import_from_directory(directory: Path | None):
+    """Import python modules from directory"""
+    if not directory:
+        return
+    if not directory.is_dir():
+        return
+    for filepath in directory.glob('*.py'):
+        if not filepath.is_file():
+            continue
+        import_from_file(filepath)
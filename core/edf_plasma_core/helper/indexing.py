@@ -0,0 +1,254 @@
+"""Indexing helper"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from fnmatch import translate
+from functools import lru_cache
+from os import scandir
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from .logging import get_logger
+from .matching import regexp
+from .perfmeter import PerformanceMeter
+
+_LOGGER = get_logger('core.helper.indexing')
+_INDEXES: dict[Path, 'TargetIndex'] = {}
+_INDEXES_LOCK = Lock()
+_WILDCARDS = frozenset('*?[')
+_CI_CHAR_PATTERN = regexp(r'\[([A-Z])([a-z])\]')
+_SUFFIX_PATTERN = regexp(r'\*(\.[^*?\[/.]+)')
+
+PathParts = tuple[str, ...]
+
+
+@lru_cache(maxsize=1024)
+def _segment_matcher(segment: str):
+    return regexp(translate(segment)).match
+
+
+@lru_cache(maxsize=1024)
+def _segment_literal(segment: str) -> str:
+    """Lowercase literal name matched by segment or empty string
+
+    Case insensitive patterns built by ci_glob_pattern are reduced to their
+    lowercase literal value, e.g. '[Ss][Aa][Mm]' gives 'sam'
+    """
+    literal = _CI_CHAR_PATTERN.sub(
+        lambda match: match.group(2)
+        if match.group(1).lower() == match.group(2)
+        else match.group(0),
+        segment,
+    )
+    if _WILDCARDS.intersection(literal):
+        return ''
+    return literal.lower()
+
+
+@lru_cache(maxsize=1024)
+def _segment_suffix(segment: str) -> str:
+    """Lowercase suffix matched by segment or empty string
+
+    Case insensitive patterns built by ci_glob_pattern are reduced to their
+    lowercase suffix value, e.g. '*.[Ll][Nn][Kk]' gives '.lnk'
+    """
+    if not segment.startswith('*'):
+        return ''
+    literal = _segment_literal(segment[1:])
+    if not literal:
+        return ''
+    match = _SUFFIX_PATTERN.fullmatch(f'*{literal}')
+    if not match:
+        return ''
+    return match.group(1)
+
+
+def _lower_suffix(lname: str) -> str:
+    _, dot, suffix = lname.rpartition('.')
+    return f'.{suffix}' if dot else ''
+
+
+@dataclass(slots=True)
+class IndexEntry:
+    """Indexed regular file"""
+
+    parent: int
+    name: str
+    lname: str
+    size: int
+    mode: int
+    sniffed: Any = None
+
+
+@dataclass
+class TargetIndex:
+    """In-memory index of regular files found under root directory
+
+    Directories are stored once as tuples of parts relative to root and
+    entries reference their parent directory by position to keep memory
+    usage low on multi-million file targets.
+    """
+
+    root: Path
+    directories: list[PathParts] = field(default_factory=list)
+    entries: list[IndexEntry] = field(default_factory=list)
+    by_lname: dict[str, list[int]] = field(default_factory=dict)
+    by_suffix: dict[str, list[int]] = field(default_factory=dict)
+    by_directory: dict[PathParts, int] = field(default_factory=dict)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _add_entry(self, parent: int, name: str, size: int, mode: int):
+        lname = name.lower()
+        position = len(self.entries)
+        self.entries.append(
+            IndexEntry(
+                parent=parent, name=name, lname=lname, size=size, mode=mode
+            )
+        )
+        self.by_lname.setdefault(lname, []).append(position)
+        self.by_suffix.setdefault(_lower_suffix(lname), []).append(position)
+
+    def build(self):
+        """Walk root directory once using os.scandir and index regular files"""
+        perfmeter = PerformanceMeter()
+        with perfmeter:
+            self.directories.append(())
+            self.by_directory[()] = 0
+            pending = [0]
+            while pending:
+                parent = pending.pop()
+                parts = self.directories[parent]
+                dirpath = self.root.joinpath(*parts)
+                try:
+                    iterator = scandir(dirpath)
+                except OSError as exc:
+                    _LOGGER.error(
+                        "cannot scan directory: %s (%s)", dirpath, exc
+                    )
+                    continue
+                with iterator:
+                    for item in iterator:
+                        try:
+                            if item.is_dir(follow_symlinks=False):
+                                position = len(self.directories)
+                                self.directories.append(parts + (item.name,))
+                                self.by_directory[self.directories[-1]] = (
+                                    position
+                                )
+                                pending.append(position)
+                                continue
+                            if not item.is_file():
+                                continue
+                            stat = item.stat()
+                        except OSError as exc:
+                            _LOGGER.warning(
+                                "cannot index: %s (%s)", item.path, exc
+                            )
+                            continue
+                        self._add_entry(
+                            parent, item.name, stat.st_size, stat.st_mode
+                        )
+                        perfmeter.tick()
+        _LOGGER.info(
+            "indexed %s: directories=%d, files=%d, elapsed=%s",
+            self.root,
+            len(self.directories),
+            perfmeter.count,
+            perfmeter.elapsed,
+        )
+
+    def path(self, entry: IndexEntry) -> Path:
+        """Build entry path"""
+        return self.root.joinpath(*self.directories[entry.parent], entry.name)
+
+    def entry(self, filepath: Path) -> IndexEntry | None:
+        """Retrieve entry for filepath if indexed"""
+        parts = filepath.parent.parts[len(self.root.parts) :]
+        parent = self.by_directory.get(parts)
+        if parent is None:
+            return None
+        for position in self.by_lname.get(filepath.name.lower(), []):
+            entry = self.entries[position]
+            if entry.parent == parent and entry.name == filepath.name:
+                return entry
+        return None
+
+    def _candidates(self, segment: str) -> Iterator[IndexEntry]:
+        literal = _segment_literal(segment)
+        if literal:
+            positions = self.by_lname.get(literal, [])
+            return (self.entries[position] for position in positions)
+        suffix = _segment_suffix(segment)
+        if suffix:
+            positions = self.by_suffix.get(suffix, [])
+            return (self.entries[position] for position in positions)
+        return iter(self.entries)
+
+    def _matches(
+        self, parts: PathParts, base: PathParts, matchers: list
+    ) -> bool:
+        if parts[: len(base)] != base:
+            return False
+        parts = parts[len(base) :]
+        if len(parts) < len(matchers):
+            return False
+        if not matchers:
+            return True
+        return all(
+            matcher(part)
+            for matcher, part in zip(matchers, parts[-len(matchers) :])
+        )
+
+    def select(self, directory: Path, pattern: str) -> Iterator[IndexEntry]:
+        """Select entries under directory matching pattern like rglob does"""
+        base = directory.parts[len(self.root.parts) :]
+        *segments, segment = pattern.split('/')
+        matchers = [_segment_matcher(item) for item in segments]
+        match_name = _segment_matcher(segment)
+        for entry in self._candidates(segment):
+            if not match_name(entry.name):
+                continue
+            parts = self.directories[entry.parent]
+            if not self._matches(parts, base, matchers):
+                continue
+            yield entry
+
+    def select_directories(
+        self, directory: Path, pattern: str
+    ) -> Iterator[Path]:
+        """Select directories under directory matching pattern like rglob"""
+        base = directory.parts[len(self.root.parts) :]
+        segments = [_segment_matcher(item) for item in pattern.split('/')]
+        for parts in self.directories:
+            if len(parts) <= len(base):
+                continue
+            if not self._matches(parts, base, segments):
+                continue
+            yield self.root.joinpath(*parts)
+
+
+def index_directory(directory: Path) -> TargetIndex:
+    """Build and register target index for directory"""
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(directory)
+        if index is None:
+            index = TargetIndex(root=directory)
+            index.build()
+            _INDEXES[directory] = index
+    return index
+
+
+def get_index(directory: Path) -> TargetIndex | None:
+    """Retrieve registered index covering directory if any"""
+    for root, index in _INDEXES.items():
+        if directory.parts[: len(root.parts)] == root.parts:
+            return index
+    return None
+
+
+def can_use_index(pattern: str) -> bool:
+    """Determine if pattern can be answered from target index"""
+    return '**' not in pattern and not pattern.startswith('/')
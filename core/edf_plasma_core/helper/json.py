@@ -5,6 +5,7 @@ from gzip import open as gzip_open
 from json import JSONDecodeError, dump, dumps, load, loads
 from pathlib import Path
 
+from .compressing import Compression, open_compressed_text
 from .logging import get_logger
 
 _LOGGER = get_logger('core.helper.json')
@@ -19,6 +20,7 @@ JSONSerializableType = (
     | None
 )
 JSONSerializableIterator = Iterator[JSONSerializableType]
+JSONSerializableBatchIterator = Iterator[list[JSONSerializableType]]
 
 
 def _read_jsonl_fobj(fobj) -> JSONSerializableIterator:
@@ -39,6 +41,16 @@ def _write_jsonl_fobj(fobj, records: JSONSerializableIterator):
         fobj.write('\n')
 
 
+def _write_jsonl_batches_fobj(fobj, batches: JSONSerializableBatchIterator):
+    for batch in batches:
+        fobj.write(
+            ''.join(
+                f"{dumps(record, separators=(',', ':'))}\n"
+                for record in batch
+            )
+        )
+
+
 def read_json(filepath: Path) -> JSONSerializableType | None:
     """Load object from JSON content stored in filepath"""
     with filepath.open() as fobj:
@@ -68,6 +80,16 @@ def write_jsonl_gz(filepath: Path, records: JSONSerializableIterator):
         _write_jsonl_fobj(fobj, records)
 
 
+def write_jsonl_batches(
+    filepath: Path,
+    batches: JSONSerializableBatchIterator,
+    compression: Compression,
+):
+    """Write batches of records to JSONL compressed using given compression"""
+    with open_compressed_text(filepath, compression) as fobj:
+        _write_jsonl_batches_fobj(fobj, batches)
+
+
 class JSONSerializable:
     """JSON serializable API"""
 
@@ -1,7 +1,7 @@
 """Plasma Logging Helper"""
 
 from logging import FileHandler, Formatter, basicConfig, getLogger
-from os import getenv
+from os import environ, getenv
 from pathlib import Path
 
 from rich.console import Console
@@ -15,7 +15,13 @@ if _LOGFILE and Path(_LOGFILE).parent.is_dir():
         fmt="%(asctime)s %(levelname)s (%(name)s): %(message)s",
         datefmt="[%Y-%m-%dT%H:%M:%S]",
     )
-    _FILE_HANDLER = FileHandler(str(_LOGFILE), mode='w', encoding='utf-8')
+    # first process truncates the logfile, child processes (including
+    # forkserver server and workers) inherit the marker, every process
+    # appends so that lines of concurrent processes do not overlap
+    if environ.get('_PLASMA_LOGFILE_TRUNCATED') != _LOGFILE:
+        Path(_LOGFILE).write_bytes(b'')
+        environ['_PLASMA_LOGFILE_TRUNCATED'] = _LOGFILE
+    _FILE_HANDLER = FileHandler(str(_LOGFILE), mode='a', encoding='utf-8')
     _FILE_HANDLER.setFormatter(_FORMATTER)
     _HANDLERS.append(_FILE_HANDLER)
 
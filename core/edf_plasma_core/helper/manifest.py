@@ -0,0 +1,217 @@
+"""Manifest helper"""
+
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+
+from .datetime import to_iso_fmt, utc_now
+from .json import JSONSerializable, JSONSerializableType
+from .logging import get_logger
+
+_LOGGER = get_logger('core.helper.manifest')
+_SAMPLE_SIZE = 64 * 1024
+
+MANIFEST_FILENAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True, kw_only=True)
+class FileFingerprint:
+    """File size, modification time and sampled content digest"""
+
+    size: int
+    mtime: int
+    digest: str
+
+
+def fingerprint(filepath: Path) -> FileFingerprint | None:
+    """Compute filepath fingerprint
+
+    Digest covers file size and first and last 64 KiB of content to keep
+    fingerprinting cheap on very large evidence files.
+    """
+    try:
+        stat = filepath.stat()
+        mda = sha256(str(stat.st_size).encode())
+        with filepath.open('rb') as fobj:
+            mda.update(fobj.read(_SAMPLE_SIZE))
+            if stat.st_size > 2 * _SAMPLE_SIZE:
+                fobj.seek(-_SAMPLE_SIZE, 2)
+                mda.update(fobj.read(_SAMPLE_SIZE))
+    except OSError as exc:
+        _LOGGER.warning("cannot fingerprint: %s (%s)", filepath, exc)
+        return None
+    return FileFingerprint(
+        size=stat.st_size, mtime=stat.st_mtime_ns, digest=mda.hexdigest()
+    )
+
+
+@dataclass(kw_only=True)
+class ManifestEntry(JSONSerializable):
+    """Dissection of a source file recorded in manifest"""
+
+    fingerprint: FileFingerprint
+    records: int
+    errors: int
+    shard: str
+    time: str
+
+    @classmethod
+    def from_dict(cls, dct: JSONSerializableType):
+        return cls(
+            fingerprint=FileFingerprint(
+                size=dct['size'], mtime=dct['mtime'], digest=dct['digest']
+            ),
+            records=dct['records'],
+            errors=dct['errors'],
+            shard=dct['shard'],
+            time=dct['time'],
+        )
+
+    def to_dict(self) -> JSONSerializableType:
+        return {
+            'size': self.fingerprint.size,
+            'mtime': self.fingerprint.mtime,
+            'digest': self.fingerprint.digest,
+            'records': self.records,
+            'errors': self.errors,
+            'shard': self.shard,
+            'time': self.time,
+        }
+
+
+@dataclass(kw_only=True)
+class Manifest(JSONSerializable):
+    """Output directory manifest
+
+    Keeps track of dissected source files per output and of the number of
+    shards written for each output. Entries of a shard are only committed
+    once the shard is complete which makes resuming after a crash safe.
+
+    A modified source is dissected again in a new shard, rows of previous
+    shard having this source as _source are then listed in superseded as
+    source and shard pairs and shall be dropped by readers.
+    """
+
+    shards: dict[str, int] = field(default_factory=dict)
+    sources: dict[str, dict[str, ManifestEntry]] = field(default_factory=dict)
+    superseded: dict[str, list[dict[str, str]]] = field(
+        default_factory=dict
+    )
+    _lock: Lock = field(default_factory=Lock, repr=False)
+    _staged: dict = field(default_factory=dict, repr=False)
+    _pending: dict = field(default_factory=dict, repr=False)
+    _fingerprints: dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_dict(cls, dct: JSONSerializableType):
+        if dct and dct.get('version') != MANIFEST_VERSION:
+            _LOGGER.warning("ignored manifest with unsupported version")
+            dct = {}
+        outputs = dct.get('outputs', {})
+        return cls(
+            shards={
+                key: output['shards'] for key, output in outputs.items()
+            },
+            sources={
+                key: {
+                    source: ManifestEntry.from_dict(entry)
+                    for source, entry in output['sources'].items()
+                }
+                for key, output in outputs.items()
+            },
+            superseded={
+                key: output['superseded']
+                for key, output in outputs.items()
+                if output.get('superseded')
+            },
+        )
+
+    def to_dict(self) -> JSONSerializableType:
+        return {
+            'version': MANIFEST_VERSION,
+            'outputs': {
+                key: {
+                    'shards': shards,
+                    'sources': {
+                        source: entry.to_dict()
+                        for source, entry in self.sources.get(key, {}).items()
+                    },
+                    'superseded': self.superseded.get(key, []),
+                }
+                for key, shards in self.shards.items()
+            },
+        }
+
+    def open_shard(self, key: str) -> int:
+        """Allocate next shard number for output key"""
+        with self._lock:
+            return self.shards.get(key, 0) + 1
+
+    def _fingerprint(self, filepath: Path) -> FileFingerprint | None:
+        """Fingerprint filepath once per run whatever the number of outputs
+        it is selected for
+        """
+        source = str(filepath)
+        with self._lock:
+            if source in self._fingerprints:
+                return self._fingerprints[source]
+        current = fingerprint(filepath)
+        with self._lock:
+            return self._fingerprints.setdefault(source, current)
+
+    def is_unchanged(self, key: str, filepath: Path) -> bool:
+        """Determine if filepath was already dissected in its current state
+
+        Sources which registered errors during last dissection are
+        dissected again. Current fingerprint is staged to be recorded once
+        filepath is dissected again.
+        """
+        current = self._fingerprint(filepath)
+        source = str(filepath)
+        with self._lock:
+            entry = self.sources.get(key, {}).get(source)
+            if current is not None and entry is not None:
+                if entry.errors:
+                    _LOGGER.info("errors in last dissection: %s", source)
+                elif entry.fingerprint == current:
+                    return True
+                else:
+                    _LOGGER.info(
+                        "modified since last dissection: %s", source
+                    )
+            self._staged[(key, source)] = current
+        return False
+
+    def record(
+        self, key: str, source: str, records: int, errors: int, shard: str
+    ):
+        """Record dissection of source, pending until commit"""
+        with self._lock:
+            current = self._staged.pop((key, source), None)
+            if current is None:
+                return
+            self._pending.setdefault(key, {})[source] = ManifestEntry(
+                fingerprint=current,
+                records=records,
+                errors=errors,
+                shard=shard,
+                time=to_iso_fmt(utc_now()),
+            )
+
+    def commit(self, key: str, shard: int, filepath: Path):
+        """Commit pending entries of complete shard and save manifest"""
+        with self._lock:
+            self.shards[key] = max(self.shards.get(key, 0), shard)
+            sources = self.sources.setdefault(key, {})
+            for source, entry in self._pending.pop(key, {}).items():
+                previous = sources.get(source)
+                if previous is not None and previous.shard != entry.shard:
+                    self.superseded.setdefault(key, []).append(
+                        {'source': source, 'shard': previous.shard}
+                    )
+                sources[source] = entry
+            tmp_filepath = filepath.with_suffix('.tmp')
+            self.to_filepath(tmp_filepath)
+            tmp_filepath.replace(filepath)
@@ -0,0 +1,42 @@
+"""Parallel processing helpers"""
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any
+
+
+def ordered_process_map(
+    func: Callable,
+    args_iterable: Iterable[tuple],
+    workers: int,
+    prefetch: int = 2,
+    initializer: Callable | None = None,
+    initargs: tuple = (),
+) -> Iterator[Any]:
+    """Call func with each args tuple in a pool of worker processes
+
+    Results are yielded in submission order, at most prefetch calls per
+    worker are pending to bound memory usage. func and its arguments shall
+    be picklable. initializer is called with initargs once per worker
+    process, it can set up data shared by all calls.
+    """
+    pending = deque()
+    # forkserver avoids forking a parent process running many threads
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_context('forkserver'),
+        initializer=initializer,
+        initargs=initargs,
+    ) as executor:
+        try:
+            for args in args_iterable:
+                pending.append(executor.submit(func, *args))
+                if len(pending) > prefetch * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
@@ -3,17 +3,52 @@
 from os import R_OK, access
 from pathlib import Path
 
+from .indexing import can_use_index, get_index
 from .logging import get_logger
+from .typing import PathIterator
 
 _LOGGER = get_logger('core.helper.selecting')
 
 
-def select(directory: Path, pattern: str):
-    """Select readable files from directory matching pattern"""
+def _select_from_filesystem(directory: Path, pattern: str) -> PathIterator:
     for filepath in directory.rglob(pattern):
         if not filepath.is_file():
             continue
+        yield filepath
+
+
+def _select_from_index(index, directory: Path, pattern: str) -> PathIterator:
+    for entry in index.select(directory, pattern):
+        yield index.path(entry)
+
+
+def select(directory: Path, pattern: str) -> PathIterator:
+    """Select readable files from directory matching pattern
+
+    Selection is answered from memory when directory is covered by a target
+    index (see edf_plasma_core.helper.indexing.index_directory), otherwise
+    directory is walked recursively.
+    """
+    index = get_index(directory)
+    selected = (
+        _select_from_index(index, directory, pattern)
+        if index is not None and can_use_index(pattern)
+        else _select_from_filesystem(directory, pattern)
+    )
+    for filepath in selected:
         if not access(filepath, R_OK):
             _LOGGER.error("permission denied: %s", filepath)
             continue
         yield filepath
+
+
+def select_directories(directory: Path, pattern: str) -> PathIterator:
+    """Select directories from directory matching pattern"""
+    index = get_index(directory)
+    if index is not None and can_use_index(pattern):
+        yield from index.select_directories(directory, pattern)
+        return
+    for dirpath in directory.rglob(pattern):
+        if not dirpath.is_dir():
+            continue
+        yield dirpath
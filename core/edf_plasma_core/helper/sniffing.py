@@ -0,0 +1,142 @@
+"""Sniffing helper"""
+
+from dataclasses import dataclass
+from enum import Enum
+from os import getenv
+from pathlib import Path
+from struct import unpack_from
+
+from .caching import LRUCache
+from .indexing import get_index
+
+HEADER_SIZE = 4 * 1024
+MAGIC_SIZE = 16
+
+
+class ContentType(Enum):
+    """Content type"""
+
+    UNKNOWN = 'unknown'
+    PE = 'pe'
+    ELF = 'elf'
+    LNK = 'lnk'
+    EVTX = 'evtx'
+    PCAP = 'pcap'
+    REGF = 'regf'
+    SCCA = 'scca'
+    ESEDB = 'esedb'
+    OLECF = 'olecf'
+    PCAPNG = 'pcapng'
+    SQLITE = 'sqlite'
+
+
+_MAGIC_TABLE = (
+    (0, b'\x7fELF', ContentType.ELF),
+    (0, b'ElfFile\x00', ContentType.EVTX),
+    (0, b'regf', ContentType.REGF),
+    (0, b'SQLite format 3\x00', ContentType.SQLITE),
+    (0, b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', ContentType.OLECF),
+    (0, b'\x0e\x11\xfc\x0d\xd0\xcf\x11\x0e', ContentType.OLECF),
+    (
+        0,
+        b'\x4c\x00\x00\x00\x01\x14\x02\x00\x00\x00\x00\x00'
+        b'\xc0\x00\x00\x00\x00\x00\x00\x46',
+        ContentType.LNK,
+    ),
+    (0, b'\xa1\xb2\x3c\x4d', ContentType.PCAP),
+    (0, b'\xa1\xb2\xc3\xd4', ContentType.PCAP),
+    (0, b'\x4d\x3c\xb2\xa1', ContentType.PCAP),
+    (0, b'\xd4\xc3\xb2\xa1', ContentType.PCAP),
+    (0, b'\x0a\x0d\x0d\x0a', ContentType.PCAPNG),
+    (0, b'MAM\x04', ContentType.SCCA),
+    (4, b'SCCA', ContentType.SCCA),
+    (4, b'\xef\xcd\xab\x89', ContentType.ESEDB),
+)
+_PE_DOS_MAGIC = b'MZ'
+_PE_NT_MAGIC = b'PE\x00\x00'
+_PE_LFANEW_OFFSET = 0x3C
+
+
+@dataclass(frozen=True, slots=True)
+class SniffResult:
+    """Content type and first bytes of a file"""
+
+    content_type: ContentType
+    magic: bytes
+
+
+_SNIFF_CACHE = LRUCache(int(getenv('PLASMA_SNIFF_CACHE_SIZE', '65536')))
+
+
+def _read_at(filepath: Path, offset: int, size: int) -> bytes:
+    try:
+        with filepath.open('rb') as fobj:
+            fobj.seek(offset)
+            return fobj.read(size)
+    except OSError:
+        return b''
+
+
+def read_header(filepath: Path) -> bytes:
+    """Read first HEADER_SIZE bytes of filepath"""
+    return _read_at(filepath, 0, HEADER_SIZE)
+
+
+def _is_pe(filepath: Path, header: bytes) -> bool:
+    if not header.startswith(_PE_DOS_MAGIC):
+        return False
+    if len(header) < _PE_LFANEW_OFFSET + 4:
+        return False
+    (lfanew,) = unpack_from('<I', header, _PE_LFANEW_OFFSET)
+    signature = header[lfanew : lfanew + len(_PE_NT_MAGIC)]
+    if len(signature) < len(_PE_NT_MAGIC):
+        signature = _read_at(filepath, lfanew, len(_PE_NT_MAGIC))
+    return signature == _PE_NT_MAGIC
+
+
+def _classify(filepath: Path, header: bytes) -> ContentType:
+    for offset, magic, content_type in _MAGIC_TABLE:
+        if header.startswith(magic, offset):
+            return content_type
+    if _is_pe(filepath, header):
+        return ContentType.PE
+    return ContentType.UNKNOWN
+
+
+def _sniff(filepath: Path) -> SniffResult:
+    header = read_header(filepath)
+    return SniffResult(
+        content_type=_classify(filepath, header),
+        magic=header[:MAGIC_SIZE],
+    )
+
+
+def sniff(filepath: Path) -> SniffResult:
+    """Sniff filepath content type, reading its header once per run
+
+    Results are stored in the target index entry when filepath is indexed,
+    in a bounded cache otherwise.
+    """
+    index = get_index(filepath.parent)
+    entry = index.entry(filepath) if index is not None else None
+    if entry is not None:
+        if entry.sniffed is None:
+            entry.sniffed = _sniff(filepath)
+        return entry.sniffed
+    key = str(filepath)
+    result = _SNIFF_CACHE.get(key)
+    if result is None:
+        result = _sniff(filepath)
+        _SNIFF_CACHE.put(key, result)
+    return result
+
+
+def content_type(filepath: Path) -> ContentType:
+    """Determine filepath content type"""
+    return sniff(filepath).content_type
+
+
+def has_magic(filepath: Path, magics) -> bool:
+    """Determine if filepath content starts with one of given magics"""
+    magic = sniff(filepath).magic
+    return any(magic.startswith(candidate) for candidate in magics)
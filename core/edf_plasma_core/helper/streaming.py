@@ -1,6 +1,7 @@
 """Streaming helpers"""
 
 from gzip import open as gzip_open
+from io import SEEK_CUR, SEEK_END, SEEK_SET, RawIOBase
 from pathlib import Path
 
 from .typing import StringIterator
@@ -32,3 +33,59 @@ def chunks_from_filepath(filepath: Path, chunksize=DEFAULT_CHUNK_SIZE):
             if not chunk:
                 break
             yield chunk
+
+
+class BufferReader(RawIOBase):
+    """Read-only file object over a window of a buffer (bytes, mmap...)
+
+    Window is a memoryview of the buffer, reads only copy requested bytes.
+    Reader must be closed before closing an underlying mmap.
+    """
+
+    def __init__(self, buffer, offset: int = 0, size: int | None = None):
+        super().__init__()
+        with memoryview(buffer) as view:
+            end = len(view) if size is None else min(len(view), offset + size)
+            self._view = view[offset:end]
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def get_size(self) -> int:
+        """Size of the window"""
+        return len(self._view)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_CUR:
+            offset += self._pos
+        elif whence == SEEK_END:
+            offset += self.get_size()
+        if offset < 0:
+            raise ValueError(f"negative seek position: {offset}")
+        self._pos = offset
+        return offset
+
+    def read(self, size: int | None = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else self._pos + size
+        data = self._view[self._pos : end].tobytes()
+        self._pos += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self._view[self._pos : self._pos + len(buffer)]
+        size = len(data)
+        buffer[:size] = data
+        self._pos += size
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+        super().close()
@@ -11,6 +11,7 @@ class DataType(Enum):
 
     STR = 'str'
     INT = 'int'
+    UINT = 'uint'
     BOOL = 'bool'
     INET = 'inet'
     FLOAT = 'float'
@@ -10,7 +10,10 @@ Record = dict[str, str | bool | int | float | None]
 StringSet = set[str]
 StringList = list[str]
 URLIterator = Iterator[URL]
+RecordBatch = list[Record]
 RecordQueue = Queue[Record | None]
+RecordBatchQueue = Queue[RecordBatch | None]
 PathIterator = Iterator[Path]
 StringIterator = Iterator[str]
 RecordIterator = Iterator[Record]
+RecordBatchIterator = Iterator[RecordBatch]
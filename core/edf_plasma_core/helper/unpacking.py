@@ -0,0 +1,108 @@
+"""Fixed-layout binary structures helper
+
+Fixed-layout construct structures are compiled to precompiled struct.Struct
+instances unpacking records as named tuples. Layouts with fields depending
+on parsed values (variable length, switch...) cannot be compiled and shall
+keep using construct.
+"""
+
+from collections import namedtuple
+from collections.abc import Iterator
+from struct import Struct
+
+from .importing import lazy_import, load_lazy_modules
+
+lazy_construct = lazy_import('construct')
+CONSTRUCT_AVAILABLE = lazy_construct is not None
+
+
+class FastStruct:
+    """Precompiled fixed-layout structure
+
+    Nested structure fields are flattened, their names are joined with an
+    underscore (ut_tv.tv_sec becomes ut_tv_tv_sec). Array items are named
+    after the array and their index (ut_addr_v6_0...).
+    """
+
+    def __init__(self, fmt: str, names: list[str], typename: str = 'Record'):
+        self._struct = Struct(fmt)
+        self.record_cls = namedtuple(typename, names, rename=True)
+
+    @property
+    def size(self) -> int:
+        """Size of a record in bytes"""
+        return self._struct.size
+
+    def unpack_from(self, buffer, offset: int = 0):
+        """Unpack record from buffer at offset"""
+        return self.record_cls._make(self._struct.unpack_from(buffer, offset))
+
+    def iter_unpack(self, buffer, offset: int = 0) -> Iterator:
+        """Unpack consecutive records from buffer (bytes, mmap...) starting
+        at offset, trailing bytes not holding a full record are ignored
+
+        Buffer is not copied, an underlying mmap can be closed once the
+        iterator is exhausted or closed.
+        """
+        make = self.record_cls._make
+        with memoryview(buffer) as view:
+            count = max(0, len(view) - offset) // self.size
+            with view[offset : offset + count * self.size] as records:
+                for values in self._struct.iter_unpack(records):
+                    yield make(values)
+
+
+def _byte_order(byte_order: str, fmtstr: str) -> str:
+    if fmtstr[0] == byte_order or Struct(fmtstr).size == 1:
+        return byte_order
+    if byte_order:
+        raise ValueError("cannot compile mixed byte order fields")
+    return fmtstr[0]
+
+
+def _compile(subcon, name: str, fields: list, byte_order: str) -> str:
+    """Append format and field names of subcon, return byte order"""
+    construct = lazy_construct
+    if isinstance(subcon, construct.Renamed):
+        name = '_'.join(filter(None, (name, subcon.name)))
+        return _compile(subcon.subcon, name, fields, byte_order)
+    if isinstance(subcon, construct.Struct):
+        for item in subcon.subcons:
+            byte_order = _compile(item, name, fields, byte_order)
+        return byte_order
+    if isinstance(subcon, construct.FormatField):
+        fields.append((subcon.fmtstr[1:], name))
+        return _byte_order(byte_order, subcon.fmtstr)
+    if isinstance(subcon, construct.Bytes) and isinstance(subcon.length, int):
+        fields.append((f'{subcon.length}s', name))
+        return byte_order
+    if isinstance(subcon, construct.Array) and isinstance(subcon.count, int):
+        for index in range(subcon.count):
+            item_name = f'{name}_{index}'
+            byte_order = _compile(subcon.subcon, item_name, fields, byte_order)
+        return byte_order
+    if isinstance(subcon, (construct.Aligned, construct.Padded)):
+        if subcon.subcon is not construct.Pass:
+            byte_order = _compile(subcon.subcon, name, fields, byte_order)
+        size = subcon.subcon.sizeof()
+        if isinstance(subcon, construct.Aligned):
+            padding = -size % subcon.modulus
+        else:
+            padding = subcon.length - size
+        if padding:
+            fields.append((f'{padding}x', None))
+        return byte_order
+    raise ValueError(f"cannot compile construct: {subcon}")
+
+
+def compile_struct(struct, typename: str = 'Record') -> FastStruct:
+    """Compile fixed-layout construct structure
+
+    ValueError is raised if structure layout is not fixed.
+    """
+    load_lazy_modules(lazy_construct)
+    fields = []
+    byte_order = _compile(struct, '', fields, '')
+    fmt = (byte_order or '<') + ''.join(fmt for fmt, _ in fields)
+    names = [name for _, name in fields if name is not None]
+    return FastStruct(fmt, names, typename)
@@ -1,15 +1,6 @@
 """Plasma Dissectors"""
 
-from . import (
-    android,
-    darwin,
-    elf,
-    generic,
-    ios,
-    linux,
-    memdump,
-    pcap,
-    pe,
-    windows,
-)
 from .__version__ import version
+from .registry import load_registry
+
+load_registry()
@@ -1,3 +1 @@
 """Android-related dissectors"""
-
-from . import mvt
@@ -1,3 +1 @@
 """MVT Android module"""
-
-from . import appops, files, packages, packages_perms, processes, sms
@@ -1,13 +1 @@
 """Darwin-related dissectors"""
-
-from . import (
-    fslist,
-    install_history,
-    install_log,
-    knowledgec,
-    startup,
-    safari_history,
-    system_log,
-    users,
-    version,
-)
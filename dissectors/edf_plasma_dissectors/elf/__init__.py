@@ -1,6 +1,3 @@
 """Executable linkable format dissectors"""
 
-from .helper import LIEF_AVAILABLE
-
-if LIEF_AVAILABLE:
-    from . import ctor_dtor, export, import_, info, library, section, segment
+REQUIRES = ('lief',)
@@ -13,7 +13,12 @@ from edf_plasma_core.helper.hashing import (
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import elf_fun_is_ctor_dtor, parse_elf, select_elf_impl
+from .helper import (
+    ELF_FAMILY,
+    elf_fun_is_ctor_dtor,
+    parse_elf,
+    select_elf_impl,
+)
 
 
 def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
@@ -43,5 +48,6 @@ DISSECTOR = Dissector(
     description="ELF constructors and destructors",
     select_impl=select_elf_impl,
     dissect_impl=_dissect_impl,
+    family=ELF_FAMILY,
 )
 register_dissector(DISSECTOR)
@@ -13,7 +13,7 @@ from edf_plasma_core.helper.hashing import (
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import parse_elf, select_elf_impl
+from .helper import ELF_FAMILY, parse_elf, select_elf_impl
 
 
 def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
@@ -42,5 +42,6 @@ DISSECTOR = Dissector(
     description="ELF binary exported symbols",
     select_impl=select_elf_impl,
     dissect_impl=_dissect_impl,
+    family=ELF_FAMILY,
 )
 register_dissector(DISSECTOR)
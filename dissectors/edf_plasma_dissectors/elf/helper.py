@@ -6,18 +6,23 @@ from edf_plasma_core.dissector import DissectionContext
 from edf_plasma_core.helper.importing import lazy_import
 from edf_plasma_core.helper.logging import get_logger
 from edf_plasma_core.helper.selecting import select
+from edf_plasma_core.helper.sniffing import ContentType, content_type
 from edf_plasma_core.helper.typing import PathIterator
 
+from ..helper.lief import parse_binary
+
 lazy_lief = lazy_import('lief')
 LIEF_AVAILABLE = lazy_lief is not None
 
 _LOGGER = get_logger('dissectors.elf.helper')
 
+ELF_FAMILY = 'elf'
+
 
 def select_elf_impl(directory: Path) -> PathIterator:
     """Select ELF implementation"""
     for filepath in select(directory, '*'):
-        if not lazy_lief.is_elf(str(filepath)):
+        if content_type(filepath) != ContentType.ELF:
             if filepath.suffix in {'.so'}:
                 _LOGGER.warning(
                     "suffix suggests ELF but type check failed: %s"
@@ -27,8 +32,11 @@ def select_elf_impl(directory: Path) -> PathIterator:
 
 
 def parse_elf(ctx: DissectionContext) -> 'lief.ELF.Binary':
-    """Parse ELF file referenced by dissection context"""
-    return lazy_lief.parse(ctx.filepath)
+    """Parse ELF file referenced by dissection context
+
+    File is parsed once for all dissectors of elf family.
+    """
+    return parse_binary(ctx.filepath, ctx)
 
 
 def elf_section_perm(section: 'lief.ELF.Section') -> str:
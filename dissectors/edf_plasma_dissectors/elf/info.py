@@ -8,22 +8,27 @@ from edf_plasma_core.dissector import (
 )
 from edf_plasma_core.helper.hashing import (
     HashingAlgorithm,
-    digest_from_filepath,
+    digests_from_filepath,
 )
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import parse_elf, select_elf_impl
+from .helper import ELF_FAMILY, parse_elf, select_elf_impl
+
+_HASHING_ALGORITHMS = (
+    HashingAlgorithm.MD5,
+    HashingAlgorithm.SHA1,
+    HashingAlgorithm.SHA256,
+)
 
 
 def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
     elf = parse_elf(ctx)
+    digests = digests_from_filepath(_HASHING_ALGORITHMS, ctx.filepath)
     yield {
-        'elf_md5': digest_from_filepath(HashingAlgorithm.MD5, ctx.filepath),
-        'elf_sha1': digest_from_filepath(HashingAlgorithm.SHA1, ctx.filepath),
-        'elf_sha256': digest_from_filepath(
-            HashingAlgorithm.SHA256, ctx.filepath
-        ),
+        'elf_md5': digests[HashingAlgorithm.MD5],
+        'elf_sha1': digests[HashingAlgorithm.SHA1],
+        'elf_sha256': digests[HashingAlgorithm.SHA256],
         'elf_size': ctx.filepath.stat().st_size,
         'elf_filename': ctx.filepath.name,
         'elf_is_pie': elf.is_pie,
@@ -48,5 +53,6 @@ DISSECTOR = Dissector(
     description="ELF information",
     select_impl=select_elf_impl,
     dissect_impl=_dissect_impl,
+    family=ELF_FAMILY,
 )
 register_dissector(DISSECTOR)
@@ -13,7 +13,7 @@ from edf_plasma_core.helper.hashing import (
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import elf_is_dt_needed, parse_elf, select_elf_impl
+from .helper import ELF_FAMILY, elf_is_dt_needed, parse_elf, select_elf_impl
 
 
 def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
@@ -38,5 +38,6 @@ DISSECTOR = Dissector(
     description="ELF binary needed libraries",
     select_impl=select_elf_impl,
     dissect_impl=_dissect_impl,
+    family=ELF_FAMILY,
 )
 register_dissector(DISSECTOR)
@@ -13,7 +13,7 @@ from edf_plasma_core.helper.hashing import (
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import elf_section_perm, parse_elf, select_elf_impl
+from .helper import ELF_FAMILY, elf_section_perm, parse_elf, select_elf_impl
 
 
 def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
@@ -46,5 +46,6 @@ DISSECTOR = Dissector(
     description="ELF binary sections",
     select_impl=select_elf_impl,
     dissect_impl=_dissect_impl,
+    family=ELF_FAMILY,
 )
 register_dissector(DISSECTOR)
@@ -14,7 +14,7 @@ from edf_plasma_core.helper.hashing import (
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import elf_segment_perm, parse_elf, select_elf_impl
+from .helper import ELF_FAMILY, elf_segment_perm, parse_elf, select_elf_impl
 
 
 def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
@@ -49,5 +49,6 @@ DISSECTOR = Dissector(
     description="ELF binary segments",
     select_impl=select_elf_impl,
     dissect_impl=_dissect_impl,
+    family=ELF_FAMILY,
 )
 register_dissector(DISSECTOR)
@@ -1,11 +1 @@
 """Generic dissectors"""
-
-from . import (
-    artifact_info,
-    chromium,
-    client_info,
-    firefox,
-    history,
-    hosts,
-    ssh_pub_key,
-)
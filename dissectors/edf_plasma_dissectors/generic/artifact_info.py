@@ -10,22 +10,20 @@ from edf_plasma_core.dissector import (
 )
 from edf_plasma_core.helper.identifying import (
     identify_filepath,
-    instanciate_magika,
+    shared_magika,
 )
 from edf_plasma_core.helper.json import read_jsonl
 from edf_plasma_core.helper.selecting import select
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import PathIterator, RecordIterator
 
-_MAGIKA = instanciate_magika()
-
 
 def _select_impl(directory: Path) -> PathIterator:
     yield from select(directory, '*')
 
 
 def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
-    ident_result = identify_filepath(ctx.filepath, magika=_MAGIKA)
+    ident_result = identify_filepath(ctx.filepath, magika=shared_magika())
     record = {
         'size': '',
         'created': '',
@@ -0,0 +1,54 @@
+"""Plasma Dissector LIEF Helper"""
+
+from os import getenv
+from pathlib import Path
+from threading import Lock
+
+from edf_plasma_core.dissector import DissectionContext
+from edf_plasma_core.helper.caching import LRUCache
+from edf_plasma_core.helper.importing import lazy_import, load_lazy_modules
+
+lazy_lief = lazy_import('lief')
+
+_BINARY_CACHE = LRUCache(int(getenv('PLASMA_LIEF_CACHE_SIZE', '8')))
+_PINNED_BINARIES = {}
+_PINNED_BINARIES_LOCK = Lock()
+
+
+def _pin(key, binary, ctx: DissectionContext | None):
+    """Keep binary until the last dissector of ctx family parsed it"""
+    if ctx is None or ctx.dissector not in ctx.family[:-1]:
+        with _PINNED_BINARIES_LOCK:
+            _PINNED_BINARIES.pop(key, None)
+        return
+    with _PINNED_BINARIES_LOCK:
+        _PINNED_BINARIES[key] = binary
+
+
+def parse_binary(filepath: Path, ctx: DissectionContext | None = None):
+    """Parse executable using LIEF
+
+    Parsed binaries are cached (see PLASMA_LIEF_CACHE_SIZE) by path, size
+    and modification time. Dissectors of a family dissect a file one after
+    the other which makes every dissector after the first one reuse the
+    binary parsed by the first one. When ctx is given, binary is also
+    pinned until the last dissector of ctx family parsed it, whatever the
+    number of families dissected concurrently.
+    """
+    load_lazy_modules(lazy_lief)
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return lazy_lief.parse(filepath)
+    key = (str(filepath), stat.st_size, stat.st_mtime_ns)
+    with _PINNED_BINARIES_LOCK:
+        binary = _PINNED_BINARIES.get(key)
+    if binary is None:
+        binary = _BINARY_CACHE.get(key)
+    if binary is None:
+        binary = lazy_lief.parse(filepath)
+        if binary is not None:
+            _BINARY_CACHE.put(key, binary)
+    if binary is not None:
+        _pin(key, binary, ctx)
+    return binary
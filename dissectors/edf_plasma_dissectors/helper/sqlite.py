@@ -6,14 +6,12 @@ from sqlite3 import DatabaseError, Row, connect
 from typing import Any
 
 from edf_plasma_core.dissector import DissectionContext
-
-SQLITE3_MAGIC = b'SQLite format 3'
+from edf_plasma_core.helper.sniffing import ContentType, content_type
 
 
 def check_sqlite_signature(filepath: Path) -> bool:
     """Check that filepath first bytes match SQLite3 magic value"""
-    with filepath.open('rb') as fobj:
-        return fobj.read(len(SQLITE3_MAGIC)) == SQLITE3_MAGIC
+    return content_type(filepath) == ContentType.SQLITE
 
 
 @dataclass
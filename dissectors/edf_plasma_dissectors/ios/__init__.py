@@ -1,3 +1 @@
 """iOS-related dissectors"""
-
-from . import mvt, sysdiag
@@ -1,15 +1 @@
 """MVT iOS module"""
-
-from . import (
-    analytics_ad_daily,
-    apps,
-    datausage,
-    manifest,
-    safari_history,
-    safari_state,
-    shortcuts,
-    sms,
-    tcc,
-    webkit_rsrc_load,
-    whatsapp,
-)
@@ -1,3 +1 @@
 """iOS sysdiag module"""
-
-from . import bluetooth, disk, mount, process, remotectl, shutdown, wifi
@@ -1,25 +1 @@
 """Linux dissectors"""
-
-from . import (
-    apt,
-    at,
-    auditd,
-    authlog,
-    crontab,
-    dpkg,
-    fslist,
-    fstab,
-    group,
-    journal,
-    logrotate,
-    netstat,
-    passwd,
-    resolv,
-    shadow,
-    systemd,
-    udev_rules,
-    usbguard,
-    wtmp_utmp,
-    xdg_autostart,
-    yum,
-)
@@ -1,3 +1 @@
 """APT dissectors"""
-
-from . import history, sources
@@ -1,3 +1 @@
 """at dissectors"""
-
-from . import at_acl, at_jobs
@@ -62,7 +62,7 @@ DISSECTOR = Dissector(
     slug='linux_fslist',
     tags={Tag.LINUX},
     columns=[
-        Column('inode', DataType.INT),
+        Column('inode', DataType.UINT),
         Column('block_size', DataType.INT),
         Column('perms', DataType.STR),
         Column('links', DataType.INT),
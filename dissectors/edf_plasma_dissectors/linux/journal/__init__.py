@@ -1,6 +1,3 @@
 """Systemd journal dissectors"""
 
-from .helper import SYSTEMD_AVAILABLE
-
-if SYSTEMD_AVAILABLE:
-    from . import auth, cron, ftp
+REQUIRES = ('systemd',)
@@ -47,7 +47,7 @@ DISSECTOR = Dissector(
         Column('proc_cmd', DataType.STR),
         Column('proc_type', DataType.STR),
         Column('proc_file', DataType.STR),
-        Column('proc_inode', DataType.INT),
+        Column('proc_inode', DataType.UINT),
         Column('state', DataType.STR),
         Column('laddr', DataType.STR),
         Column('lport', DataType.INT),
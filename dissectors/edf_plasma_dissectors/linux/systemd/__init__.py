@@ -1,3 +1 @@
 """Systemd dissectors"""
-
-from . import service, timer
@@ -1,3 +1 @@
 """USBGuard dissectors"""
-
-from . import device, policy
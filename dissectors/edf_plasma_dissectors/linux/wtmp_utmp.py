@@ -1,13 +1,13 @@
 """Linux Wtmp/Utmp/Btmp Dissector"""
 
 from collections.abc import Iterator
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
 
 from construct import (
     Aligned,
     Array,
     Bytes,
-    Container,
     Int16sl,
     Int32sl,
     Struct,
@@ -22,6 +22,7 @@ from edf_plasma_core.helper.datetime import from_unix_timestamp, to_iso_fmt
 from edf_plasma_core.helper.selecting import select
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import PathIterator, RecordIterator
+from edf_plasma_core.helper.unpacking import compile_struct
 
 ExitStatus = Struct(
     'e_termination' / Int16sl,
@@ -44,15 +45,15 @@ UTMPRecord = Struct(
     'ut_addr_v6' / Array(4, Int32sl),
     '_dummy' / Bytes(20),
 )
+_UTMP_RECORD = compile_struct(UTMPRecord, 'UTMPRecord')
 
 
-def _utmp_read(utmp_path: Path) -> Iterator[Container]:
+def _utmp_read(utmp_path: Path) -> Iterator[tuple]:
+    if utmp_path.stat().st_size < _UTMP_RECORD.size:
+        return
     with utmp_path.open('rb') as file:
-        while True:
-            data = file.read(UTMPRecord.sizeof())
-            if len(data) != UTMPRecord.sizeof():
-                break
-            yield UTMPRecord.parse(data)
+        with mmap(file.fileno(), 0, access=ACCESS_READ) as mem:
+            yield from _UTMP_RECORD.iter_unpack(mem)
 
 
 def _select_impl(directory: Path) -> PathIterator:
@@ -63,7 +64,7 @@ def _select_impl(directory: Path) -> PathIterator:
 
 def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
     for entry in _utmp_read(ctx.filepath):
-        timestamp = float(entry.ut_tv.tv_sec)
+        timestamp = float(entry.ut_tv_tv_sec)
         timestamp = from_unix_timestamp(timestamp * 1000 * 1000)
         yield {
             'ut_type': entry.ut_type,
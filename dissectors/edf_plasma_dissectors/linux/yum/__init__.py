@@ -1,3 +1 @@
 """YUM dissectors"""
-
-from . import history, sources
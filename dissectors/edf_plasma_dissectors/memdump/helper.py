@@ -1,15 +1,19 @@
 """Memory dissectors helper"""
 
 from collections.abc import Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
-from functools import partial
 from os import getenv
 from pathlib import Path
-from threading import Event, Lock
+from queue import Full, Queue
+from threading import Event, Lock, Thread
+from typing import Any
 
+from edf_plasma_core.helper.caching import LRUCache
 from edf_plasma_core.helper.importing import lazy_import
 from edf_plasma_core.helper.logging import get_logger
 from edf_plasma_core.helper.selecting import select
+from edf_plasma_core.helper.sniffing import has_magic
 from edf_plasma_core.helper.typing import PathIterator
 
 lazy_plugins = lazy_import('volatility3.plugins')
@@ -22,6 +26,11 @@ _LOGGER = get_logger('dissectors.memory.helper')
 _SETUP_LOCK = Lock()
 _SETUP_FLAG = Event()
 _BASE_CONFIG_PATH = 'plugins'
+_CONTEXT_CACHE = LRUCache(int(getenv('PLASMA_VOL_CONTEXT_CACHE_SIZE', '2')))
+_CONTEXT_CACHE_LOCK = Lock()
+_ROW_QUEUE_SIZE = 1024
+_ROW_QUEUE_TIMEOUT = 0.5
+_END_OF_GRID = object()
 
 
 _MEMDUMP_MAGICS = (
@@ -39,8 +48,7 @@ _MEMDUMP_MAGICS = (
 
 def is_memdump(filepath: Path):
     """Determine if filepath is a PCAP"""
-    with filepath.open('rb') as fobj:
-        return fobj.read(4) in _MEMDUMP_MAGICS
+    return has_magic(filepath, _MEMDUMP_MAGICS)
 
 
 def select_memdump_impl(directory: Path) -> PathIterator:
@@ -106,11 +114,16 @@ def _invalid(val):
     )
 
 
-def _visitor(
-    node: 'volatility3.framework.interfaces.renderers.TreeNode',
-    accumulator,
-    columns,
-):
+def _default_renderer(val) -> str:
+    return f'{val}'
+
+
+def _grid_renderer(columns):
+    """Build a function converting grid nodes to rows
+
+    Renderer of each column is resolved once per grid instead of once per
+    node.
+    """
     renderers = lazy_framework.renderers
     renderer_strategy = {
         renderers.format_hints.Bin: lambda val: (
@@ -123,12 +136,83 @@ def _visitor(
         renderers.format_hints.MultiTypeData: _multitypedata_as_text,
         datetime: lambda val: None if _invalid(val) else val.isoformat(),
     }
-    row = {'TreeDepth': str(max(0, node.path_depth - 1))}
-    for column_index, column in enumerate(columns):
-        renderer = renderer_strategy.get(column.type, lambda val: f'{val}')
-        row[f'{column.name}'] = renderer(node.values[column_index])
-    accumulator.append(row)
-    return accumulator
+    column_renderers = [
+        (
+            f'{column.name}',
+            renderer_strategy.get(column.type, _default_renderer),
+        )
+        for column in columns
+    ]
+
+    def _render(
+        node: 'volatility3.framework.interfaces.renderers.TreeNode',
+    ) -> dict:
+        row = {'TreeDepth': str(max(0, node.path_depth - 1))}
+        for (name, renderer), value in zip(column_renderers, node.values):
+            row[name] = renderer(value)
+        return row
+
+    return _render
+
+
+class _StreamCancelled(Exception):
+    """Raised in plugin thread when rows consumer is gone"""
+
+
+def _put_row(rows: Queue, row, cancelled: Event):
+    while not cancelled.is_set():
+        try:
+            rows.put(row, timeout=_ROW_QUEUE_TIMEOUT)
+            return
+        except Full:
+            continue
+    raise _StreamCancelled
+
+
+def _populate_routine(grid, rows: Queue, cancelled: Event, failure: list):
+    render = _grid_renderer(grid.columns)
+    try:
+        grid.populate(
+            function=lambda node, _: _put_row(rows, render(node), cancelled),
+            initial_accumulator=None,
+        )
+    except _StreamCancelled:
+        return
+    except Exception as exc:
+        failure.append(exc)
+    try:
+        _put_row(rows, _END_OF_GRID, cancelled)
+    except _StreamCancelled:
+        pass
+
+
+def _stream_grid(grid) -> Iterator[dict]:
+    """Yield grid rows while plugin thread populates the grid
+
+    At most _ROW_QUEUE_SIZE rendered rows are buffered, plugin exceptions
+    are raised in the caller thread.
+    """
+    rows = Queue(maxsize=_ROW_QUEUE_SIZE)
+    cancelled = Event()
+    failure = []
+    thread = Thread(
+        target=_populate_routine,
+        args=(grid, rows, cancelled, failure),
+        name='vol3-grid',
+        daemon=True,
+    )
+    thread.start()
+    try:
+        while True:
+            row = rows.get()
+            if row is _END_OF_GRID:
+                break
+            yield row
+    finally:
+        cancelled.set()
+        thread.join()
+    if failure:
+        raise failure[0]
 
 
 def _log_unsatisfied_exception(exc):
@@ -302,57 +386,160 @@ def setup_volatility3_framework():
             )
 
 
-def _create_context(memdump: Path, plugin_name: str, plugin_config: dict):
+@dataclass(kw_only=True)
+class _MemdumpContext:
+    """Volatility3 context shared by plugins running on the same memdump
+
+    Layers stacked and symbol tables loaded by automagic for a plugin are
+    kept in ctx, their configuration is stored in resolved by plugin
+    namespace, requirement class and name and spliced into the
+    configuration of later plugins so that automagic finds these
+    requirements already satisfied. Plugins hold lock from construction
+    until their grid is populated.
+    """
+
+    ctx: Any
+    lock: Lock = field(default_factory=Lock)
+    resolved: dict[tuple[str, type, str], tuple[Any, dict]] = field(
+        default_factory=dict
+    )
+
+
+def _memdump_context(memdump: Path) -> _MemdumpContext:
     contexts = lazy_framework.contexts
+    requirements = lazy_framework.configuration.requirements
+    stat = memdump.stat()
+    key = (str(memdump.resolve()), stat.st_size, stat.st_mtime_ns)
+    with _CONTEXT_CACHE_LOCK:
+        memdump_ctx = _CONTEXT_CACHE.get(key)
+        if memdump_ctx is not None:
+            return memdump_ctx
+        ctx = contexts.Context()
+        try:
+            location = requirements.URIRequirement.location_from_file(
+                str(memdump)
+            )
+            ctx.config['automagic.LayerStacker.single_location'] = location
+        except ValueError:
+            _LOGGER.exception("failed to load single location")
+        memdump_ctx = _MemdumpContext(ctx=ctx)
+        _CONTEXT_CACHE.put(key, memdump_ctx)
+    return memdump_ctx
+
+
+def _shared_requirements(plugin, plugin_name: str) -> Iterator:
+    """Yield key and requirement for requirements shareable across plugins
+
+    Plugins of distinct operating systems declare requirements sharing
+    class and name (kernel module), key includes plugin namespace.
+    """
+    namespace = plugin_name.split('.', 1)[0]
+    requirements = lazy_framework.configuration.requirements
+    shareable = (
+        requirements.TranslationLayerRequirement,
+        requirements.SymbolTableRequirement,
+        requirements.ModuleRequirement,
+    )
+    for requirement in plugin.get_requirements():
+        if isinstance(requirement, shareable):
+            key = (namespace, type(requirement), requirement.name)
+            yield key, requirement
+
+
+def _splice_resolved(
+    memdump_ctx: _MemdumpContext,
+    plugin,
+    plugin_name: str,
+    plugin_config_path: str,
+):
+    path_join = lazy_framework.interfaces.configuration.path_join
+    config = memdump_ctx.ctx.config
+    for key, requirement in _shared_requirements(plugin, plugin_name):
+        resolved = memdump_ctx.resolved.get(key)
+        if resolved is None:
+            continue
+        path = path_join(plugin_config_path, requirement.name)
+        value, values = resolved
+        if value is not None:
+            config[path] = value
+        for subkey, subvalue in values.items():
+            config[path_join(path, subkey)] = subvalue
+
+
+def _store_resolved(
+    memdump_ctx: _MemdumpContext,
+    plugin,
+    plugin_name: str,
+    plugin_config_path: str,
+):
+    path_join = lazy_framework.interfaces.configuration.path_join
+    config = memdump_ctx.ctx.config
+    for key, requirement in _shared_requirements(plugin, plugin_name):
+        if key in memdump_ctx.resolved:
+            continue
+        if requirement.unsatisfied(memdump_ctx.ctx, plugin_config_path):
+            continue
+        path = path_join(plugin_config_path, requirement.name)
+        branch = config.branch(path)
+        memdump_ctx.resolved[key] = (
+            config.get(path),
+            {subkey: branch[subkey] for subkey in branch},
+        )
+
+
+def _construct_plugin(
+    memdump_ctx: _MemdumpContext, plugin_name: str, plugin_config: dict
+):
+    """Construct plugin on shared context, caller holds memdump_ctx.lock"""
     automagic = lazy_framework.automagic
     interfaces = lazy_framework.interfaces
-    requirements = lazy_framework.configuration.requirements
+    exceptions = lazy_framework.exceptions
     choose_os_stackers = lazy_stacker.choose_os_stackers
     plugin_list = lazy_framework.list_plugins()
     plugin = plugin_list[plugin_name]
-    ctx = contexts.Context()
-    automagics = automagic.available(ctx)
+    ctx = memdump_ctx.ctx
     plugin_config_path = interfaces.configuration.path_join(
         _BASE_CONFIG_PATH, plugin.__name__
     )
     for key, val in plugin_config.items():
         ctx.config[f'{plugin_config_path}.{key}'] = val
+    _splice_resolved(memdump_ctx, plugin, plugin_name, plugin_config_path)
+    automagics = automagic.choose_automagic(automagic.available(ctx), plugin)
+    # shared context, stackers of previous plugin may target another os
+    ctx.config['automagic.LayerStacker.stackers'] = choose_os_stackers(plugin)
     try:
-        location = requirements.URIRequirement.location_from_file(str(memdump))
-        ctx.config['automagic.LayerStacker.single_location'] = location
-    except ValueError:
-        _LOGGER.exception("failed to load single location")
-    automagics = automagic.choose_automagic(automagics, plugin)
-    if ctx.config.get('automagic.LayerStacker.stackers', None) is None:
-        ctx.config['automagic.LayerStacker.stackers'] = choose_os_stackers(
-            plugin
+        constructed = lazy_framework.plugins.construct_plugin(
+            ctx, automagics, plugin, _BASE_CONFIG_PATH, None, None
         )
-    return ctx, automagics, plugin
+    except exceptions.UnsatisfiedException as exc:
+        _log_unsatisfied_exception(exc)
+        return None
+    _store_resolved(memdump_ctx, plugin, plugin_name, plugin_config_path)
+    return constructed
 
 
 def run_volatility3_plugin(
     memdump: Path, plugin_name: str, plugin_config: dict | None = None
 ) -> Iterator[dict]:
-    """Configure, construct and run volatility3 plugin on given memdump"""
+    """Configure, construct and run volatility3 plugin on given memdump
+
+    Volatility3 context of memdump is cached (see
+    PLASMA_VOL_CONTEXT_CACHE_SIZE) and reused by subsequent plugins.
+    Plugins sharing a context run one at a time.
+    """
     exceptions = lazy_framework.exceptions
-    ctx, automagics, plugin = _create_context(
-        memdump, plugin_name, plugin_config or {}
-    )
-    constructed = None
-    try:
-        constructed = lazy_framework.plugins.construct_plugin(
-            ctx, automagics, plugin, _BASE_CONFIG_PATH, None, None
+    memdump_ctx = _memdump_context(memdump)
+    # automagic, plugin run and grid population read and mutate layers and
+    # configuration of the shared context
+    with memdump_ctx.lock:
+        constructed = _construct_plugin(
+            memdump_ctx, plugin_name, plugin_config or {}
         )
-    except exceptions.UnsatisfiedException as exc:
-        _log_unsatisfied_exception(exc)
-    if not constructed:
-        return
-    try:
-        grid = constructed.run()
-    except exceptions.VolatilityException as exc:
-        _log_exception(exc)
-    function = partial(_visitor, columns=grid.columns)
-    accumulator = grid.visit(
-        node=None, function=function, initial_accumulator=[]
-    )
-    yield from accumulator
+        if not constructed:
+            return
+        try:
+            grid = constructed.run()
+        except exceptions.VolatilityException as exc:
+            _log_exception(exc)
+            return
+        yield from _stream_grid(grid)
@@ -1,34 +1 @@
 """Plasma Linux Memory Dissectors"""
-
-from ..helper import VOLATILITY3_AVAILABLE
-
-if VOLATILITY3_AVAILABLE:
-    from . import (
-        banners,
-        bash,
-        boottime,
-        callstack,
-        check_ftrace,
-        check_idt,
-        check_netfilter,
-        check_syscall,
-        check_tracepoint,
-        check_tty,
-        elfs,
-        envars,
-        ip_link,
-        kmsg,
-        kthreads,
-        liblist,
-        lsmod,
-        lsof,
-        modxview,
-        mount,
-        proc_maps,
-        ps_aux,
-        ps_list,
-        ps_pht,
-        ps_scan,
-        sockstat,
-        vmcore,
-    )
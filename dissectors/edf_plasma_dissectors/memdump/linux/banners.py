@@ -32,7 +32,7 @@ DISSECTOR = Dissector(
     slug='memdump_linux_banners',
     tags={Tag.MEMDUMP, Tag.LINUX},
     columns=[
-        Column('offset', DataType.INT),
+        Column('offset', DataType.UINT),
         Column('banner', DataType.STR),
     ],
     description="Linux banners from memory dump",
@@ -41,7 +41,7 @@ DISSECTOR = Dissector(
         Column('process', DataType.STR),
         Column('tid', DataType.INT),
         Column('position', DataType.INT),
-        Column('sp_addr', DataType.INT),
+        Column('sp_addr', DataType.UINT),
         Column('module', DataType.STR),
         Column('name', DataType.STR),
         Column('type', DataType.STR),
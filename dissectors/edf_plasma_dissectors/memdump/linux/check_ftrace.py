@@ -37,11 +37,11 @@ DISSECTOR = Dissector(
     tags={Tag.MEMDUMP, Tag.LINUX},
     columns=[
         Column('cb_name', DataType.STR),
-        Column('cb_address', DataType.INT),
+        Column('cb_address', DataType.UINT),
         Column('hooked_symbols', DataType.STR),
         Column('module', DataType.STR),
-        Column('module_addr', DataType.INT),
-        Column('ftrace_ops_addr', DataType.INT),
+        Column('module_addr', DataType.UINT),
+        Column('ftrace_ops_addr', DataType.UINT),
     ],
     description="Linux check ftrace from memory dump",
     select_impl=select_memdump_impl,
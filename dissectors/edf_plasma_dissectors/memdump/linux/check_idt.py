@@ -34,7 +34,7 @@ DISSECTOR = Dissector(
     slug='memdump_linux_check_idt',
     tags={Tag.MEMDUMP, Tag.LINUX},
     columns=[
-        Column('address', DataType.INT),
+        Column('address', DataType.UINT),
         Column('index', DataType.INT),
         Column('module', DataType.STR),
         Column('symbol', DataType.STR),
@@ -38,7 +38,7 @@ DISSECTOR = Dissector(
     slug='memdump_linux_check_nf',
     tags={Tag.MEMDUMP, Tag.LINUX},
     columns=[
-        Column('handler_addr', DataType.INT),
+        Column('handler_addr', DataType.UINT),
         Column('hook', DataType.STR),
         Column('is_hooked', DataType.BOOL),
         Column('module', DataType.STR),
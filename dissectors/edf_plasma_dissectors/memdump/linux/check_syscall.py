@@ -35,10 +35,10 @@ DISSECTOR = Dissector(
     slug='memdump_linux_check_syscall',
     tags={Tag.MEMDUMP, Tag.LINUX},
     columns=[
-        Column('handler_addr', DataType.INT),
+        Column('handler_addr', DataType.UINT),
         Column('handler_symbol', DataType.STR),
         Column('index', DataType.INT),
-        Column('table_addr', DataType.INT),
+        Column('table_addr', DataType.UINT),
         Column('table_name', DataType.STR),
     ],
     description="Linux check syscall from memory dump",
@@ -38,12 +38,12 @@ DISSECTOR = Dissector(
     tags={Tag.MEMDUMP, Tag.LINUX},
     columns=[
         Column('module', DataType.STR),
-        Column('module_addr', DataType.INT),
+        Column('module_addr', DataType.UINT),
         Column('probe', DataType.STR),
-        Column('probe_addr', DataType.INT),
+        Column('probe_addr', DataType.UINT),
         Column('probe_priority', DataType.INT),
         Column('tracepoint', DataType.STR),
-        Column('tracepoint_addr', DataType.INT),
+        Column('tracepoint_addr', DataType.UINT),
     ],
     description="Linux check tracepoints from memory dump",
     select_impl=select_memdump_impl,
@@ -34,7 +34,7 @@ DISSECTOR = Dissector(
     slug='memdump_linux_check_tty',
     tags={Tag.MEMDUMP, Tag.LINUX},
     columns=[
-        Column('address', DataType.INT),
+        Column('address', DataType.UINT),
         Column('module', DataType.STR),
         Column('name', DataType.STR),
         Column('symbol', DataType.STR),
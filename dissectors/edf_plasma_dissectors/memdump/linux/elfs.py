@@ -38,8 +38,8 @@ DISSECTOR = Dissector(
         Column('pid', DataType.INT),
         Column('process', DataType.STR),
         Column('filepath', DataType.STR),
-        Column('vm_start', DataType.INT),
-        Column('vm_end', DataType.INT),
+        Column('vm_start', DataType.UINT),
+        Column('vm_end', DataType.UINT),
     ],
     description="Linux elfs from memory dump",
     select_impl=select_memdump_impl,
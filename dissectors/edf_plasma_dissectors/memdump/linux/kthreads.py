@@ -37,7 +37,7 @@ DISSECTOR = Dissector(
     columns=[
         Column('module', DataType.STR),
         Column('symbol', DataType.STR),
-        Column('handler_addr', DataType.INT),
+        Column('handler_addr', DataType.UINT),
         Column('tid', DataType.INT),
         Column('tname', DataType.STR),
     ],
@@ -36,7 +36,7 @@ DISSECTOR = Dissector(
     columns=[
         Column('pid', DataType.INT),
         Column('process', DataType.STR),
-        Column('address', DataType.INT),
+        Column('address', DataType.UINT),
         Column('filepath', DataType.STR),
     ],
     description="Linux library list from memory dump",
@@ -36,7 +36,7 @@ DISSECTOR = Dissector(
     tags={Tag.MEMDUMP, Tag.LINUX},
     columns=[
         Column('code_size', DataType.INT),
-        Column('offset', DataType.INT),
+        Column('offset', DataType.UINT),
         Column('module', DataType.STR),
         Column('arguments', DataType.STR),
         Column('taints', DataType.STR),
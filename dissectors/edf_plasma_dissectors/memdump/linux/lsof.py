@@ -47,7 +47,7 @@ DISSECTOR = Dissector(
         Column('process', DataType.STR),
         Column('tid', DataType.INT),
         Column('fd', DataType.INT),
-        Column('inode', DataType.INT),
+        Column('inode', DataType.UINT),
         Column('modified', DataType.STR),
         Column('accessed', DataType.STR),
         Column('changed', DataType.STR),
@@ -43,13 +43,13 @@ DISSECTOR = Dissector(
         Column('pid', DataType.INT),
         Column('process', DataType.STR),
         Column('flags', DataType.STR),
-        Column('inode', DataType.INT),
+        Column('inode', DataType.UINT),
         Column('filepath', DataType.STR),
         Column('sb_major', DataType.INT),
         Column('sb_minor', DataType.INT),
-        Column('page_offset', DataType.INT),
-        Column('vm_start', DataType.INT),
-        Column('vm_end', DataType.INT),
+        Column('page_offset', DataType.UINT),
+        Column('vm_start', DataType.UINT),
+        Column('vm_end', DataType.UINT),
     ],
     description="Linux processes maps from memory dump",
     select_impl=select_memdump_impl,
@@ -40,7 +40,7 @@ DISSECTOR = Dissector(
     slug='memdump_linux_ps_list',
     tags={Tag.MEMDUMP, Tag.LINUX},
     columns=[
-        Column('virt_offset', DataType.INT),
+        Column('virt_offset', DataType.UINT),
         Column('pid', DataType.INT),
         Column('tid', DataType.INT),
         Column('ppid', DataType.INT),
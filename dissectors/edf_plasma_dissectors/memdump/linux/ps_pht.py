@@ -39,7 +39,7 @@ DISSECTOR = Dissector(
         Column('ppid', DataType.INT),
         Column('tid', DataType.INT),
         Column('process', DataType.STR),
-        Column('offset', DataType.INT),
+        Column('offset', DataType.UINT),
     ],
     description="Linux processes (PID hash table) from memory dump",
     select_impl=select_memdump_impl,
@@ -41,7 +41,7 @@ DISSECTOR = Dissector(
         Column('tid', DataType.INT),
         Column('process', DataType.STR),
         Column('exit_state', DataType.STR),
-        Column('phys_offset', DataType.INT),
+        Column('phys_offset', DataType.UINT),
     ],
     description="Linux processes (carved) from memory dump",
     select_impl=select_memdump_impl,
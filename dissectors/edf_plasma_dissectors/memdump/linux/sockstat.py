@@ -59,7 +59,7 @@ DISSECTOR = Dissector(
         Column('fd', DataType.INT),
         Column('filter', DataType.STR),
         Column('net_ns', DataType.INT),
-        Column('sock_offset', DataType.INT),
+        Column('sock_offset', DataType.UINT),
     ],
     description="Linux network connections from memory dump",
     select_impl=select_memdump_impl,
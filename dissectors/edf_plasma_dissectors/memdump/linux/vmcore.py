@@ -33,7 +33,7 @@ DISSECTOR = Dissector(
     slug='memdump_linux_vmcore',
     tags={Tag.MEMDUMP, Tag.LINUX},
     columns=[
-        Column('offset', DataType.INT),
+        Column('offset', DataType.UINT),
         Column('key', DataType.STR),
         Column('value', DataType.STR),
     ],
@@ -1,50 +1 @@
 """Plasma Windows Memory Dissectors"""
-
-from ..helper import VOLATILITY3_AVAILABLE
-
-if VOLATILITY3_AVAILABLE:
-    from . import (
-        amcache,
-        callbacks,
-        certs,
-        check_drv,
-        check_lib,
-        check_ntdll,
-        check_skl_key,
-        cmdline,
-        drv_irp,
-        drv_scan,
-        envars,
-        file_scan,
-        handles,
-        hives,
-        iat,
-        info,
-        kpcrs,
-        liblist,
-        mod_list,
-        mod_list_unloaded,
-        mod_scan,
-        mutant,
-        netstat,
-        pe_version,
-        privs,
-        proc_maps,
-        ps_list,
-        ps_scan,
-        ps_xview,
-        schtasks,
-        sessions,
-        shimcache,
-        sids,
-        ssdt,
-        svc_list,
-        svc_scan,
-        svc_sids,
-        symlinks,
-        thrd_list,
-        thrd_scan,
-        timers,
-        virtmap,
-        winstations,
-    )
@@ -38,7 +38,7 @@ DISSECTOR = Dissector(
         Column('driver_name', DataType.STR),
         Column('alt_name', DataType.STR),
         Column('kown_exc', DataType.BOOL),
-        Column('offset', DataType.INT),
+        Column('offset', DataType.UINT),
         Column('service_key', DataType.STR),
     ],
     description="Windows check drivers from memory dump",
@@ -39,7 +39,7 @@ DISSECTOR = Dissector(
     columns=[
         Column('pid', DataType.INT),
         Column('process', DataType.STR),
-        Column('base', DataType.INT),
+        Column('base', DataType.UINT),
         Column('in_init', DataType.BOOL),
         Column('in_load', DataType.BOOL),
         Column('in_mem', DataType.BOOL),
@@ -37,10 +37,10 @@ DISSECTOR = Dissector(
     tags={Tag.MEMDUMP, Tag.WINDOWS},
     columns=[
         Column('driver_name', DataType.STR),
-        Column('address', DataType.INT),
+        Column('address', DataType.UINT),
         Column('irp', DataType.STR),
         Column('module', DataType.STR),
-        Column('offset', DataType.INT),
+        Column('offset', DataType.UINT),
         Column('symbol', DataType.STR),
     ],
     description="Windows driver IRP from memory dump",
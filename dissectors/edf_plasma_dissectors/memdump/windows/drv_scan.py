@@ -38,7 +38,7 @@ DISSECTOR = Dissector(
     columns=[
         Column('driver_name', DataType.STR),
         Column('name', DataType.STR),
-        Column('offset', DataType.INT),
+        Column('offset', DataType.UINT),
         Column('service_key', DataType.STR),
         Column('size', DataType.INT),
         Column('start', DataType.INT),
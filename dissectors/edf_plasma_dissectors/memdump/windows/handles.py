@@ -43,7 +43,7 @@ DISSECTOR = Dissector(
         Column('granted_access', DataType.INT),
         Column('type', DataType.STR),
         Column('value', DataType.INT),
-        Column('offset', DataType.INT),
+        Column('offset', DataType.UINT),
     ],
     description="Windows handles from memory dump",
     select_impl=select_memdump_impl,
@@ -30,7 +30,7 @@ DISSECTOR = Dissector(
     tags={Tag.MEMDUMP, Tag.WINDOWS},
     columns=[
         Column('filefullpath', DataType.STR),
-        Column('offset', DataType.INT),
+        Column('offset', DataType.UINT),
     ],
     description="Windows hives from memory dump",
     select_impl=select_memdump_impl,
@@ -38,7 +38,7 @@ DISSECTOR = Dissector(
     columns=[
         Column('pid', DataType.STR),
         Column('process', DataType.STR),
-        Column('address', DataType.INT),
+        Column('address', DataType.UINT),
         Column('bound', DataType.BOOL),
         Column('function', DataType.STR),
         Column('library', DataType.STR),
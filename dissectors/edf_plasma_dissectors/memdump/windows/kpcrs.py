@@ -29,8 +29,8 @@ DISSECTOR = Dissector(
     slug='memdump_windows_kpcrs',
     tags={Tag.MEMDUMP, Tag.WINDOWS},
     columns=[
-        Column('offset', DataType.INT),
-        Column('prcb_offset', DataType.INT),
+        Column('offset', DataType.UINT),
+        Column('prcb_offset', DataType.UINT),
     ],
     description="Windows KPCRs from memory dump",
     select_impl=select_memdump_impl,
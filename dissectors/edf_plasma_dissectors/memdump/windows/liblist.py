@@ -39,7 +39,7 @@ DISSECTOR = Dissector(
     columns=[
         Column('pid', DataType.INT),
         Column('process', DataType.STR),
-        Column('base', DataType.INT),
+        Column('base', DataType.UINT),
         Column('load_time', DataType.STR),
         Column('filename', DataType.STR),
         Column('filepath', DataType.STR),
@@ -35,8 +35,8 @@ DISSECTOR = Dissector(
     tags={Tag.MEMDUMP, Tag.WINDOWS},
     columns=[
         Column('name', DataType.STR),
-        Column('start_addr', DataType.INT),
-        Column('end_addr', DataType.INT),
+        Column('start_addr', DataType.UINT),
+        Column('end_addr', DataType.UINT),
         Column('time', DataType.STR),
     ],
     description="Windows unloaded modules from memory dump",
@@ -36,8 +36,8 @@ DISSECTOR = Dissector(
     tags={Tag.MEMDUMP, Tag.WINDOWS},
     columns=[
         Column('name', DataType.STR),
-        Column('base', DataType.INT),
-        Column('offset', DataType.INT),
+        Column('base', DataType.UINT),
+        Column('offset', DataType.UINT),
         Column('path', DataType.STR),
         Column('size', DataType.INT),
     ],
@@ -28,7 +28,7 @@ def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
 DISSECTOR = Dissector(
     slug='memdump_windows_mutant',
     tags={Tag.MEMDUMP, Tag.WINDOWS},
-    columns=[Column('name', DataType.STR), Column('offset', DataType.INT)],
+    columns=[Column('name', DataType.STR), Column('offset', DataType.UINT)],
     description="Windows mutant from memory dump",
     select_impl=select_memdump_impl,
     dissect_impl=_dissect_impl,
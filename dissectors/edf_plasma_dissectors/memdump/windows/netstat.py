@@ -47,7 +47,7 @@ DISSECTOR = Dissector(
         Column('dst_addr', DataType.STR),
         Column('dst_port', DataType.INT),
         Column('created', DataType.STR),
-        Column('offset', DataType.INT),
+        Column('offset', DataType.UINT),
         Column('proto', DataType.STR),
         Column('state', DataType.STR),
     ],
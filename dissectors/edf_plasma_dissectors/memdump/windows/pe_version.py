@@ -40,7 +40,7 @@ DISSECTOR = Dissector(
     columns=[
         Column('pid', DataType.STR),
         Column('process', DataType.STR),
-        Column('base', DataType.INT),
+        Column('base', DataType.UINT),
         Column('name', DataType.STR),
         Column('major', DataType.STR),
         Column('minor', DataType.STR),
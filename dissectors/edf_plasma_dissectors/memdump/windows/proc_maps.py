@@ -43,7 +43,7 @@ DISSECTOR = Dissector(
     columns=[
         Column('pid', DataType.INT),
         Column('process', DataType.STR),
-        Column('offset', DataType.INT),
+        Column('offset', DataType.UINT),
         Column('start_vpn', DataType.INT),
         Column('end_vpn', DataType.INT),
         Column('tag', DataType.STR),
@@ -46,7 +46,7 @@ DISSECTOR = Dissector(
         Column('create_time', DataType.STR),
         Column('exit_time', DataType.STR),
         Column('handles', DataType.STR),
-        Column('virt_offset', DataType.INT),
+        Column('virt_offset', DataType.UINT),
         Column('session_id', DataType.STR),
         Column('threads', DataType.INT),
         Column('wow64', DataType.BOOL),
@@ -41,7 +41,7 @@ DISSECTOR = Dissector(
         Column('pid', DataType.INT),
         Column('process', DataType.STR),
         Column('exit_time', DataType.STR),
-        Column('virt_offset', DataType.INT),
+        Column('virt_offset', DataType.UINT),
         Column('in_csrss', DataType.BOOL),
         Column('in_ps_list', DataType.BOOL),
         Column('in_ps_scan', DataType.BOOL),
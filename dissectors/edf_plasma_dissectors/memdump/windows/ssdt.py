@@ -34,7 +34,7 @@ DISSECTOR = Dissector(
     slug='memdump_windows_ssdt',
     tags={Tag.MEMDUMP, Tag.WINDOWS},
     columns=[
-        Column('address', DataType.INT),
+        Column('address', DataType.UINT),
         Column('index', DataType.INT),
         Column('module', DataType.STR),
         Column('symbol', DataType.STR),
@@ -46,7 +46,7 @@ DISSECTOR = Dissector(
         Column('display', DataType.STR),
         Column('dll', DataType.STR),
         Column('name', DataType.STR),
-        Column('offset', DataType.INT),
+        Column('offset', DataType.UINT),
         Column('order', DataType.INT),
         Column('pid', DataType.INT),
         Column('start', DataType.STR),
@@ -35,7 +35,7 @@ DISSECTOR = Dissector(
     tags={Tag.MEMDUMP, Tag.WINDOWS},
     columns=[
         Column('create_time', DataType.STR),
-        Column('offset', DataType.INT),
+        Column('offset', DataType.UINT),
         Column('from_name', DataType.STR),
         Column('to_name', DataType.STR),
     ],
@@ -43,8 +43,8 @@ DISSECTOR = Dissector(
         Column('tid', DataType.INT),
         Column('create_time', DataType.STR),
         Column('exit_time', DataType.STR),
-        Column('offset', DataType.INT),
-        Column('start_addr', DataType.INT),
+        Column('offset', DataType.UINT),
+        Column('start_addr', DataType.UINT),
         Column('start_path', DataType.STR),
         Column('win32_start_addr', DataType.INT),
         Column('win32_start_path', DataType.STR),
@@ -39,7 +39,7 @@ DISSECTOR = Dissector(
     columns=[
         Column('due_time', DataType.STR),
         Column('module', DataType.STR),
-        Column('offset', DataType.INT),
+        Column('offset', DataType.UINT),
         Column('period_ms', DataType.INT),
         Column('routine', DataType.INT),
         Column('signaled', DataType.STR),
@@ -34,8 +34,8 @@ DISSECTOR = Dissector(
     tags={Tag.MEMDUMP, Tag.WINDOWS},
     columns=[
         Column('region', DataType.STR),
-        Column('start_offset', DataType.INT),
-        Column('end_offset', DataType.INT),
+        Column('start_offset', DataType.UINT),
+        Column('end_offset', DataType.UINT),
     ],
     description="Windows virtual map from memory dump",
     select_impl=select_memdump_impl,
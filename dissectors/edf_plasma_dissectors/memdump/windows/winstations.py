@@ -34,7 +34,7 @@ DISSECTOR = Dissector(
     tags={Tag.MEMDUMP, Tag.WINDOWS},
     columns=[
         Column('name', DataType.STR),
-        Column('offset', DataType.INT),
+        Column('offset', DataType.UINT),
         Column('session_id', DataType.INT),
     ],
     description="Windows window stations (carved) from memory dump",
@@ -1,16 +1 @@
 """PCAP-related dissectors"""
-
-from .helper import SCAPY_AVAILABLE
-
-if SCAPY_AVAILABLE:
-    from . import (
-        dns_answers,
-        dns_queries,
-        http_requests,
-        protocol_stats,
-        tcp_conversations,
-        tls_certificate,
-        tls_client_hello,
-        tls_server_hello,
-        udp_conversations,
-    )
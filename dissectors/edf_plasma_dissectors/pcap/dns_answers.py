@@ -9,11 +9,14 @@ from edf_plasma_core.dissector import (
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import select_pcap_impl, stream_pcap_packets
+from .helper import PCAP_FAMILY, select_pcap_impl
 from .helper.decode import decode_utf8_string
 from .helper.dns import dns_layer, dns_type, has_dns
+from .helper.engine import PacketAnalyzer, dissect_pcap, register_analyzer
 from .helper.packet import pkt_base_record
 
+REQUIRES = ('scapy',)
+
 
 def _dissect_https(answer) -> RecordIterator:
     for svc_param in answer.svc_params:
@@ -40,16 +43,18 @@ _DISSECT_STRATEGY = {
 }
 
 
-def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
-    for pkt in stream_pcap_packets(ctx.filepath):
+class _DNSAnswersAnalyzer(PacketAnalyzer):
+    """DNS answers analyzer"""
+
+    def process(self, pkt: 'scapy.all.Packet') -> RecordIterator:
         if not has_dns(pkt):
-            continue
+            return
         layer = dns_layer(pkt)
         if not layer.qr or not layer.ancount:
-            continue
+            return
         record = pkt_base_record(pkt)
         if not record:
-            continue
+            return
         for answer in layer.an:
             dns_r_type = dns_type(answer.type)
             _dissect = _DISSECT_STRATEGY.get(dns_r_type, _dissect_default)
@@ -58,6 +63,10 @@ def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
                 yield record
 
 
+def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
+    yield from dissect_pcap(ctx)
+
+
 DISSECTOR = Dissector(
     slug='pcap_dns_answers',
     tags={Tag.PCAP},
@@ -74,5 +83,7 @@ DISSECTOR = Dissector(
     description="DNS answers from PCAP",
     select_impl=select_pcap_impl,
     dissect_impl=_dissect_impl,
+    family=PCAP_FAMILY,
 )
+register_analyzer(DISSECTOR.slug, _DNSAnswersAnalyzer)
 register_dissector(DISSECTOR)
@@ -10,28 +10,35 @@ from edf_plasma_core.helper.logging import get_logger
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import select_pcap_impl, stream_pcap_packets
+from .helper import PCAP_FAMILY, select_pcap_impl
 from .helper.decode import decode_utf8_string
 from .helper.dns import dns_layer, dns_type, has_dns
+from .helper.engine import PacketAnalyzer, dissect_pcap, register_analyzer
 from .helper.packet import is_raw, pkt_base_record
 
+REQUIRES = ('scapy',)
 _LOGGER = get_logger('dissectors.pcap.dns_queries')
 
 
-def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
-    truncated = 0
-    for pkt in stream_pcap_packets(ctx.filepath):
+class _DNSQueriesAnalyzer(PacketAnalyzer):
+    """DNS queries analyzer"""
+
+    def __init__(self):
+        super().__init__()
+        self.truncated = 0
+
+    def process(self, pkt: 'scapy.all.Packet') -> RecordIterator:
         if not has_dns(pkt):
-            continue
+            return
         layer = dns_layer(pkt)
         if layer.qr or not layer.qdcount:
-            continue
+            return
         record = pkt_base_record(pkt)
         if not record:
-            continue
+            return
         for question in layer.qd:
             if is_raw(question):
-                truncated += 1
+                self.truncated += 1
                 continue
             record.update(
                 {
@@ -43,8 +50,15 @@ def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
                 }
             )
             yield record
-    if truncated:
-        ctx.register_error(f"skipped {truncated} truncated records")
+
+    def finish(self) -> RecordIterator:
+        if self.truncated:
+            self.register_error(f"skipped {self.truncated} truncated records")
+        yield from ()
+
+
+def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
+    yield from dissect_pcap(ctx)
 
 
 DISSECTOR = Dissector(
@@ -62,5 +76,7 @@ DISSECTOR = Dissector(
     description="DNS queries from PCAP",
     select_impl=select_pcap_impl,
     dissect_impl=_dissect_impl,
+    family=PCAP_FAMILY,
 )
+register_analyzer(DISSECTOR.slug, _DNSQueriesAnalyzer)
 register_dissector(DISSECTOR)
@@ -1,13 +1,15 @@
 """Conversation helpers"""
 
+from collections import OrderedDict
 from collections.abc import Iterator
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from socket import AF_INET, AF_INET6, inet_ntop
 
-from edf_plasma_core.helper.datetime import datetime, to_iso_fmt
+from edf_plasma_core.helper.datetime import to_iso_fmt
 
-from .packet import pkt_time
-from .tcp import tcp_data_len
-from .udp import has_udp, udp_data_len
+from .raw import RawPacket, time_from_ns
+
+_ADDRESS_FAMILY = {4: AF_INET, 6: AF_INET6}
 
 
 @dataclass
@@ -23,79 +25,126 @@ class UnidirectionalCounter:
         self.pkt_cnt += pkt_cnt
 
 
-@dataclass
-class BidirectionalCounter:
-    """A packet and bytes counter"""
-
-    sent: UnidirectionalCounter = field(default_factory=UnidirectionalCounter)
-    recv: UnidirectionalCounter = field(default_factory=UnidirectionalCounter)
-
-    @property
-    def pkt_total_cnt(self):
-        """Total count of exchanged packets"""
-        return self.sent.pkt_cnt + self.recv.pkt_cnt
-
-    @property
-    def data_bytes_total_cnt(self):
-        """Total count of exchanged data bytes"""
-        return self.sent.data_bytes_cnt + self.recv.data_bytes_cnt
-
-
-@dataclass(frozen=True, eq=True)
-class Peer:
-    """A peer described by it address and port"""
+FlowKey = tuple[tuple[bytes, int], tuple[bytes, int]]
 
-    addr: str
-    port: int
 
+def flow_key(pkt: RawPacket) -> FlowKey:
+    """Key of packet flow, the same for both directions"""
+    src = (pkt.src, pkt.sport)
+    dst = (pkt.dst, pkt.dport)
+    return (src, dst) if src <= dst else (dst, src)
 
-@dataclass(frozen=True, eq=True)
-class PeerPair:
-    """A pair of peers"""
 
-    src_peer: Peer
-    dst_peer: Peer
-
-    @property
-    def inverted(self) -> 'PeerPair':
-        """Inverted pair, src becomes dst and dst becomes src"""
-        return PeerPair(src_peer=self.dst_peer, dst_peer=self.src_peer)
-
-
-@dataclass
+@dataclass(slots=True)
 class Conversation:
-    """A conversation between two peers"""
-
-    peer_pair: PeerPair
-    beg_time: datetime | None = None
-    end_time: datetime | None = None
-    counter: BidirectionalCounter = field(default_factory=BidirectionalCounter)
+    """A conversation between two peers, src is the first peer seen"""
+
+    ip_version: int
+    src: bytes
+    sport: int
+    dst: bytes
+    dport: int
+    beg_time_ns: int
+    end_time_ns: int
+    pkt_sent: int = 0
+    pkt_recv: int = 0
+    data_bytes_sent: int = 0
+    data_bytes_recv: int = 0
+    fin_mask: int = 0
+
+    @classmethod
+    def from_packet(cls, pkt: RawPacket) -> 'Conversation':
+        """Build conversation initiated by packet"""
+        return cls(
+            ip_version=pkt.ip_version,
+            src=pkt.src,
+            sport=pkt.sport,
+            dst=pkt.dst,
+            dport=pkt.dport,
+            beg_time_ns=pkt.time_ns,
+            end_time_ns=pkt.time_ns,
+        )
+
+    def is_sent(self, pkt: RawPacket) -> bool:
+        """Determine if packet was sent by src peer"""
+        return pkt.sport == self.sport and pkt.src == self.src
 
     def as_record(self):
         """Record represenation for this instance"""
+        family = _ADDRESS_FAMILY[self.ip_version]
         return {
-            'src_ip': self.peer_pair.src_peer.addr,
-            'src_port': self.peer_pair.src_peer.port,
-            'dst_ip': self.peer_pair.dst_peer.addr,
-            'dst_port': self.peer_pair.dst_peer.port,
-            'beg_time': to_iso_fmt(self.beg_time),
-            'end_time': to_iso_fmt(self.end_time),
-            'pkt_sent': self.counter.sent.pkt_cnt,
-            'pkt_recv': self.counter.recv.pkt_cnt,
-            'data_bytes_sent': self.counter.sent.data_bytes_cnt,
-            'data_bytes_recv': self.counter.recv.data_bytes_cnt,
+            'src_ip': inet_ntop(family, self.src),
+            'src_port': self.sport,
+            'dst_ip': inet_ntop(family, self.dst),
+            'dst_port': self.dport,
+            'beg_time': to_iso_fmt(time_from_ns(self.beg_time_ns)),
+            'end_time': to_iso_fmt(time_from_ns(self.end_time_ns)),
+            'pkt_sent': self.pkt_sent,
+            'pkt_recv': self.pkt_recv,
+            'data_bytes_sent': self.data_bytes_sent,
+            'data_bytes_recv': self.data_bytes_recv,
         }
 
-    def append(self, peer_pair: PeerPair, pkt: 'scapy.all.Packet'):
+    def append(self, pkt: RawPacket):
         """Append packet to conversation"""
-        if not self.beg_time:
-            self.beg_time = pkt_time(pkt)
-        self.end_time = pkt_time(pkt)
-        bytes_count = udp_data_len(pkt) if has_udp(pkt) else tcp_data_len(pkt)
-        if peer_pair == self.peer_pair:
-            self.counter.sent.add(bytes_count)
+        self.end_time_ns = pkt.time_ns
+        if self.is_sent(pkt):
+            self.pkt_sent += 1
+            self.data_bytes_sent += pkt.payload_len
             return
-        self.counter.recv.add(bytes_count)
+        self.pkt_recv += 1
+        self.data_bytes_recv += pkt.payload_len
 
 
 ConversationIterator = Iterator[Conversation]
+
+
+class ConversationTable:
+    """Ongoing conversations ordered from least to most recently active
+
+    Table holds at most max_flows conversations, least recently active
+    conversations are evicted when it is full. Conversations inactive for
+    more than idle_timeout_ns are expired.
+    """
+
+    def __init__(self, max_flows: int, idle_timeout_ns: int):
+        self._flows = OrderedDict()
+        self._max_flows = max(1, max_flows)
+        self._idle_timeout_ns = idle_timeout_ns
+
+    def __len__(self):
+        return len(self._flows)
+
+    def get(self, key: FlowKey) -> Conversation | None:
+        """Retrieve conversation and mark it as recently active"""
+        conv = self._flows.get(key)
+        if conv is not None:
+            self._flows.move_to_end(key)
+        return conv
+
+    def pop(self, key: FlowKey) -> Conversation | None:
+        """Remove conversation from table"""
+        return self._flows.pop(key, None)
+
+    def add(self, key: FlowKey, conv: Conversation) -> ConversationIterator:
+        """Add conversation, yield conversations evicted to make room"""
+        flows = self._flows
+        flows[key] = conv
+        flows.move_to_end(key)
+        while len(flows) > self._max_flows:
+            yield flows.popitem(last=False)[1]
+
+    def expire(self, time_ns: int) -> ConversationIterator:
+        """Yield conversations idle at given time"""
+        flows = self._flows
+        while flows:
+            conv = next(iter(flows.values()))
+            if time_ns - conv.end_time_ns <= self._idle_timeout_ns:
+                break
+            flows.popitem(last=False)
+            yield conv
+
+    def drain(self) -> ConversationIterator:
+        """Yield and remove all conversations"""
+        while self._flows:
+            yield self._flows.popitem(last=False)[1]
@@ -0,0 +1,204 @@
+"""PCAP engine helper
+
+Dissectors of pcap family dissecting the same capture share a single
+decoding pass: the first one decodes every packet once and dispatches it to
+its packet analyzer and to the packet analyzers of the next dissectors of
+the family. Records of the next dissectors are spooled to temporary files
+until they dissect the capture.
+
+Packet headers are decoded with struct for raw analyzers, scapy packets are
+only built when at least one analyzer needs application layers.
+"""
+
+from decimal import Decimal
+from pickle import HIGHEST_PROTOCOL, dump, load
+from tempfile import TemporaryFile
+from threading import Lock
+
+from edf_plasma_core.dissector import DissectionContext, get_dissector_or_none
+from edf_plasma_core.helper.importing import load_lazy_modules
+from edf_plasma_core.helper.logging import get_logger
+from edf_plasma_core.helper.typing import RecordIterator
+
+from . import lazy_scapy
+from .raw import RawPacket, stream_raw_packets
+
+_LOGGER = get_logger('dissectors.pcap.helper.engine')
+_SPOOL_BATCH_SIZE = 1000
+_ANALYZERS = {}
+_SPOOLS = {}
+_SPOOLS_LOCK = Lock()
+
+
+class PacketAnalyzer:
+    """Packet analyzer of a pcap dissector
+
+    An instance analyzes packets of a single capture, records are yielded
+    while processing packets and once all packets are processed. Raw
+    analyzers process RawPacket instances instead of scapy packets.
+    """
+
+    raw = False
+
+    def __init__(self):
+        self.errors = []
+
+    def register_error(self, reason: str):
+        """Register error reported in dissection context"""
+        self.errors.append(reason)
+
+    def process(self, pkt: 'scapy.all.Packet | RawPacket') -> RecordIterator:
+        """Process packet"""
+        yield from ()
+
+    def finish(self) -> RecordIterator:
+        """Process end of capture"""
+        yield from ()
+
+
+def register_analyzer(slug: str, analyzer_cls: type[PacketAnalyzer]):
+    """Register packet analyzer of pcap dissector"""
+    _ANALYZERS[slug] = analyzer_cls
+
+
+class _RecordSpool:
+    """Records of a dissector buffered in a temporary file"""
+
+    def __init__(self):
+        self._fobj = TemporaryFile()
+        self._batch = []
+        self.errors = []
+
+    def _flush(self):
+        if self._batch:
+            dump(self._batch, self._fobj, HIGHEST_PROTOCOL)
+            self._batch = []
+
+    def append(self, record: dict):
+        """Append record to spool"""
+        # analyzers may yield the same record updated between yields
+        self._batch.append(dict(record))
+        if len(self._batch) >= _SPOOL_BATCH_SIZE:
+            self._flush()
+
+    def close(self):
+        """Close spool, discarding records"""
+        self._fobj.close()
+
+    def records(self) -> RecordIterator:
+        """Spooled records, spool is closed once consumed"""
+        try:
+            self._flush()
+            self._fobj.seek(0)
+            while True:
+                try:
+                    batch = load(self._fobj)
+                except EOFError:
+                    break
+                yield from batch
+        finally:
+            self.close()
+
+
+def _analyzers(slugs: list[str]) -> dict[str, PacketAnalyzer]:
+    analyzers = {}
+    for slug in slugs:
+        if slug not in _ANALYZERS:
+            # importing dissector module registers its analyzer
+            get_dissector_or_none(slug)
+        analyzer_cls = _ANALYZERS.get(slug)
+        if analyzer_cls is None:
+            _LOGGER.warning("pcap dissector without analyzer: %s", slug)
+            continue
+        analyzers[slug] = analyzer_cls()
+    return analyzers
+
+
+def _dispatch(
+    slug: str,
+    analyzer: PacketAnalyzer,
+    records: RecordIterator,
+    spools: dict[str, _RecordSpool],
+):
+    """Spool records of another dissector, dropping its analyzer on error"""
+    spool = spools[slug]
+    try:
+        for record in records:
+            spool.append(record)
+    except Exception:
+        _LOGGER.exception("packet analyzer exception: %s", slug)
+        spool.errors.append("unhandled exception, please create an issue!")
+        spool.errors.extend(analyzer.errors)
+        analyzer.errors = []
+        return False
+    return True
+
+
+def _scapy_packet(raw_pkt: RawPacket) -> 'scapy.all.Packet':
+    """Build scapy packet from raw packet as scapy PcapReader does"""
+    conf = lazy_scapy.conf
+    layer = conf.l2types.num2layer.get(raw_pkt.linktype, conf.raw_layer)
+    pkt = layer(raw_pkt.data)
+    pkt.time = Decimal(raw_pkt.time_ns).scaleb(-9)
+    return pkt
+
+
+def _needs_scapy(*analyzers: PacketAnalyzer) -> bool:
+    return any(not analyzer.raw for analyzer in analyzers)
+
+
+def _decode_capture(
+    ctx: DissectionContext,
+    analyzers: dict[str, PacketAnalyzer],
+    spools: dict[str, _RecordSpool],
+) -> RecordIterator:
+    """Decode capture once, yield records of ctx dissector"""
+    current = analyzers.pop(ctx.dissector)
+    needs_scapy = _needs_scapy(current, *analyzers.values())
+    if needs_scapy:
+        load_lazy_modules(lazy_scapy)
+    for raw_pkt in stream_raw_packets(ctx.filepath):
+        pkt = _scapy_packet(raw_pkt) if needs_scapy else None
+        yield from current.process(raw_pkt if current.raw else pkt)
+        for slug, analyzer in list(analyzers.items()):
+            records = analyzer.process(raw_pkt if analyzer.raw else pkt)
+            if not _dispatch(slug, analyzer, records, spools):
+                del analyzers[slug]
+                needs_scapy = _needs_scapy(current, *analyzers.values())
+    yield from current.finish()
+    for slug, analyzer in analyzers.items():
+        if _dispatch(slug, analyzer, analyzer.finish(), spools):
+            spools[slug].errors.extend(analyzer.errors)
+    for reason in current.errors:
+        ctx.register_error(reason)
+
+
+def dissect_pcap(ctx: DissectionContext) -> RecordIterator:
+    """Dissect capture using packet analyzer of ctx dissector
+
+    Records are read from spool if another dissector of the family already
+    decoded the capture. Otherwise capture is decoded for ctx dissector and
+    the next dissectors of the family.
+    """
+    key = (str(ctx.filepath), ctx.dissector)
+    with _SPOOLS_LOCK:
+        spool = _SPOOLS.pop(key, None)
+    if spool is not None:
+        yield from spool.records()
+        for reason in spool.errors:
+            ctx.register_error(reason)
+        return
+    family = ctx.family if ctx.dissector in ctx.family else [ctx.dissector]
+    analyzers = _analyzers(family[family.index(ctx.dissector) :])
+    spools = {
+        slug: _RecordSpool() for slug in analyzers if slug != ctx.dissector
+    }
+    try:
+        yield from _decode_capture(ctx, analyzers, spools)
+    except BaseException:
+        for spool in spools.values():
+            spool.close()
+        raise
+    with _SPOOLS_LOCK:
+        for slug, spool in spools.items():
+            _SPOOLS[(str(ctx.filepath), slug)] = spool
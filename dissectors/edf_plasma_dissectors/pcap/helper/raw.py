@@ -0,0 +1,344 @@
+"""Raw packet helper
+
+Reads pcap and pcapng records and decodes link, network and transport
+headers with struct, without building scapy packets.
+"""
+
+from collections.abc import Iterator
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from socket import AF_INET, AF_INET6, inet_ntop
+from struct import Struct, unpack_from
+
+from edf_plasma_core.helper.datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
+from edf_plasma_core.helper.logging import get_logger
+
+_LOGGER = get_logger('dissectors.pcap.helper.raw')
+NS_PER_SEC = 1000000000
+_PCAP_MAGICS = {
+    b'\xd4\xc3\xb2\xa1': ('<', 1000),
+    b'\xa1\xb2\xc3\xd4': ('>', 1000),
+    b'\x4d\x3c\xb2\xa1': ('<', 1),
+    b'\xa1\xb2\x3c\x4d': ('>', 1),
+}
+_PCAP_HEADER_SIZE = 24
+_PCAPNG_SHB = 0x0A0D0D0A
+_PCAPNG_BOM_LE = b'\x4d\x3c\x2b\x1a'
+_PCAPNG_IDB = 1
+_PCAPNG_OPB = 2
+_PCAPNG_SPB = 3
+_PCAPNG_EPB = 6
+_PCAPNG_IF_TSRESOL = 9
+_LINKTYPE_NULL = 0
+_LINKTYPE_ETHERNET = 1
+_LINKTYPE_RAW = 101
+_LINKTYPE_LOOP = 108
+_LINKTYPE_LINUX_SLL = 113
+_LINKTYPE_IPV4 = 228
+_LINKTYPE_IPV6 = 229
+_LINKTYPE_LINUX_SLL2 = 276
+_ETHERTYPE_VERSION = {0x0800: 4, 0x86DD: 6}
+_VLAN_ETHERTYPES = {0x8100, 0x88A8, 0x9100}
+_NULL_FAMILY_VERSION = {2: 4, 24: 6, 28: 6, 30: 6}
+_IPV6_EXT_HEADERS = {0, 43, 44, 60}
+_IPV6_FRAGMENT = 44
+_ADDRESS_FAMILY = {4: AF_INET, 6: AF_INET6}
+_UINT16 = Struct('!H')
+_IPV4_HEADER = Struct('!BBHHHBB')
+_IPV6_HEADER = Struct('!HB')
+_TCP_HEADER = Struct('!HHIIH')
+_UDP_HEADER = Struct('!HHH')
+_TCP_HEADER_SIZE = 20
+_UDP_HEADER_SIZE = 8
+
+PROTO_ICMP = 1
+PROTO_TCP = 6
+PROTO_UDP = 17
+
+
+def time_from_ns(time_ns: int) -> datetime:
+    """UTC datetime from nanoseconds since epoch, microsecond precision"""
+    seconds, nanoseconds = divmod(time_ns, NS_PER_SEC)
+    dtv = datetime.fromtimestamp(seconds, tz=timezone.utc)
+    return dtv + timedelta(microseconds=nanoseconds // 1000)
+
+
+class RawPacket:
+    """Captured packet with headers decoded without scapy
+
+    Addresses are kept as bytes, sport and dport are None unless a TCP or
+    UDP header was decoded. l4_len is the length of the transport segment
+    and payload_len the length of TCP or UDP payload.
+    """
+
+    __slots__ = (
+        'linktype',
+        'time_ns',
+        'data',
+        'ip_version',
+        'src',
+        'dst',
+        'proto',
+        'sport',
+        'dport',
+        'tcp_flags',
+        'l4_len',
+        'payload_len',
+    )
+
+    def __init__(self, linktype: int, time_ns: int, data: bytes):
+        self.linktype = linktype
+        self.time_ns = time_ns
+        self.data = data
+        self.ip_version = 0
+        self.src = b''
+        self.dst = b''
+        self.proto = 0
+        self.sport = None
+        self.dport = None
+        self.tcp_flags = 0
+        self.l4_len = 0
+        self.payload_len = 0
+
+    @property
+    def time(self) -> datetime:
+        """Capture time truncated to microseconds"""
+        return time_from_ns(self.time_ns)
+
+    @property
+    def src_addr(self) -> str:
+        """Source address string"""
+        return inet_ntop(_ADDRESS_FAMILY[self.ip_version], self.src)
+
+    @property
+    def dst_addr(self) -> str:
+        """Destination address string"""
+        return inet_ntop(_ADDRESS_FAMILY[self.ip_version], self.dst)
+
+    @property
+    def is_tcp(self) -> bool:
+        """Determine if a TCP header was decoded"""
+        return self.proto == PROTO_TCP and self.sport is not None
+
+    @property
+    def is_udp(self) -> bool:
+        """Determine if a UDP header was decoded"""
+        return self.proto == PROTO_UDP and self.sport is not None
+
+    @property
+    def is_icmp(self) -> bool:
+        """Determine if packet is an ICMP (v4) packet"""
+        return self.ip_version == 4 and self.proto == PROTO_ICMP
+
+
+RawPacketIterator = Iterator[RawPacket]
+
+
+def _pcap_records(buf, size: int):
+    endian, ns_factor = _PCAP_MAGICS[bytes(buf[:4])]
+    # upper bits of link type field carry FCS information
+    linktype = unpack_from(f'{endian}I', buf, 20)[0] & 0x0FFFFFFF
+    header = Struct(f'{endian}IIII')
+    offset = _PCAP_HEADER_SIZE
+    while offset + header.size <= size:
+        sec, frac, caplen, _ = header.unpack_from(buf, offset)
+        offset += header.size
+        end = offset + caplen
+        if end > size:
+            _LOGGER.warning("truncated pcap record at offset %d", offset)
+            break
+        yield linktype, sec * NS_PER_SEC + frac * ns_factor, buf[offset:end]
+        offset = end
+
+
+def _pcapng_tsresol(buf, endian: str, offset: int, end: int) -> int:
+    """Interface timestamp units per second"""
+    while offset + 4 <= end:
+        code, length = unpack_from(f'{endian}HH', buf, offset)
+        if code == 0:
+            break
+        if code == _PCAPNG_IF_TSRESOL and length >= 1:
+            value = buf[offset + 4]
+            if value & 0x80:
+                return 2 ** (value & 0x7F)
+            return 10**value
+        offset += 4 + ((length + 3) & ~3)
+    return 1000000
+
+
+def _pcapng_records(buf, size: int):
+    endian = '<'
+    interfaces = []
+    offset = 0
+    while offset + 12 <= size:
+        block_type = unpack_from(f'{endian}I', buf, offset)[0]
+        if block_type == _PCAPNG_SHB:
+            bom = bytes(buf[offset + 8 : offset + 12])
+            endian = '<' if bom == _PCAPNG_BOM_LE else '>'
+            interfaces = []
+        block_len = unpack_from(f'{endian}I', buf, offset + 4)[0]
+        if block_len < 12 or offset + block_len > size:
+            _LOGGER.warning("truncated pcapng block at offset %d", offset)
+            break
+        body = offset + 8
+        end = offset + block_len - 4
+        offset += block_len
+        if block_type == _PCAPNG_IDB:
+            linktype = unpack_from(f'{endian}H', buf, body)[0]
+            tsresol = _pcapng_tsresol(buf, endian, body + 8, end)
+            interfaces.append((linktype, tsresol))
+            continue
+        if block_type == _PCAPNG_EPB:
+            if_id, ts_hi, ts_lo, caplen, _ = unpack_from(
+                f'{endian}IIIII', buf, body
+            )
+            data_offset = body + 20
+        elif block_type == _PCAPNG_OPB:
+            if_id, _, ts_hi, ts_lo, caplen, _ = unpack_from(
+                f'{endian}HHIIII', buf, body
+            )
+            data_offset = body + 20
+        elif block_type == _PCAPNG_SPB:
+            if_id, ts_hi, ts_lo = 0, 0, 0
+            data_offset = body + 4
+            caplen = min(unpack_from(f'{endian}I', buf, body)[0], end - body)
+        else:
+            continue
+        if if_id >= len(interfaces):
+            continue
+        linktype, tsresol = interfaces[if_id]
+        timestamp = (ts_hi << 32) | ts_lo
+        yield (
+            linktype,
+            timestamp * NS_PER_SEC // tsresol,
+            buf[data_offset : min(data_offset + caplen, end)],
+        )
+
+
+def pcap_records(filepath: Path) -> Iterator[tuple[int, int, bytes]]:
+    """Link type, capture time in nanoseconds and data of each record"""
+    with filepath.open('rb') as fobj:
+        size = filepath.stat().st_size
+        if size < _PCAP_HEADER_SIZE:
+            return
+        with mmap(fobj.fileno(), 0, access=ACCESS_READ) as buf:
+            magic = bytes(buf[:4])
+            if magic in _PCAP_MAGICS:
+                yield from _pcap_records(buf, size)
+            elif unpack_from('<I', buf, 0)[0] == _PCAPNG_SHB:
+                yield from _pcapng_records(buf, size)
+            else:
+                _LOGGER.warning("unsupported capture format: %s", filepath)
+
+
+def _network_layer(linktype: int, data: bytes) -> tuple[int, int]:
+    """IP version and offset of network layer, version 0 if not IP"""
+    if linktype == _LINKTYPE_ETHERNET:
+        if len(data) < 14:
+            return 0, 0
+        ethertype = _UINT16.unpack_from(data, 12)[0]
+        offset = 14
+        while ethertype in _VLAN_ETHERTYPES and len(data) >= offset + 4:
+            ethertype = _UINT16.unpack_from(data, offset + 2)[0]
+            offset += 4
+        return _ETHERTYPE_VERSION.get(ethertype, 0), offset
+    if linktype in (_LINKTYPE_RAW, _LINKTYPE_IPV4, _LINKTYPE_IPV6):
+        return (data[0] >> 4 if data else 0), 0
+    if linktype in (_LINKTYPE_NULL, _LINKTYPE_LOOP):
+        if len(data) < 4:
+            return 0, 0
+        # null family is in host byte order, loop family in network order
+        family = data[0] or data[3]
+        return _NULL_FAMILY_VERSION.get(family, 0), 4
+    if linktype == _LINKTYPE_LINUX_SLL:
+        if len(data) < 16:
+            return 0, 0
+        ethertype = _UINT16.unpack_from(data, 14)[0]
+        return _ETHERTYPE_VERSION.get(ethertype, 0), 16
+    if linktype == _LINKTYPE_LINUX_SLL2:
+        if len(data) < 20:
+            return 0, 0
+        ethertype = _UINT16.unpack_from(data, 0)[0]
+        return _ETHERTYPE_VERSION.get(ethertype, 0), 20
+    return 0, 0
+
+
+def _decode_transport(pkt: RawPacket, data: bytes, offset: int, end: int):
+    pkt.l4_len = max(0, end - offset)
+    if pkt.proto == PROTO_TCP and end >= offset + _TCP_HEADER_SIZE:
+        sport, dport, _, _, offset_flags = _TCP_HEADER.unpack_from(
+            data, offset
+        )
+        pkt.sport = sport
+        pkt.dport = dport
+        pkt.tcp_flags = offset_flags & 0x01FF
+        pkt.payload_len = max(0, pkt.l4_len - (offset_flags >> 12) * 4)
+        return
+    if pkt.proto == PROTO_UDP and end >= offset + _UDP_HEADER_SIZE:
+        sport, dport, length = _UDP_HEADER.unpack_from(data, offset)
+        pkt.sport = sport
+        pkt.dport = dport
+        pkt.payload_len = max(0, length - _UDP_HEADER_SIZE)
+
+
+def _decode_ipv4(pkt: RawPacket, data: bytes, offset: int):
+    if len(data) < offset + 20:
+        return
+    version_ihl, _, total_len, _, fragment, _, proto = (
+        _IPV4_HEADER.unpack_from(data, offset)
+    )
+    pkt.ip_version = 4
+    pkt.proto = proto
+    pkt.src = data[offset + 12 : offset + 16]
+    pkt.dst = data[offset + 16 : offset + 20]
+    end = min(len(data), offset + total_len) if total_len else len(data)
+    if fragment & 0x1FFF:
+        # only first fragment holds transport header
+        return
+    _decode_transport(pkt, data, offset + (version_ihl & 0x0F) * 4, end)
+
+
+def _decode_ipv6(pkt: RawPacket, data: bytes, offset: int):
+    if len(data) < offset + 40:
+        return
+    payload_len, next_header = _IPV6_HEADER.unpack_from(data, offset + 4)
+    pkt.ip_version = 6
+    pkt.src = data[offset + 8 : offset + 24]
+    pkt.dst = data[offset + 24 : offset + 40]
+    offset += 40
+    end = min(len(data), offset + payload_len) if payload_len else len(data)
+    while next_header in _IPV6_EXT_HEADERS and offset + 8 <= end:
+        if next_header == _IPV6_FRAGMENT:
+            fragment = _UINT16.unpack_from(data, offset + 2)[0]
+            if fragment & 0xFFF8:
+                # only first fragment holds transport header
+                pkt.proto = _IPV6_FRAGMENT
+                return
+            next_header = data[offset]
+            offset += 8
+            continue
+        next_header, ext_len = data[offset], data[offset + 1]
+        offset += (ext_len + 1) * 8
+    pkt.proto = next_header
+    _decode_transport(pkt, data, offset, end)
+
+
+def decode_raw_packet(linktype: int, time_ns: int, data: bytes) -> RawPacket:
+    """Decode network and transport headers of captured data"""
+    pkt = RawPacket(linktype, time_ns, data)
+    ip_version, offset = _network_layer(linktype, data)
+    if ip_version == 4:
+        _decode_ipv4(pkt, data, offset)
+    elif ip_version == 6:
+        _decode_ipv6(pkt, data, offset)
+    return pkt
+
+
+def stream_raw_packets(filepath: Path) -> RawPacketIterator:
+    """Stream packets of capture decoded without scapy"""
+    for linktype, time_ns, data in pcap_records(filepath):
+        yield decode_raw_packet(linktype, time_ns, data)
@@ -1,39 +1,62 @@
 """TCP conversation helper"""
 
-from dataclasses import dataclass, field
+from os import getenv
 
-from .conv import Conversation, ConversationIterator, PeerPair
-from .tcp import tcp_layer
+from .conv import (
+    Conversation,
+    ConversationIterator,
+    ConversationTable,
+    UnidirectionalCounter,
+    flow_key,
+)
+from .raw import NS_PER_SEC, RawPacket
+
+TCP_FLAGS_FIN = 0x01
+TCP_FLAGS_SYN = 0x02
+TCP_FLAGS_RST = 0x04
+_FIN_SENT = 0x01
+_FIN_RECV = 0x02
+_FIN_BOTH = _FIN_SENT | _FIN_RECV
+_MAX_FLOWS = int(getenv('PLASMA_PCAP_MAX_FLOWS', '65536'))
+_IDLE_TIMEOUT = int(getenv('PLASMA_PCAP_TCP_IDLE_TIMEOUT', '3600'))
 
 
-@dataclass
 class TCPConversations:
-    """TCP conversations aggregator"""
+    """TCP conversations aggregator
+
+    A conversation starts with a SYN packet and ends with a RST packet or
+    with the first packet following the FIN packets of both peers, idle or
+    evicted conversations end early (see PLASMA_PCAP_MAX_FLOWS and
+    PLASMA_PCAP_TCP_IDLE_TIMEOUT). Packets outside of a conversation are
+    only counted.
+    """
 
-    mapping: dict[PeerPair, Conversation] = field(default_factory=dict)
-    closed: list[Conversation] = field(default_factory=list)
-    unbound: list['scapy.all.Packet'] = field(default_factory=list)
+    def __init__(self):
+        self.table = ConversationTable(_MAX_FLOWS, _IDLE_TIMEOUT * NS_PER_SEC)
+        self.unbound = UnidirectionalCounter()
 
-    def append(self, peer_pair: PeerPair, pkt: 'scapy.all.Packet'):
-        """Add packet to associated conversation"""
-        conv = self.mapping.get(peer_pair)
-        if tcp_layer(pkt).flags == 'S':
+    def append(self, pkt: RawPacket) -> ConversationIterator:
+        """Add packet to associated conversation, yield ended conversations"""
+        yield from self.table.expire(pkt.time_ns)
+        key = flow_key(pkt)
+        if pkt.tcp_flags == TCP_FLAGS_SYN:
+            conv = self.table.pop(key)
             if conv is not None:
-                self.closed.append(conv)
-            conv = Conversation(peer_pair=peer_pair)
-            self.mapping[peer_pair] = conv
-            self.mapping[peer_pair.inverted] = conv
+                yield conv
+            conv = Conversation.from_packet(pkt)
+            yield from self.table.add(key, conv)
+        else:
+            conv = self.table.get(key)
         if conv is None:
-            self.unbound.append(pkt)
+            self.unbound.add(pkt.payload_len)
             return
-        conv.append(peer_pair, pkt)
+        closing = conv.fin_mask == _FIN_BOTH
+        conv.append(pkt)
+        if pkt.tcp_flags & TCP_FLAGS_FIN:
+            conv.fin_mask |= _FIN_SENT if conv.is_sent(pkt) else _FIN_RECV
+        if closing or pkt.tcp_flags & TCP_FLAGS_RST:
+            yield self.table.pop(key)
 
     def conversations(self) -> ConversationIterator:
-        """Conversations"""
-        yield from self.closed
-        seen = set()
-        for conv in self.mapping.values():
-            if conv.peer_pair in seen:
-                continue
-            seen.add(conv.peer_pair)
-            yield conv
+        """Remaining conversations"""
+        yield from self.table.drain()
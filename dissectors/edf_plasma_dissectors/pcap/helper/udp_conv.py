@@ -1,30 +1,39 @@
-"""TCP conversation helper"""
+"""UDP conversation helper"""
 
-from dataclasses import dataclass, field
+from os import getenv
 
-from .conv import Conversation, ConversationIterator, PeerPair
+from .conv import (
+    Conversation,
+    ConversationIterator,
+    ConversationTable,
+    flow_key,
+)
+from .raw import NS_PER_SEC, RawPacket
+
+_MAX_FLOWS = int(getenv('PLASMA_PCAP_MAX_FLOWS', '65536'))
+_IDLE_TIMEOUT = int(getenv('PLASMA_PCAP_UDP_IDLE_TIMEOUT', '300'))
 
 
-@dataclass
 class UDPConversations:
-    """UDP conversations aggregator"""
+    """UDP conversations aggregator
+
+    Conversations end when idle or evicted (see PLASMA_PCAP_MAX_FLOWS and
+    PLASMA_PCAP_UDP_IDLE_TIMEOUT).
+    """
 
-    mapping: dict[PeerPair, Conversation] = field(default_factory=dict)
+    def __init__(self):
+        self.table = ConversationTable(_MAX_FLOWS, _IDLE_TIMEOUT * NS_PER_SEC)
 
-    def append(self, peer_pair: PeerPair, pkt: 'scapy.all.Packet'):
-        """Add packet to associated conversation"""
-        conv = self.mapping.get(peer_pair)
+    def append(self, pkt: RawPacket) -> ConversationIterator:
+        """Add packet to associated conversation, yield ended conversations"""
+        yield from self.table.expire(pkt.time_ns)
+        key = flow_key(pkt)
+        conv = self.table.get(key)
         if conv is None:
-            conv = Conversation(peer_pair=peer_pair)
-            self.mapping[peer_pair] = conv
-            self.mapping[peer_pair.inverted] = conv
-        conv.append(peer_pair, pkt)
+            conv = Conversation.from_packet(pkt)
+            yield from self.table.add(key, conv)
+        conv.append(pkt)
 
     def conversations(self) -> ConversationIterator:
-        """Conversations"""
-        seen = set()
-        for conv in self.mapping.values():
-            if conv.peer_pair in seen:
-                continue
-            seen.add(conv.peer_pair)
-            yield conv
+        """Remaining conversations"""
+        yield from self.table.drain()
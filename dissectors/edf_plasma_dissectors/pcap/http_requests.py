@@ -9,20 +9,25 @@ from edf_plasma_core.dissector import (
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import select_pcap_impl, stream_pcap_packets
+from .helper import PCAP_FAMILY, select_pcap_impl
 from .helper.decode import decode_utf8_string
+from .helper.engine import PacketAnalyzer, dissect_pcap, register_analyzer
 from .helper.http import has_http_req, http_req_layer
 from .helper.packet import pkt_base_record
 
+REQUIRES = ('scapy',)
 
-def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
-    for pkt in stream_pcap_packets(ctx.filepath):
+
+class _HTTPRequestsAnalyzer(PacketAnalyzer):
+    """HTTP requests analyzer"""
+
+    def process(self, pkt: 'scapy.all.Packet') -> RecordIterator:
         if not has_http_req(pkt):
-            continue
+            return
         layer = http_req_layer(pkt)
         record = pkt_base_record(pkt)
         if not record:
-            continue
+            return
         content_length = decode_utf8_string(layer.Content_Length)
         if content_length:
             content_length = int(content_length)
@@ -32,13 +37,19 @@ def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
                 'http_path': decode_utf8_string(layer.Path),
                 'http_host': decode_utf8_string(layer.Host),
                 'http_user_agent': decode_utf8_string(layer.User_Agent),
-                'http_content_type': decode_utf8_string(layer.Content_Type),
+                'http_content_type': decode_utf8_string(
+                    layer.Content_Type
+                ),
                 'http_content_length': content_length,
             }
         )
         yield record
 
 
+def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
+    yield from dissect_pcap(ctx)
+
+
 DISSECTOR = Dissector(
     slug='pcap_http_requests',
     tags={Tag.PCAP},
@@ -58,5 +69,7 @@ DISSECTOR = Dissector(
     description="HTTP requests from PCAP",
     select_impl=select_pcap_impl,
     dissect_impl=_dissect_impl,
+    family=PCAP_FAMILY,
 )
+register_analyzer(DISSECTOR.slug, _HTTPRequestsAnalyzer)
 register_dissector(DISSECTOR)
@@ -9,49 +9,68 @@ from edf_plasma_core.dissector import (
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import select_pcap_impl, stream_pcap_packets
+from .helper import PCAP_FAMILY, select_pcap_impl
 from .helper.conv import UnidirectionalCounter
-from .helper.dns import dns_layer, has_dns
-from .helper.http import has_http, http_layer
-from .helper.icmp import has_icmp, icmp_layer
-from .helper.tcp import has_tcp, tcp_data_len
-from .helper.udp import has_udp, udp_data_len
+from .helper.engine import PacketAnalyzer, dissect_pcap, register_analyzer
+from .helper.raw import RawPacket
 
+# ports scapy binds DNS and HTTP layers to
+_DNS_PORTS = frozenset((53, 5353))
+_HTTP_PORTS = frozenset((80, 8080))
 
-def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
-    counters = {
-        'tcp': UnidirectionalCounter(),
-        'udp': UnidirectionalCounter(),
-        'dns': UnidirectionalCounter(),
-        'http': UnidirectionalCounter(),
-        'icmp': UnidirectionalCounter(),
-    }
-    for pkt in stream_pcap_packets(ctx.filepath):
+
+def _has_app_data(pkt: RawPacket, ports: frozenset[int]) -> bool:
+    return pkt.payload_len > 0 and (pkt.sport in ports or pkt.dport in ports)
+
+
+class _ProtocolStatsAnalyzer(PacketAnalyzer):
+    """Protocol statistics analyzer"""
+
+    raw = True
+
+    def __init__(self):
+        super().__init__()
+        self.counters = {
+            'tcp': UnidirectionalCounter(),
+            'udp': UnidirectionalCounter(),
+            'dns': UnidirectionalCounter(),
+            'http': UnidirectionalCounter(),
+            'icmp': UnidirectionalCounter(),
+        }
+
+    def process(self, pkt: RawPacket) -> RecordIterator:
         counter = None
         data_bytes_cnt = 0
-        if has_tcp(pkt):
+        if pkt.is_tcp:
             counter = 'tcp'
-            data_bytes_cnt = tcp_data_len(pkt)
-        if has_udp(pkt):
+            data_bytes_cnt = pkt.payload_len
+            if _has_app_data(pkt, _DNS_PORTS):
+                counter = 'dns'
+            if _has_app_data(pkt, _HTTP_PORTS):
+                counter = 'http'
+        elif pkt.is_udp:
             counter = 'udp'
-            data_bytes_cnt = udp_data_len(pkt)
-        if has_dns(pkt):
-            counter = 'dns'
-            data_bytes_cnt = len(dns_layer(pkt))
-        if has_http(pkt):
-            counter = 'http'
-            data_bytes_cnt = len(http_layer(pkt))
-        if has_icmp(pkt):
+            data_bytes_cnt = pkt.payload_len
+            if _has_app_data(pkt, _DNS_PORTS):
+                counter = 'dns'
+        elif pkt.is_icmp:
             counter = 'icmp'
-            data_bytes_cnt = len(icmp_layer(pkt))
+            data_bytes_cnt = pkt.l4_len
         if counter:
-            counters[counter].add(data_bytes_cnt)
-    for protocol, counter in counters.items():
-        yield {
-            'pkt_proto': protocol,
-            'pkt_count': counter.pkt_cnt,
-            'pkt_bytes': counter.data_bytes_cnt,
-        }
+            self.counters[counter].add(data_bytes_cnt)
+        yield from ()
+
+    def finish(self) -> RecordIterator:
+        for protocol, counter in self.counters.items():
+            yield {
+                'pkt_proto': protocol,
+                'pkt_count': counter.pkt_cnt,
+                'pkt_bytes': counter.data_bytes_cnt,
+            }
+
+
+def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
+    yield from dissect_pcap(ctx)
 
 
 DISSECTOR = Dissector(
@@ -65,5 +84,7 @@ DISSECTOR = Dissector(
     description="protocols from PCAP",
     select_impl=select_pcap_impl,
     dissect_impl=_dissect_impl,
+    family=PCAP_FAMILY,
 )
+register_analyzer(DISSECTOR.slug, _ProtocolStatsAnalyzer)
 register_dissector(DISSECTOR)
@@ -6,38 +6,48 @@ from edf_plasma_core.dissector import (
     Dissector,
     register_dissector,
 )
+from edf_plasma_core.helper.logging import get_logger
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import select_pcap_impl, stream_pcap_packets
-from .helper.conv import Peer, PeerPair
-from .helper.ipv4 import has_ipv4, ipv4_layer
-from .helper.ipv6 import ipv6_layer
-from .helper.tcp import has_tcp, tcp_layer
+from .helper import PCAP_FAMILY, select_pcap_impl
+from .helper.engine import PacketAnalyzer, dissect_pcap, register_analyzer
+from .helper.raw import RawPacket
 from .helper.tcp_conv import TCPConversations
 
+_LOGGER = get_logger('dissectors.pcap.tcp_conversations')
 
-def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
-    tcp_convs = TCPConversations()
-    for pkt in stream_pcap_packets(ctx.filepath):
-        if not has_tcp(pkt):
-            continue
-        tp_layer = tcp_layer(pkt)
-        ip_layer = ipv4_layer(pkt) if has_ipv4(pkt) else ipv6_layer(pkt)
-        peer_pair = PeerPair(
-            src_peer=Peer(addr=ip_layer.src, port=tp_layer.sport),
-            dst_peer=Peer(addr=ip_layer.dst, port=tp_layer.dport),
-        )
-        tcp_convs.append(peer_pair, pkt)
-        # yield as processing progresses to prevent memory overflow
-        while True:
-            try:
-                conv = tcp_convs.closed.pop()
-            except IndexError:
-                break
+
+class _TCPConversationsAnalyzer(PacketAnalyzer):
+    """TCP conversations analyzer"""
+
+    raw = True
+
+    def __init__(self):
+        super().__init__()
+        self.tcp_convs = TCPConversations()
+
+    def process(self, pkt: RawPacket) -> RecordIterator:
+        if not pkt.is_tcp:
+            return
+        # yield as conversations end to bound memory usage
+        for conv in self.tcp_convs.append(pkt):
             yield conv.as_record()
-    for conv in tcp_convs.conversations():
-        yield conv.as_record()
+
+    def finish(self) -> RecordIterator:
+        for conv in self.tcp_convs.conversations():
+            yield conv.as_record()
+        unbound = self.tcp_convs.unbound
+        if unbound.pkt_cnt:
+            _LOGGER.info(
+                "tcp packets outside of conversations: %d (%d data bytes)",
+                unbound.pkt_cnt,
+                unbound.data_bytes_cnt,
+            )
+
+
+def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
+    yield from dissect_pcap(ctx)
 
 
 DISSECTOR = Dissector(
@@ -58,5 +68,7 @@ DISSECTOR = Dissector(
     description="TCP conversations from PCAP",
     select_impl=select_pcap_impl,
     dissect_impl=_dissect_impl,
+    family=PCAP_FAMILY,
 )
+register_analyzer(DISSECTOR.slug, _TCPConversationsAnalyzer)
 register_dissector(DISSECTOR)
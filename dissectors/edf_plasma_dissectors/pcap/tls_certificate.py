@@ -9,15 +9,20 @@ from edf_plasma_core.dissector import (
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import select_pcap_impl, stream_pcap_packets
+from .helper import PCAP_FAMILY, select_pcap_impl
+from .helper.engine import PacketAnalyzer, dissect_pcap, register_analyzer
 from .helper.packet import pkt_base_record
 from .helper.tls import has_tls_cert, tls_cert_layer
 
+REQUIRES = ('scapy',)
 
-def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
-    for pkt in stream_pcap_packets(ctx.filepath):
+
+class _TLSCertificateAnalyzer(PacketAnalyzer):
+    """TLS certificate analyzer"""
+
+    def process(self, pkt: 'scapy.all.Packet') -> RecordIterator:
         if not has_tls_cert(pkt):
-            continue
+            return
         record = pkt_base_record(pkt)
         layer = tls_cert_layer(pkt)
         for _, certificate in layer.certs:
@@ -32,6 +37,10 @@ def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
             yield record
 
 
+def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
+    yield from dissect_pcap(ctx)
+
+
 DISSECTOR = Dissector(
     slug='pcap_tls_cert',
     tags={Tag.PCAP},
@@ -49,5 +58,7 @@ DISSECTOR = Dissector(
     description="TLS certificates from PCAP",
     select_impl=select_pcap_impl,
     dissect_impl=_dissect_impl,
+    family=PCAP_FAMILY,
 )
+register_analyzer(DISSECTOR.slug, _TLSCertificateAnalyzer)
 register_dissector(DISSECTOR)
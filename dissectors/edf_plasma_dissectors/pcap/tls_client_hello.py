@@ -9,7 +9,8 @@ from edf_plasma_core.dissector import (
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import select_pcap_impl, stream_pcap_packets
+from .helper import PCAP_FAMILY, select_pcap_impl
+from .helper.engine import PacketAnalyzer, dissect_pcap, register_analyzer
 from .helper.packet import pkt_base_record
 from .helper.tls import (
     compute_ja3,
@@ -18,11 +19,15 @@ from .helper.tls import (
     tls_clt_hello_layer,
 )
 
+REQUIRES = ('scapy',)
 
-def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
-    for pkt in stream_pcap_packets(ctx.filepath):
+
+class _TLSClientHelloAnalyzer(PacketAnalyzer):
+    """TLS client hello analyzer"""
+
+    def process(self, pkt: 'scapy.all.Packet') -> RecordIterator:
         if not has_tls_clt_hello(pkt):
-            continue
+            return
         layer = tls_clt_hello_layer(pkt)
         record = pkt_base_record(pkt)
         servernames = get_servernames(layer)
@@ -37,6 +42,10 @@ def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
         yield record
 
 
+def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
+    yield from dissect_pcap(ctx)
+
+
 DISSECTOR = Dissector(
     slug='pcap_tls_client_hello',
     tags={Tag.PCAP},
@@ -53,5 +62,7 @@ DISSECTOR = Dissector(
     description="TLS client hello from PCAP",
     select_impl=select_pcap_impl,
     dissect_impl=_dissect_impl,
+    family=PCAP_FAMILY,
 )
+register_analyzer(DISSECTOR.slug, _TLSClientHelloAnalyzer)
 register_dissector(DISSECTOR)
@@ -9,15 +9,20 @@ from edf_plasma_core.dissector import (
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import select_pcap_impl, stream_pcap_packets
+from .helper import PCAP_FAMILY, select_pcap_impl
+from .helper.engine import PacketAnalyzer, dissect_pcap, register_analyzer
 from .helper.packet import pkt_base_record
 from .helper.tls import compute_ja3s, has_tls_srv_hello, tls_srv_hello_layer
 
+REQUIRES = ('scapy',)
 
-def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
-    for pkt in stream_pcap_packets(ctx.filepath):
+
+class _TLSServerHelloAnalyzer(PacketAnalyzer):
+    """TLS server hello analyzer"""
+
+    def process(self, pkt: 'scapy.all.Packet') -> RecordIterator:
         if not has_tls_srv_hello(pkt):
-            continue
+            return
         layer = tls_srv_hello_layer(pkt)
         record = pkt_base_record(pkt)
         ja3s_string, ja3s_hash = compute_ja3s(layer)
@@ -30,6 +35,10 @@ def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
         yield record
 
 
+def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
+    yield from dissect_pcap(ctx)
+
+
 DISSECTOR = Dissector(
     slug='pcap_tls_server_hello',
     tags={Tag.PCAP},
@@ -45,5 +54,7 @@ DISSECTOR = Dissector(
     description="TLS server hello from PCAP",
     select_impl=select_pcap_impl,
     dissect_impl=_dissect_impl,
+    family=PCAP_FAMILY,
 )
+register_analyzer(DISSECTOR.slug, _TLSServerHelloAnalyzer)
 register_dissector(DISSECTOR)
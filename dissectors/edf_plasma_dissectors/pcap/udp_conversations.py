@@ -9,28 +9,35 @@ from edf_plasma_core.dissector import (
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import select_pcap_impl, stream_pcap_packets
-from .helper.conv import Peer, PeerPair
-from .helper.ipv4 import has_ipv4, ipv4_layer
-from .helper.ipv6 import ipv6_layer
-from .helper.udp import has_udp, udp_layer
+from .helper import PCAP_FAMILY, select_pcap_impl
+from .helper.engine import PacketAnalyzer, dissect_pcap, register_analyzer
+from .helper.raw import RawPacket
 from .helper.udp_conv import UDPConversations
 
 
+class _UDPConversationsAnalyzer(PacketAnalyzer):
+    """UDP conversations analyzer"""
+
+    raw = True
+
+    def __init__(self):
+        super().__init__()
+        self.udp_convs = UDPConversations()
+
+    def process(self, pkt: RawPacket) -> RecordIterator:
+        if not pkt.is_udp:
+            return
+        # yield as conversations end to bound memory usage
+        for conv in self.udp_convs.append(pkt):
+            yield conv.as_record()
+
+    def finish(self) -> RecordIterator:
+        for conv in self.udp_convs.conversations():
+            yield conv.as_record()
+
+
 def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
-    udp_convs = UDPConversations()
-    for pkt in stream_pcap_packets(ctx.filepath):
-        if not has_udp(pkt):
-            continue
-        tp_layer = udp_layer(pkt)
-        ip_layer = ipv4_layer(pkt) if has_ipv4(pkt) else ipv6_layer(pkt)
-        peer_pair = PeerPair(
-            src_peer=Peer(addr=ip_layer.src, port=tp_layer.sport),
-            dst_peer=Peer(addr=ip_layer.dst, port=tp_layer.dport),
-        )
-        udp_convs.append(peer_pair, pkt)
-    for conv in udp_convs.conversations():
-        yield conv.as_record()
+    yield from dissect_pcap(ctx)
 
 
 DISSECTOR = Dissector(
@@ -51,5 +58,7 @@ DISSECTOR = Dissector(
     description="UDP conversations from PCAP",
     select_impl=select_pcap_impl,
     dissect_impl=_dissect_impl,
+    family=PCAP_FAMILY,
 )
+register_analyzer(DISSECTOR.slug, _UDPConversationsAnalyzer)
 register_dissector(DISSECTOR)
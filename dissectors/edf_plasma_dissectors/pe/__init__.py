@@ -1,15 +1,3 @@
 """Portable executable dissectors"""
 
-from .helper import LIEF_AVAILABLE
-
-if LIEF_AVAILABLE:
-    from . import (
-        ctor_dtor,
-        export,
-        import_,
-        info,
-        resource,
-        rich,
-        section,
-        signature,
-    )
+REQUIRES = ('lief',)
@@ -13,7 +13,7 @@ from edf_plasma_core.helper.hashing import (
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import parse_pe, select_pe_impl
+from .helper import PE_FAMILY, parse_pe, select_pe_impl
 
 
 def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
@@ -41,5 +41,6 @@ DISSECTOR = Dissector(
     description="PE exported symbols",
     select_impl=select_pe_impl,
     dissect_impl=_dissect_impl,
+    family=PE_FAMILY,
 )
 register_dissector(DISSECTOR)
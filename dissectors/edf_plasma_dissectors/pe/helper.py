@@ -6,18 +6,23 @@ from edf_plasma_core.dissector import DissectionContext
 from edf_plasma_core.helper.importing import lazy_import
 from edf_plasma_core.helper.logging import get_logger
 from edf_plasma_core.helper.selecting import select
+from edf_plasma_core.helper.sniffing import ContentType, content_type
 from edf_plasma_core.helper.typing import PathIterator
 
+from ..helper.lief import parse_binary
+
 lazy_lief = lazy_import('lief')
 LIEF_AVAILABLE = lazy_lief is not None
 
 _LOGGER = get_logger('dissectors.pe.helper')
 
+PE_FAMILY = 'pe'
+
 
 def select_pe_impl(directory: Path) -> PathIterator:
     """Select PE implementation"""
     for filepath in select(directory, '*'):
-        if not lazy_lief.is_pe(str(filepath)):
+        if content_type(filepath) != ContentType.PE:
             if filepath.suffix.lower() in {'.exe', '.dll'}:
                 _LOGGER.warning(
                     "suffix suggests PE but type check failed: %s", filepath
@@ -27,8 +32,11 @@ def select_pe_impl(directory: Path) -> PathIterator:
 
 
 def parse_pe(ctx: DissectionContext) -> 'lief.PE.Binary':
-    """Parse PE file referenced by dissection context"""
-    return lazy_lief.parse(ctx.filepath)
+    """Parse PE file referenced by dissection context
+
+    File is parsed once for all dissectors of pe family.
+    """
+    return parse_binary(ctx.filepath, ctx)
 
 
 def pe_pdb(pef: 'lief.PE.Binary') -> str:
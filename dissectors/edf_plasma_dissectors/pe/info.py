@@ -8,12 +8,13 @@ from edf_plasma_core.dissector import (
 )
 from edf_plasma_core.helper.hashing import (
     HashingAlgorithm,
-    digest_from_filepath,
+    digests_from_filepath,
 )
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
 from .helper import (
+    PE_FAMILY,
     parse_pe,
     pe_imphash,
     pe_pdb,
@@ -22,15 +23,20 @@ from .helper import (
     select_pe_impl,
 )
 
+_HASHING_ALGORITHMS = (
+    HashingAlgorithm.MD5,
+    HashingAlgorithm.SHA1,
+    HashingAlgorithm.SHA256,
+)
+
 
 def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
     pef = parse_pe(ctx)
+    digests = digests_from_filepath(_HASHING_ALGORITHMS, ctx.filepath)
     yield {
-        'pe_md5': digest_from_filepath(HashingAlgorithm.MD5, ctx.filepath),
-        'pe_sha1': digest_from_filepath(HashingAlgorithm.SHA1, ctx.filepath),
-        'pe_sha256': digest_from_filepath(
-            HashingAlgorithm.SHA256, ctx.filepath
-        ),
+        'pe_md5': digests[HashingAlgorithm.MD5],
+        'pe_sha1': digests[HashingAlgorithm.SHA1],
+        'pe_sha256': digests[HashingAlgorithm.SHA256],
         'pe_imphash': pe_imphash(pef),
         'pe_version': pe_version(pef),
         'pe_size': ctx.filepath.stat().st_size,
@@ -61,5 +67,6 @@ DISSECTOR = Dissector(
     description="PE information",
     select_impl=select_pe_impl,
     dissect_impl=_dissect_impl,
+    family=PE_FAMILY,
 )
 register_dissector(DISSECTOR)
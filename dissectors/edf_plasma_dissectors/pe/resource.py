@@ -15,13 +15,13 @@ from edf_plasma_core.helper.hashing import (
 from edf_plasma_core.helper.identifying import (
     Magika,
     identify_bytes,
-    instanciate_magika,
+    shared_magika,
 )
 from edf_plasma_core.helper.logging import get_logger
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import parse_pe, select_pe_impl
+from .helper import PE_FAMILY, parse_pe, select_pe_impl
 
 _LOGGER = get_logger('dissectors.pe.resource')
 
@@ -40,7 +40,7 @@ def _best_ident(data: bytes, magika: Magika) -> str:
 
 def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
     pef = parse_pe(ctx)
-    magika = instanciate_magika()
+    magika = shared_magika()
     digest = digest_from_filepath(HashingAlgorithm.SHA256, ctx.filepath)
     if not pef.has_resources:
         _LOGGER.warning("portable executable does not have any resource")
@@ -86,5 +86,6 @@ DISSECTOR = Dissector(
     description="PE resources",
     select_impl=select_pe_impl,
     dissect_impl=_dissect_impl,
+    family=PE_FAMILY,
 )
 register_dissector(DISSECTOR)
@@ -14,7 +14,7 @@ from edf_plasma_core.helper.logging import get_logger
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
-from .helper import parse_pe, select_pe_impl
+from .helper import PE_FAMILY, parse_pe, select_pe_impl
 
 _LOGGER = get_logger('dissectors.pe.rich')
 
@@ -46,5 +46,6 @@ DISSECTOR = Dissector(
     description="PE rich header",
     select_impl=select_pe_impl,
     dissect_impl=_dissect_impl,
+    family=PE_FAMILY,
 )
 register_dissector(DISSECTOR)
@@ -14,6 +14,7 @@ from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import RecordIterator
 
 from .helper import (
+    PE_FAMILY,
     parse_pe,
     pe_section_is_code,
     pe_section_perm,
@@ -55,5 +56,6 @@ DISSECTOR = Dissector(
     description="PE sections",
     select_impl=select_pe_impl,
     dissect_impl=_dissect_impl,
+    family=PE_FAMILY,
 )
 register_dissector(DISSECTOR)
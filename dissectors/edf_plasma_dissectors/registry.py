@@ -0,0 +1,61 @@
+"""Dissector registry
+
+Dissectors are registered from registry.json without importing their
+modules, a dissector module is imported the first time the dissector is
+retrieved. Regenerate registry.json after adding, removing or modifying a
+dissector using:
+
+    python -m edf_plasma_dissectors.registry_builder
+"""
+
+from importlib import import_module
+from pathlib import Path
+from pkgutil import walk_packages
+
+from edf_plasma_core.concept import Tag
+from edf_plasma_core.dissector import DissectorEntry, register_dissector_entry
+from edf_plasma_core.helper.json import read_json
+from edf_plasma_core.helper.logging import get_logger
+from edf_plasma_core.helper.table import Column, DataType
+
+_LOGGER = get_logger('dissectors.registry')
+_PACKAGE = __package__
+
+REGISTRY_FILEPATH = Path(__file__).with_name('registry.json')
+
+
+def _entry_from_dict(dct: dict) -> DissectorEntry:
+    return DissectorEntry(
+        slug=dct['slug'],
+        module=dct['module'],
+        tags={Tag(tag) for tag in dct['tags']},
+        columns=[
+            Column(name, DataType(data_type))
+            for name, data_type in dct['columns'].items()
+        ],
+        description=dct['description'],
+        requires=dct.get('requires', []),
+    )
+
+
+def import_all_modules():
+    """Import all modules of the package"""
+    package = import_module(_PACKAGE)
+    for module_info in walk_packages(package.__path__, f'{_PACKAGE}.'):
+        import_module(module_info.name)
+
+
+def load_registry():
+    """Register dissector entries from registry, import all modules if
+    registry is missing or invalid
+    """
+    dct = read_json(REGISTRY_FILEPATH) if REGISTRY_FILEPATH.is_file() else None
+    try:
+        entries = [_entry_from_dict(item) for item in dct['dissectors']]
+    except (TypeError, KeyError, ValueError, AttributeError):
+        _LOGGER.warning("dissector registry is invalid, importing modules")
+        import_all_modules()
+        return
+    for entry in entries:
+        register_dissector_entry(entry)
+
@@ -0,0 +1,88 @@
+"""Dissector registry builder
+
+Import all dissector modules and write the description of registered
+dissectors to registry.json, or to given path:
+
+    python -m edf_plasma_dissectors.registry_builder [path]
+"""
+
+from argparse import ArgumentParser
+from importlib import import_module
+from json import dumps
+from pathlib import Path
+
+from edf_plasma_core.dissector import DissectorEntry, get_registered_dissectors
+from edf_plasma_core.helper.typing import StringList
+
+from .registry import REGISTRY_FILEPATH, import_all_modules
+
+_PACKAGE = __package__
+
+
+def _entry_to_dict(entry: DissectorEntry) -> dict:
+    return {
+        'slug': entry.slug,
+        'module': entry.module,
+        'tags': sorted(tag.value for tag in entry.tags),
+        'columns': {
+            column.name: column.data_type.value for column in entry.columns
+        },
+        'description': entry.description,
+        'requires': entry.requires,
+    }
+
+
+def _module_requires(module: str) -> StringList:
+    """Modules required by module and its parent packages
+
+    Packages and modules declare optional modules they depend on in a
+    REQUIRES module-level tuple.
+    """
+    requires = []
+    parts = module.split('.')
+    for index in range(1, len(parts) + 1):
+        imported = import_module('.'.join(parts[:index]))
+        for name in getattr(imported, 'REQUIRES', ()):
+            if name not in requires:
+                requires.append(name)
+    return requires
+
+
+def build_registry() -> list[dict]:
+    """Import all dissector modules and describe registered dissectors"""
+    import_all_modules()
+    entries = []
+    for dissector in get_registered_dissectors():
+        module = dissector.dissect_impl.__module__
+        if not module.startswith(f'{_PACKAGE}.'):
+            continue
+        entry = DissectorEntry.from_dissector(
+            dissector, _module_requires(module)
+        )
+        entries.append(_entry_to_dict(entry))
+    return sorted(entries, key=lambda dct: dct['slug'])
+
+
+def _parse_args():
+    parser = ArgumentParser(description="Build dissector registry")
+    parser.add_argument(
+        'filepath',
+        type=Path,
+        nargs='?',
+        default=REGISTRY_FILEPATH,
+        help="Registry output path, defaults to packaged registry.json",
+    )
+    return parser.parse_args()
+
+
+def _main():
+    args = _parse_args()
+    entries = build_registry()
+    with args.filepath.open('w', encoding='utf-8') as fobj:
+        fobj.write(dumps({'dissectors': entries}, indent=1))
+        fobj.write('\n')
+    print(f"{len(entries)} dissectors written to {args.filepath}")
+
+
+if __name__ == '__main__':
+    _main()
@@ -1,36 +1 @@
 """Microsoft-related dissectors"""
-
-from . import (
-    appx,
-    iis,
-    mssql,
-    netstat,
-    powershell,
-    task,
-    wmi,
-    zone_identifier,
-)
-from .helper import (
-    PYESEDB_AVAILABLE,
-    PYEVTX_AVAILABLE,
-    PYFSNTFS_AVAILABLE,
-    PYLNK_AVAILABLE,
-    PYOLECF_AVAILABLE,
-    PYREGF_AVAILABLE,
-    PYSCCA_AVAILABLE,
-)
-
-if PYEVTX_AVAILABLE:
-    from . import evtx
-if PYOLECF_AVAILABLE and PYLNK_AVAILABLE:
-    from . import jumplist
-if PYLNK_AVAILABLE:
-    from . import lnk
-if PYFSNTFS_AVAILABLE:
-    from . import mft, usnj
-if PYSCCA_AVAILABLE:
-    from . import prefetch
-if PYREGF_AVAILABLE:
-    from . import registry
-if PYESEDB_AVAILABLE:
-    from . import srudb, webcache
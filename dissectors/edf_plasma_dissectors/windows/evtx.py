@@ -1,5 +1,15 @@
-"""Windows EVTX artifact dissector"""
+"""Windows EVTX artifact dissector
 
+Chunks of files larger than 16 chunks can be dissected by a pool of
+processes (see PLASMA_EVTX_WORKERS), a pool is started for each such file
+by each surgeon, up to --parallel-surgeons times PLASMA_EVTX_WORKERS
+worker processes run at once.
+"""
+
+from dataclasses import replace
+from functools import lru_cache
+from mmap import ACCESS_READ, mmap
+from os import getenv
 from pathlib import Path
 
 from edf_plasma_core.concept import Tag
@@ -11,27 +21,47 @@ from edf_plasma_core.dissector import (
 from edf_plasma_core.helper.datetime import to_iso_fmt, with_utc
 from edf_plasma_core.helper.glob import ci_glob_pattern
 from edf_plasma_core.helper.logging import get_logger
+from edf_plasma_core.helper.parallel import ordered_process_map
 from edf_plasma_core.helper.selecting import select
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import PathIterator, RecordIterator
 from edf_plasma_core.helper.xml import check_xml_parser_safety
 
 from .helper.evtx import (
+    EVTX_HEADER_BLOCK_SIZE,
+    EvtxChunkRangeReader,
+    EvtxFilter,
     check_file_signature,
+    evtx_chunk_count,
     get_record_as_xml,
     get_record_creation_time,
+    get_record_event_identifier,
     iter_evtx_records,
     open_file_object,
 )
-from .xml.evtx import Event
+from .xml.evtx import event_from_record_xml
 
+REQUIRES = ('pyevtx',)
 _LOGGER = get_logger('dissectors.windows.evtx')
+_WORKERS = int(getenv('PLASMA_EVTX_WORKERS', '1'))
+_CHUNKS_PER_TASK = 16
+
+
+@lru_cache(maxsize=1)
+def _evtx_filter() -> EvtxFilter:
+    """Records filter configured from environment, built on first use"""
+    return EvtxFilter.from_env()
 
 
 def _select_impl(directory: Path) -> PathIterator:
     if not check_xml_parser_safety():
         _LOGGER.error("XML parser is not safe!")
         return
+    try:
+        _evtx_filter()
+    except ValueError as exc:
+        _LOGGER.error("invalid EVTX filter, %s", exc)
+        return
     pattern = ci_glob_pattern('*.evtx')
     for filepath in select(directory, pattern):
         if not check_file_signature(filepath):
@@ -40,30 +70,97 @@ def _select_impl(directory: Path) -> PathIterator:
         yield filepath
 
 
+def _evtx_records(ctx: DissectionContext, evtx) -> RecordIterator:
+    """Yield records selected by filter (see EvtxFilter.from_env), time
+    and event identifier are checked before rendering record XML
+    """
+    evtx_filter = _evtx_filter()
+    for record in iter_evtx_records(ctx, evtx):
+        ctime = get_record_creation_time(ctx, record)
+        if ctime is None:
+            continue
+        ctime = with_utc(ctime)
+        if not evtx_filter.match_time(ctime):
+            continue
+        if evtx_filter.event_ids is not None:
+            event_id = get_record_event_identifier(ctx, record)
+            if event_id is not None and not evtx_filter.match_event_id(
+                event_id
+            ):
+                continue
+        xml = get_record_as_xml(ctx, record)
+        if xml is None:
+            continue
+        event = event_from_record_xml(ctx, xml)
+        if event is None:
+            ctx.register_error("event_from_record_xml failed")
+            continue
+        if not evtx_filter.match_system(event.system):
+            continue
+        yield {
+            'evt_time': to_iso_fmt(ctime),
+            'evt_channel': event.system.channel,
+            'evt_provider': event.system.provider,
+            'evt_computer': event.system.computer,
+            'evt_id': event.system.event_id,
+            'evt_data': event.data,
+        }
+
+
+def _chunk_range_records(
+    ctx: DissectionContext, first_chunk: int, chunk_count: int
+):
+    """Dissect a range of chunks in a worker process, return records and
+    errors
+    """
+    with ctx.filepath.open('rb') as fobj:
+        with mmap(fobj.fileno(), 0, access=ACCESS_READ) as mem:
+            with EvtxChunkRangeReader(mem, first_chunk, chunk_count) as reader:
+                evtx = open_file_object(ctx, reader)
+                if evtx is None:
+                    return [], ctx.errors
+                try:
+                    records = list(_evtx_records(ctx, evtx))
+                finally:
+                    evtx.close()
+    return records, ctx.errors
+
+
+def _parallel_evtx_records(
+    ctx: DissectionContext, chunk_count: int, workers: int
+) -> RecordIterator:
+    worker_ctx = replace(ctx, errors=[], state={})
+    ranges = (
+        (worker_ctx, first, min(_CHUNKS_PER_TASK, chunk_count - first))
+        for first in range(0, chunk_count, _CHUNKS_PER_TASK)
+    )
+    for records, errors in ordered_process_map(
+        _chunk_range_records, ranges, workers
+    ):
+        yield from records
+        ctx.errors.extend(errors)
+
+
 def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
+    # file targets are not selected, filter was not checked yet
+    try:
+        _evtx_filter()
+    except ValueError as exc:
+        ctx.register_error(f"invalid EVTX filter, {exc}")
+        return
     with ctx.filepath.open('rb') as fobj:
+        if _WORKERS > 1:
+            chunk_count = evtx_chunk_count(fobj.read(EVTX_HEADER_BLOCK_SIZE))
+            # dirty files are dissected sequentially, header may not
+            # account for all chunks
+            if chunk_count is not None and chunk_count > _CHUNKS_PER_TASK:
+                yield from _parallel_evtx_records(ctx, chunk_count, _WORKERS)
+                return
+            fobj.seek(0)
         evtx = open_file_object(ctx, fobj)
         if evtx is None:
             return
-        for record in iter_evtx_records(ctx, evtx):
-            xml = get_record_as_xml(ctx, record)
-            if xml is None:
-                continue
-            event = Event.from_string(record.xml_string)
-            if event is None:
-                ctx.register_error("Event.from_string failed")
-                continue
-            ctime = get_record_creation_time(ctx, record)
-            if ctime is None:
-                continue
-            yield {
-                'evt_time': to_iso_fmt(with_utc(ctime)),
-                'evt_channel': event.system.channel,
-                'evt_provider': event.system.provider,
-                'evt_computer': event.system.computer,
-                'evt_id': event.system.event_id,
-                'evt_data': event.data,
-            }
+        yield from _evtx_records(ctx, evtx)
 
 
 DISSECTOR = Dissector(
@@ -1,22 +1,27 @@
 """python-libesedb wrapper"""
 
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from struct import unpack
+from struct import Struct
 from uuid import UUID
 
 from edf_plasma_core.helper.datetime import from_ole_timestamp, to_iso_fmt
 from edf_plasma_core.helper.importing import lazy_import
+from edf_plasma_core.helper.sniffing import ContentType, content_type
+from edf_plasma_core.helper.typing import Record
 
 lazy_pyesedb = lazy_import('pyesedb')
 PYESEDB_AVAILABLE = lazy_pyesedb is not None
 
+_UNSUPPORTED_TYPE = 'plasma:except:unsupported_type'
+_PARSING_FAILED = 'plasma:except:parsing_failed'
+
 
 def check_file_signature(filepath: Path) -> bool:
     """Determine if given file matches ese database signature"""
-    try:
-        return lazy_pyesedb.check_file_signature(str(filepath))
-    except OSError:
-        return False
+    return content_type(filepath) == ContentType.ESEDB
 
 
 def open_file_object(ctx, fobj):
@@ -85,50 +90,68 @@ def get_ese_column_type(ctx, column):
         return None
 
 
+def _unpack_parser(fmt: str) -> Callable:
+    unpack = Struct(fmt).unpack
+
+    def _parse(record, index: int):
+        return unpack(record.get_value_data(index))[0]
+
+    return _parse
+
+
+def _parse_guid(record, index: int) -> str:
+    return str(UUID(bytes=record.get_value_data(index)))
+
+
+def _parse_string(record, index: int) -> str:
+    return record.get_value_data_as_string(index)
+
+
+def _parse_boolean(record, index: int) -> bool:
+    return record.get_value_data_as_boolean(index)
+
+
+def _parse_data(record, index: int) -> bytes:
+    return record.get_value_data(index)
+
+
+_parse_double = _unpack_parser('d')
+
+
+def _parse_date_time(record, index: int) -> str:
+    # keep left to right multiplication order, float rounding depends on it
+    days = _parse_double(record, index)
+    return to_iso_fmt(from_ole_timestamp(days * 24 * 60 * 60 * 1000000))
+
+
+@lru_cache(maxsize=1)
+def _column_parsers() -> dict[int, Callable]:
+    column_types = lazy_pyesedb.column_types
+    return {
+        column_types.GUID: _parse_guid,
+        column_types.TEXT: _parse_string,
+        column_types.BOOLEAN: _parse_boolean,
+        column_types.DATE_TIME: _parse_date_time,
+        column_types.LARGE_TEXT: _parse_string,
+        column_types.BINARY_DATA: _parse_data,
+        column_types.LARGE_BINARY_DATA: _parse_data,
+        column_types.SUPER_LARGE_VALUE: _parse_data,
+        column_types.FLOAT_32BIT: _unpack_parser('f'),
+        column_types.DOUBLE_64BIT: _parse_double,
+        column_types.INTEGER_8BIT_UNSIGNED: _unpack_parser('B'),
+        column_types.INTEGER_16BIT_SIGNED: _unpack_parser('h'),
+        column_types.INTEGER_16BIT_UNSIGNED: _unpack_parser('H'),
+        column_types.INTEGER_32BIT_SIGNED: _unpack_parser('i'),
+        column_types.INTEGER_32BIT_UNSIGNED: _unpack_parser('I'),
+        column_types.INTEGER_64BIT_SIGNED: _unpack_parser('q'),
+    }
+
+
 def get_ese_column_parse(ctx, col_type):
     """Get column parsing function"""
-    column_types = lazy_pyesedb.column_types
     if col_type is None:
         return None
-    column_type_strategy = {
-        column_types.GUID: lambda r, i: str(UUID(bytes=r.get_value_data(i))),
-        column_types.TEXT: lambda r, i: r.get_value_data_as_string(i),
-        column_types.BOOLEAN: lambda r, i: r.get_value_data_as_boolean(i),
-        column_types.DATE_TIME: lambda r, i: to_iso_fmt(
-            from_ole_timestamp(
-                unpack('d', r.get_value_data(i))[0] * 24 * 60 * 60 * 1000000
-            )
-        ),
-        column_types.LARGE_TEXT: lambda r, i: r.get_value_data_as_string(i),
-        column_types.BINARY_DATA: lambda r, i: r.get_value_data(i),
-        column_types.LARGE_BINARY_DATA: lambda r, i: r.get_value_data(i),
-        column_types.SUPER_LARGE_VALUE: lambda r, i: r.get_value_data(i),
-        column_types.FLOAT_32BIT: lambda r, i: unpack(
-            'f', r.get_value_data(i)
-        )[0],
-        column_types.DOUBLE_64BIT: lambda r, i: unpack(
-            'd', r.get_value_data(i)
-        )[0],
-        column_types.INTEGER_8BIT_UNSIGNED: lambda r, i: unpack(
-            'B', r.get_value_data(i)
-        )[0],
-        column_types.INTEGER_16BIT_SIGNED: lambda r, i: unpack(
-            'h', r.get_value_data(i)
-        )[0],
-        column_types.INTEGER_16BIT_UNSIGNED: lambda r, i: unpack(
-            'H', r.get_value_data(i)
-        )[0],
-        column_types.INTEGER_32BIT_SIGNED: lambda r, i: unpack(
-            'i', r.get_value_data(i)
-        )[0],
-        column_types.INTEGER_32BIT_UNSIGNED: lambda r, i: unpack(
-            'I', r.get_value_data(i)
-        )[0],
-        column_types.INTEGER_64BIT_SIGNED: lambda r, i: unpack(
-            'q', r.get_value_data(i)
-        )[0],
-    }
-    parse = column_type_strategy.get(col_type)
+    parse = _column_parsers().get(col_type)
     if parse is None:
         ctx.register_error("get_ese_column_parse failed")
     return parse
@@ -138,30 +161,89 @@ def get_ese_record_value(ctx, record, index, col_type):
     """Get record value for given index"""
     parse = get_ese_column_parse(ctx, col_type)
     if parse is None:
-        return 'plasma:except:unsupported_type'
+        return _UNSUPPORTED_TYPE
     try:
         return parse(record, index)
     except:
         ctx.register_error("get_ese_record_value failed to parse value")
-        return 'plasma:except:parsing_failed'
+        return _PARSING_FAILED
+
+
+@dataclass(frozen=True)
+class EseColumnDecoder:
+    """Decoder of a table column"""
+
+    name: str
+    index: int
+    parse: Callable | None
+
+
+@dataclass(frozen=True)
+class EseTableDecoder:
+    """Decoder of table records built once per table schema"""
+
+    columns: tuple[EseColumnDecoder, ...]
 
+    def decode(self, ctx, record) -> Record:
+        """Decode record as dict"""
+        values = {}
+        for column in self.columns:
+            if column.parse is None:
+                values[column.name] = _UNSUPPORTED_TYPE
+                continue
+            try:
+                values[column.name] = column.parse(record, column.index)
+            except:
+                ctx.register_error(
+                    "get_ese_record_value failed to parse value"
+                )
+                values[column.name] = _PARSING_FAILED
+        return values
 
-def iter_ese_table_records_as_dicts(ctx, esedb, tablename):
-    """Iterate over table records as dicts"""
+
+def _parse_missing(_record, _index: int) -> None:
+    return None
+
+
+def compile_ese_table_decoder(
+    ctx, table, columns: Iterable[str] | None = None
+) -> EseTableDecoder:
+    """Build table decoder, only given columns are decoded if any
+
+    Missing columns are registered as errors and decoded as None.
+    """
+    wanted = None if columns is None else list(columns)
+    decoders = {}
+    for index, column in enumerate(iter_ese_table_columns(ctx, table)):
+        name = get_ese_column_name(ctx, column)
+        if wanted is not None and name not in wanted:
+            continue
+        parse = get_ese_column_parse(ctx, get_ese_column_type(ctx, column))
+        decoders[name] = EseColumnDecoder(name=name, index=index, parse=parse)
+    if wanted is None:
+        return EseTableDecoder(columns=tuple(decoders.values()))
+    for name in wanted:
+        if name not in decoders:
+            ctx.register_error(f"cannot find ese column: {name}")
+            decoders[name] = EseColumnDecoder(
+                name=name, index=-1, parse=_parse_missing
+            )
+    return EseTableDecoder(columns=tuple(decoders[name] for name in wanted))
+
+
+def iter_ese_table_records_as_dicts(
+    ctx, esedb, tablename, columns: Iterable[str] | None = None
+):
+    """Iterate over table records as dicts
+
+    Only given columns are decoded if any, table decoder is built once
+    for all records.
+    """
     for table in iter_ese_tables(ctx, esedb):
         name = get_ese_table_name(ctx, table)
         if name != tablename:
             continue
-        columns = [
-            (
-                get_ese_column_name(ctx, column),
-                get_ese_column_type(ctx, column),
-            )
-            for column in iter_ese_table_columns(ctx, table)
-        ]
+        decoder = compile_ese_table_decoder(ctx, table, columns)
         for record in iter_ese_table_records(ctx, table):
-            yield {
-                column[0]: get_ese_record_value(ctx, record, index, column[1])
-                for index, column in enumerate(columns)
-            }
+            yield decoder.decode(ctx, record)
         break
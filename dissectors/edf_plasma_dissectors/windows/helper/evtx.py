@@ -1,19 +1,36 @@
 """python-libevtx wrapper"""
 
+from dataclasses import dataclass
+from datetime import datetime
+from io import RawIOBase
+from os import getenv
 from pathlib import Path
+from struct import Struct
+from zlib import crc32
 
+from edf_plasma_core.helper.datetime import from_iso_fmt, to_utc, with_utc
 from edf_plasma_core.helper.importing import lazy_import
+from edf_plasma_core.helper.sniffing import ContentType, content_type
+from edf_plasma_core.helper.streaming import BufferReader
 
 lazy_pyevtx = lazy_import('pyevtx')
 PYEVTX_AVAILABLE = lazy_pyevtx is not None
 
+EVTX_HEADER_BLOCK_SIZE = 4096
+EVTX_CHUNK_SIZE = 65536
+_EVTX_SIGNATURE = b'ElfFile\x00'
+# signature, first and last chunk numbers, next record identifier, header
+# size, minor and major versions, header block size, number of chunks
+_EVTX_HEADER = Struct('<8sQQQIHHHH')
+# file flags and CRC32 of the first 120 bytes
+_EVTX_HEADER_TRAILER = Struct('<II')
+_EVTX_HEADER_TRAILER_OFFSET = 120
+_EVTX_FLAG_DIRTY = 0x0001
+
 
 def check_file_signature(filepath: Path) -> bool:
-    """pyevtx.check_file_signature wrapper"""
-    try:
-        return lazy_pyevtx.check_file_signature(str(filepath))
-    except OSError:
-        return False
+    """Determine if given file matches EVTX signature"""
+    return content_type(filepath) == ContentType.EVTX
 
 
 def open_file_object(ctx, fobj):
@@ -52,3 +69,203 @@ def get_record_creation_time(ctx, record):
     except OSError:
         ctx.register_error("get_record_creation_time failed")
         return None
+
+
+def get_record_event_identifier(ctx, record):
+    """Retrieve EVTX record event identifier without rendering its XML"""
+    try:
+        return record.event_identifier
+    except OSError:
+        ctx.register_error("get_record_event_identifier failed")
+        return None
+
+
+def _env_set(name: str) -> frozenset[str] | None:
+    value = getenv(name)
+    if not value:
+        return None
+    items = (item.strip() for item in value.split(','))
+    return frozenset(item for item in items if item)
+
+
+def _env_datetime(name: str) -> datetime | None:
+    value = getenv(name)
+    if not value:
+        return None
+    try:
+        dtv = from_iso_fmt(value)
+    except ValueError:
+        raise ValueError(f"{name}: invalid ISO datetime '{value}'") from None
+    return with_utc(dtv) if dtv.tzinfo is None else to_utc(dtv)
+
+
+def _env_event_ids(name: str) -> frozenset[int] | None:
+    event_ids = _env_set(name)
+    if event_ids is None:
+        return None
+    try:
+        return frozenset(int(event_id) for event_id in event_ids)
+    except ValueError:
+        raise ValueError(
+            f"{name}: invalid event identifier in '{getenv(name)}'"
+        ) from None
+
+
+def _casefold(value: str | None) -> str | None:
+    return value.casefold() if value is not None else None
+
+
+@dataclass(kw_only=True)
+class EvtxFilter:
+    """EVTX records filter, unset criteria match all records
+
+    Channels and providers are compared case-insensitively, since is
+    inclusive and until is exclusive.
+    """
+
+    event_ids: frozenset[int] | None = None
+    channels: frozenset[str] | None = None
+    providers: frozenset[str] | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+
+    @classmethod
+    def from_env(cls):
+        """Build filter from environment
+
+        PLASMA_EVTX_EVENT_IDS, PLASMA_EVTX_CHANNELS and PLASMA_EVTX_PROVIDERS
+        are comma separated lists, PLASMA_EVTX_SINCE and PLASMA_EVTX_UNTIL
+        are ISO datetimes (UTC unless specified). ValueError is raised if a
+        value is invalid.
+        """
+        event_ids = _env_event_ids('PLASMA_EVTX_EVENT_IDS')
+        channels = _env_set('PLASMA_EVTX_CHANNELS')
+        if channels is not None:
+            channels = frozenset(map(_casefold, channels))
+        providers = _env_set('PLASMA_EVTX_PROVIDERS')
+        if providers is not None:
+            providers = frozenset(map(_casefold, providers))
+        return cls(
+            event_ids=event_ids,
+            channels=channels,
+            providers=providers,
+            since=_env_datetime('PLASMA_EVTX_SINCE'),
+            until=_env_datetime('PLASMA_EVTX_UNTIL'),
+        )
+
+    def match_time(self, dtv: datetime) -> bool:
+        """Determine if UTC datetime is in time range"""
+        if self.since is not None and dtv < self.since:
+            return False
+        if self.until is not None and dtv >= self.until:
+            return False
+        return True
+
+    def match_event_id(self, event_id: int | None) -> bool:
+        """Determine if event identifier is selected"""
+        return self.event_ids is None or event_id in self.event_ids
+
+    def match_system(self, system) -> bool:
+        """Determine if event system element fields are selected"""
+        if not self.match_event_id(system.event_id):
+            return False
+        if (
+            self.channels is not None
+            and _casefold(system.channel) not in self.channels
+        ):
+            return False
+        if (
+            self.providers is not None
+            and _casefold(system.provider) not in self.providers
+        ):
+            return False
+        return True
+
+
+def evtx_chunk_count(header: bytes) -> int | None:
+    """Number of chunks of a clean EVTX file, None if file header is
+    invalid or if file is dirty (chunks are not all accounted for)
+    """
+    if len(header) < EVTX_HEADER_BLOCK_SIZE:
+        return None
+    signature, *_, block_size, chunk_count = _EVTX_HEADER.unpack_from(header)
+    flags, _ = _EVTX_HEADER_TRAILER.unpack_from(
+        header, _EVTX_HEADER_TRAILER_OFFSET
+    )
+    if (
+        signature != _EVTX_SIGNATURE
+        or block_size != EVTX_HEADER_BLOCK_SIZE
+        or flags & _EVTX_FLAG_DIRTY
+    ):
+        return None
+    return chunk_count
+
+
+class EvtxChunkRangeReader(BufferReader):
+    """Read-only file object presenting a range of chunks of an EVTX file
+    as a whole EVTX file
+
+    Chunks are read from a window of buffer (bytes, mmap...), file header
+    is copied and updated to describe the range only. Reader must be closed
+    before closing an underlying mmap.
+    """
+
+    def __init__(self, buffer, first_chunk: int, chunk_count: int):
+        super().__init__(
+            buffer,
+            EVTX_HEADER_BLOCK_SIZE + first_chunk * EVTX_CHUNK_SIZE,
+            chunk_count * EVTX_CHUNK_SIZE,
+        )
+        header = bytearray(buffer[:EVTX_HEADER_BLOCK_SIZE])
+        (
+            signature,
+            _,
+            _,
+            next_record_id,
+            header_size,
+            minor_version,
+            major_version,
+            block_size,
+            _,
+        ) = _EVTX_HEADER.unpack_from(header)
+        _EVTX_HEADER.pack_into(
+            header,
+            0,
+            signature,
+            0,
+            chunk_count - 1,
+            next_record_id,
+            header_size,
+            minor_version,
+            major_version,
+            block_size,
+            chunk_count,
+        )
+        flags, _ = _EVTX_HEADER_TRAILER.unpack_from(
+            header, _EVTX_HEADER_TRAILER_OFFSET
+        )
+        checksum = crc32(header[:_EVTX_HEADER_TRAILER_OFFSET])
+        _EVTX_HEADER_TRAILER.pack_into(
+            header, _EVTX_HEADER_TRAILER_OFFSET, flags, checksum
+        )
+        self._header = bytes(header)
+
+    # read through readinto which prepends header block to the window
+    read = RawIOBase.read
+
+    def get_size(self) -> int:
+        """Size of the presented file"""
+        return EVTX_HEADER_BLOCK_SIZE + super().get_size()
+
+    def readinto(self, buffer) -> int:
+        with memoryview(buffer) as out:
+            data = self._header[self._pos : self._pos + len(out)]
+            size = len(data)
+            out[:size] = data
+            if size < len(out):
+                beg = self._pos + size - EVTX_HEADER_BLOCK_SIZE
+                data = self._view[beg : beg + len(out) - size]
+                out[size : size + len(data)] = data
+                size += len(data)
+        self._pos += size
+        return size
@@ -3,17 +3,15 @@
 from pathlib import Path
 
 from edf_plasma_core.helper.importing import lazy_import
+from edf_plasma_core.helper.sniffing import ContentType, content_type
 
 lazy_pylnk = lazy_import('pylnk')
 PYLNK_AVAILABLE = lazy_pylnk is not None
 
 
 def check_file_signature(filepath: Path):
-    """pylnk.check_file_signature wrapper"""
-    try:
-        return lazy_pylnk.check_file_signature(str(filepath))
-    except OSError:
-        return False
+    """Determine if given file matches LNK signature"""
+    return content_type(filepath) == ContentType.LNK
 
 
 def check_file_signature_file_object(fobj):
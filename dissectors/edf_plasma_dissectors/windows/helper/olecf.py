@@ -3,17 +3,15 @@
 from pathlib import Path
 
 from edf_plasma_core.helper.importing import lazy_import
+from edf_plasma_core.helper.sniffing import ContentType, content_type
 
 lazy_pyolecf = lazy_import('pyolecf')
 PYOLECF_AVAILABLE = lazy_pyolecf is not None
 
 
 def check_file_signature(filepath: Path) -> bool:
-    """pyevtx.check_file_signature wrapper"""
-    try:
-        return lazy_pyolecf.check_file_signature(str(filepath))
-    except OSError:
-        return False
+    """Determine if given file matches OLECF signature"""
+    return content_type(filepath) == ContentType.OLECF
 
 
 def open_file_object(ctx, fobj):
@@ -4,6 +4,7 @@ from enum import Enum
 from pathlib import Path
 
 from edf_plasma_core.helper.importing import lazy_import
+from edf_plasma_core.helper.sniffing import ContentType, content_type
 
 lazy_pyregf = lazy_import('pyregf')
 PYREGF_AVAILABLE = lazy_pyregf is not None
@@ -28,10 +29,7 @@ class ValueType(Enum):
 
 
 def check_file_signature(filepath: Path) -> bool:
-    try:
-        return lazy_pyregf.check_file_signature(str(filepath))
-    except OSError:
-        return False
+    return content_type(filepath) == ContentType.REGF
 
 
 def open_file_object(ctx, fobj):
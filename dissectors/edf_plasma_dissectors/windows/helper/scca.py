@@ -4,16 +4,14 @@ from pathlib import Path
 
 from edf_plasma_core.helper.datetime import REF_WIN32, with_utc
 from edf_plasma_core.helper.importing import lazy_import
+from edf_plasma_core.helper.sniffing import ContentType, content_type
 
 lazy_pyscca = lazy_import('pyscca')
 PYSCCA_AVAILABLE = lazy_pyscca is not None
 
 
 def check_file_signature(filepath: Path) -> bool:
-    try:
-        return lazy_pyscca.check_file_signature(str(filepath))
-    except OSError:
-        return False
+    return content_type(filepath) == ContentType.SCCA
 
 
 def open_file_object(ctx, fobj):
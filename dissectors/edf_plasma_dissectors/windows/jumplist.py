@@ -1,6 +1,5 @@
 """Windows JumpList artifact dissector"""
 
-from io import BytesIO
 from mmap import ACCESS_READ, mmap
 from pathlib import Path
 
@@ -13,20 +12,22 @@ from edf_plasma_core.dissector import (
 from edf_plasma_core.helper.glob import ci_glob_pattern
 from edf_plasma_core.helper.logging import get_logger
 from edf_plasma_core.helper.selecting import select
+from edf_plasma_core.helper.streaming import BufferReader
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import PathIterator, RecordIterator
 
 from .helper.olecf import check_file_signature, open_file_object
 from .parser.jumplist import dest_list_entries, parse_lnk_blob
-from .parser.lnk import MS_SHLLNK_SIG, parse_lnk_bytes
+from .parser.lnk import MS_SHLLNK_HEADER, parse_lnk_bytes
 
+REQUIRES = ('pyolecf', 'pylnk')
 _LOGGER = get_logger('dissectors.windows.jumplist')
 
 
 def _check_custom_destination(filepath: Path) -> bool:
     with filepath.open('rb') as fobj:
         with mmap(fobj.fileno(), 0, access=ACCESS_READ) as mem:
-            return mem.find(MS_SHLLNK_SIG) >= 0
+            return mem.find(MS_SHLLNK_HEADER) >= 0
 
 
 def _parse_custom_destination(ctx: DissectionContext) -> RecordIterator:
@@ -34,11 +35,13 @@ def _parse_custom_destination(ctx: DissectionContext) -> RecordIterator:
         with mmap(fobj.fileno(), 0, access=ACCESS_READ) as mem:
             offset = 0
             while True:
-                offset = mem.find(MS_SHLLNK_SIG, offset)
+                offset = mem.find(MS_SHLLNK_HEADER, offset)
                 if offset < 0:
                     break
-                yield from parse_lnk_bytes(BytesIO(mem[offset:]), ctx)
-                offset += 1
+                # reader is a window of the mapping, LNK is not copied
+                with BufferReader(mem, offset) as reader:
+                    yield from parse_lnk_bytes(reader, ctx)
+                offset += len(MS_SHLLNK_HEADER)
 
 
 def _check_automatic_destination(filepath: Path) -> bool:
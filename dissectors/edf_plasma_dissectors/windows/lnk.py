@@ -17,6 +17,7 @@ from edf_plasma_core.helper.typing import PathIterator, RecordIterator
 from .helper.lnk import check_file_signature, open_file_object
 from .parser.lnk import lnk_records
 
+REQUIRES = ('pylnk',)
 _LOGGER = get_logger('dissectors.windows.lnk')
 
 
@@ -1,5 +1,14 @@
-"""Windows MFT artifact dissector"""
+"""Windows MFT artifact dissector
 
+Entries can be dissected by a pool of processes (see PLASMA_MFT_WORKERS),
+entry index space is then split in ranges. Directory paths are collected
+in a first pass and shared with workers, file paths are built from the
+parent directory path instead of being resolved by pyfsntfs, sequential
+dissection uses the same table.
+"""
+
+from collections.abc import Callable
+from os import getenv
 from pathlib import Path
 
 from edf_plasma_core.concept import Tag
@@ -10,6 +19,7 @@ from edf_plasma_core.dissector import (
 )
 from edf_plasma_core.helper.datetime import macb_groups, to_iso_fmt, with_utc
 from edf_plasma_core.helper.glob import ci_glob_pattern
+from edf_plasma_core.helper.parallel import ordered_process_map
 from edf_plasma_core.helper.selecting import select
 from edf_plasma_core.helper.table import Column, DataType
 from edf_plasma_core.helper.typing import PathIterator, RecordIterator
@@ -17,6 +27,12 @@ from edf_plasma_core.helper.typing import PathIterator, RecordIterator
 from .helper.fsntfs import mft_metadata_file
 from .parser.mft import parse_file_name_flags
 
+REQUIRES = ('pyfsntfs',)
+_WORKERS = int(getenv('PLASMA_MFT_WORKERS', '1'))
+_ENTRIES_PER_TASK = 16384
+_MFT_ENTRY_INDEX_ROOT = 5
+_MFT_ENTRY_INDEX_MASK = 0xFFFFFFFFFFFF
+_ORPHAN = '$Orphan'
 _NAMESPACE_DOS = 2
 _ATTR_DATA = 0x80
 _ATTR_FILE_NAME = 0x30
@@ -25,9 +41,40 @@ _REC_MACB = 'mft_e_macb'
 _REC_PATH = 'mft_e_path'
 _REC_SIZE = 'mft_e_size'
 _REC_FLAGS = 'mft_e_flags'
+# directory file reference to path table of worker process
+_DIRECTORY_PATHS = {}
+
+PathHintGetter = Callable[[object, object], str]
+
+
+def _is_root(file_ref: int) -> bool:
+    """Determine if file reference points to root directory, libfsntfs
+    ignores its sequence number
+    """
+    return file_ref & _MFT_ENTRY_INDEX_MASK == _MFT_ENTRY_INDEX_ROOT
+
 
+def _table_path_hint(paths: dict[int, str]) -> PathHintGetter:
+    """Path hint getter building path from parent directory path found in
+    directory file reference to path table
+    """
 
-def _parse_mft_entry(mft_entry) -> RecordIterator:
+    def _path_hint(mft_entry, mft_entry_attrib) -> str:
+        if _is_root(mft_entry.file_reference):
+            return '\\'
+        parent_ref = mft_entry_attrib.parent_file_reference
+        if _is_root(parent_ref):
+            parent_path = ''
+        else:
+            parent_path = paths.get(parent_ref, _ORPHAN)
+        return f'{parent_path}\\{mft_entry_attrib.name}'
+
+    return _path_hint
+
+
+def _parse_mft_entry(
+    mft_entry, get_path_hint: PathHintGetter
+) -> RecordIterator:
     # parse mft entry attributes
     record = {
         _REC_TIME: '',
@@ -44,7 +91,7 @@ def _parse_mft_entry(mft_entry) -> RecordIterator:
             data_sizes.append(mft_entry_attrib.data_size)
             continue
         if mft_entry_attrib.attribute_type == _ATTR_FILE_NAME:
-            path_hint = mft_entry.get_path_hint(mft_attrib_idx)
+            path_hint = get_path_hint(mft_entry, mft_entry_attrib)
             macb_groups_ = list(
                 macb_groups(
                     with_utc(mft_entry_attrib.modification_time),
@@ -95,20 +142,163 @@ def _select_impl(directory: Path) -> PathIterator:
     yield from select(directory, pattern)
 
 
+def _base_mft_entries(mft, first: int, count: int):
+    for entry_idx in range(first, first + count):
+        mft_entry = mft.get_file_entry(entry_idx)
+        if (
+            not mft_entry.is_empty()
+            and mft_entry.base_record_file_reference == 0
+        ):
+            yield mft_entry
+
+
+def _directory_name(mft_entry) -> tuple[int, str] | None:
+    """Parent file reference and name of a directory, the name used is the
+    last non-DOS file name like the path of records
+    """
+    found = None
+    for mft_attrib_idx in range(mft_entry.number_of_attributes):
+        mft_entry_attrib = mft_entry.get_attribute(mft_attrib_idx)
+        if (
+            mft_entry_attrib.attribute_type == _ATTR_FILE_NAME
+            and mft_entry_attrib.name_space != _NAMESPACE_DOS
+        ):
+            found = (
+                mft_entry_attrib.parent_file_reference,
+                mft_entry_attrib.name,
+            )
+    return found
+
+
+def _mft_directories(
+    mft, first: int, count: int
+) -> dict[int, tuple[int, str]]:
+    """Map file references of directories of an entry range to their parent
+    file reference and name
+    """
+    directories = {}
+    for mft_entry in _base_mft_entries(mft, first, count):
+        if not mft_entry.has_directory_entries_index():
+            continue
+        directory = _directory_name(mft_entry)
+        if directory is not None:
+            directories[mft_entry.file_reference] = directory
+    return directories
+
+
+def _range_directories(
+    filepath: Path, first: int, count: int
+) -> dict[int, tuple[int, str]]:
+    """Directories of an entry range in a worker process"""
+    with filepath.open('rb') as fobj:
+        mft = mft_metadata_file()
+        mft.open_file_object(fobj)
+        try:
+            return _mft_directories(mft, first, count)
+        finally:
+            mft.close()
+
+
+def _directory_paths(
+    directories: dict[int, tuple[int, str]],
+) -> dict[int, str]:
+    """Map file references of directories to their path
+
+    Directories which parent is missing, reallocated (sequence number
+    mismatch) or part of a loop are placed under $Orphan, root directory
+    is resolved whatever its sequence number.
+    """
+    paths = {file_ref: '' for file_ref in directories if _is_root(file_ref)}
+    for file_ref in directories:
+        chain = []
+        while file_ref not in paths:
+            chain.append(file_ref)
+            parent_ref = directories[file_ref][0]
+            if _is_root(parent_ref):
+                parent_path = ''
+                break
+            if parent_ref not in directories or parent_ref in chain:
+                parent_path = _ORPHAN
+                break
+            file_ref = parent_ref
+        else:
+            parent_path = paths[file_ref]
+        for file_ref in reversed(chain):
+            name = directories[file_ref][1]
+            parent_path = paths[file_ref] = f'{parent_path}\\{name}'
+    return paths
+
+
+def _set_directory_paths(paths: dict[int, str]):
+    """Worker process initializer"""
+    _DIRECTORY_PATHS.update(paths)
+
+
+def _range_records(filepath: Path, first: int, count: int) -> list[dict]:
+    """Dissect an entry range in a worker process"""
+    records = []
+    get_path_hint = _table_path_hint(_DIRECTORY_PATHS)
+    with filepath.open('rb') as fobj:
+        mft = mft_metadata_file()
+        mft.open_file_object(fobj)
+        try:
+            for mft_entry in _base_mft_entries(mft, first, count):
+                # records are yielded as updates of the same dict
+                records.extend(
+                    dict(record)
+                    for record in _parse_mft_entry(mft_entry, get_path_hint)
+                    if record
+                )
+        finally:
+            mft.close()
+    return records
+
+
+def _parallel_mft_records(
+    filepath: Path, entry_count: int, workers: int
+) -> RecordIterator:
+    ranges = [
+        (filepath, first, min(_ENTRIES_PER_TASK, entry_count - first))
+        for first in range(0, entry_count, _ENTRIES_PER_TASK)
+    ]
+    directories = {}
+    for range_directories in ordered_process_map(
+        _range_directories, ranges, workers
+    ):
+        directories.update(range_directories)
+    paths = _directory_paths(directories)
+    del directories
+    for records in ordered_process_map(
+        _range_records,
+        ranges,
+        workers,
+        initializer=_set_directory_paths,
+        initargs=(paths,),
+    ):
+        yield from records
+
+
 def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
     with ctx.filepath.open('rb') as fobj:
         mft = mft_metadata_file()
         mft.open_file_object(fobj)
-        for entry_idx in range(mft.number_of_file_entries):
-            mft_entry = mft.get_file_entry(entry_idx)
-            if (
-                not mft_entry.is_empty()
-                and mft_entry.base_record_file_reference == 0
-            ):
-                for record in _parse_mft_entry(mft_entry):
+        entry_count = mft.number_of_file_entries
+        if _WORKERS > 1 and entry_count > _ENTRIES_PER_TASK:
+            mft.close()
+            yield from _parallel_mft_records(
+                ctx.filepath, entry_count, _WORKERS
+            )
+            return
+        try:
+            paths = _directory_paths(_mft_directories(mft, 0, entry_count))
+            get_path_hint = _table_path_hint(paths)
+            for mft_entry in _base_mft_entries(mft, 0, entry_count):
+                for record in _parse_mft_entry(mft_entry, get_path_hint):
                     if not record:
                         continue
                     yield record
+        finally:
+            mft.close()
 
 
 DISSECTOR = Dissector(
@@ -9,6 +9,10 @@ from edf_plasma_core.helper.datetime import macb_groups, to_iso_fmt, with_utc
 from ..helper.lnk import check_file_signature_file_object, open_file_object
 
 MS_SHLLNK_SIG = b'\x4c\x00\x00\x00'
+# HeaderSize followed by LinkCLSID 00021401-0000-0000-C000-000000000046
+MS_SHLLNK_HEADER = MS_SHLLNK_SIG + bytes.fromhex(
+    '0114020000000000c000000000000046'
+)
 
 
 def lnk_records(lnk_obj):
@@ -37,12 +41,12 @@ def lnk_records(lnk_obj):
         }
 
 
-def parse_lnk_bytes(bytes_io, ctx: DissectionContext):
-    """Parse bytes io instance as LNK object"""
-    if not check_file_signature_file_object(bytes_io):
+def parse_lnk_bytes(fobj, ctx: DissectionContext):
+    """Parse file object (BytesIO, BufferReader...) as LNK object"""
+    if not check_file_signature_file_object(fobj):
         return
     try:
-        lnk_obj = open_file_object(bytes_io)
+        lnk_obj = open_file_object(fobj)
     except OSError as exc:
         ctx.register_error(f"liblnk exception: {exc}")
         return
@@ -1,5 +1,14 @@
-"""NTFS helper"""
+"""NTFS helper
 
+Flags are decoded once per distinct value, decoded strings are interned.
+"""
+
+from collections.abc import Callable
+from functools import lru_cache, reduce
+from operator import or_
+from sys import intern
+
+_FLAGS_CACHE_SIZE = 4096
 _REASON_FLAGS = {
     0x00000001: 'DATA_OVERWRITE',
     0x00000002: 'DATA_EXTENDED',
@@ -54,16 +63,37 @@ def _parse_generic_flags(flags: int, features: dict[int, str]) -> str:
     )
 
 
+def _flags_parser(features: dict[int, str]) -> Callable[[int], str]:
+    """Build memoized flags parser, unknown bits are masked out before
+    lookup so that they do not fill the cache
+    """
+    known = reduce(or_, features)
+
+    @lru_cache(maxsize=_FLAGS_CACHE_SIZE)
+    def parse_known_flags(flags: int) -> str:
+        return intern(_parse_generic_flags(flags, features))
+
+    def parse_flags(flags: int) -> str:
+        return parse_known_flags(flags & known)
+
+    return parse_flags
+
+
+_parse_file_name_flags = _flags_parser(_ATTR_FILE_NAME_FLAGS)
+_parse_usnj_entry_source = _flags_parser(_SOURCE_FLAGS)
+_parse_usnj_entry_reason = _flags_parser(_REASON_FLAGS)
+
+
 def parse_file_name_flags(flags: int) -> str:
     """Parse $MFT $FILE_NAME attribute flags"""
-    return _parse_generic_flags(flags, _ATTR_FILE_NAME_FLAGS)
+    return _parse_file_name_flags(flags)
 
 
 def parse_usnj_entry_source(flags: int) -> str:
     """Parse $UsnJrnl:$J entry source flags"""
-    return _parse_generic_flags(flags, _SOURCE_FLAGS)
+    return _parse_usnj_entry_source(flags)
 
 
 def parse_usnj_entry_reason(flags: int) -> str:
     """Parse $UsnJrnl:$J entry reason flags"""
-    return _parse_generic_flags(flags, _REASON_FLAGS)
+    return _parse_usnj_entry_reason(flags)
@@ -1,8 +1,25 @@
-"""USNJ parser"""
+"""USNJ parser
+
+Journal is memory mapped and record headers are decoded with precompiled
+structs. Zero regions between records are skipped using SEEK_DATA when the
+journal is a sparse file and by comparing large strides with zeros
+otherwise. Records can be decoded by a pool of processes (see
+PLASMA_USNJ_WORKERS), journal is then split in page-aligned chunks as
+records do not cross pages. Parallel decoding only pays off for large
+journals on several cores, records are sent back to the main process.
+"""
+
+from collections.abc import Iterator
+from errno import ENXIO
+from mmap import ACCESS_READ, mmap
+from os import getenv, lseek
+from pathlib import Path
+from struct import Struct
 
-from construct import Int16ul, Int32ul, Int64ul, Struct
 from edf_plasma_core.dissector import DissectionContext
 from edf_plasma_core.helper.datetime import from_win32_timestamp, to_iso_fmt
+from edf_plasma_core.helper.parallel import ordered_process_map
+from edf_plasma_core.helper.typing import RecordIterator
 
 from .mft import (
     parse_file_name_flags,
@@ -10,21 +27,29 @@ from .mft import (
     parse_usnj_entry_source,
 )
 
-USN_RECORD_V2_HDR = Struct(
-    'entry_sz' / Int32ul,
-    'major_version' / Int16ul,
-    'minor_version' / Int16ul,
-    'mft_ref' / Int64ul,
-    'mft_ref_parent' / Int64ul,
-    'offset' / Int64ul,
-    'timestamp' / Int64ul,
-    'reason' / Int32ul,
-    'source_info' / Int32ul,
-    'security_id' / Int32ul,
-    'file_flags' / Int32ul,
-    'filename_sz' / Int16ul,
-)
-USN_RECORD_V2_HDR_SZ = USN_RECORD_V2_HDR.sizeof()
+try:
+    from os import SEEK_DATA
+except ImportError:
+    SEEK_DATA = None
+
+_WORKERS = int(getenv('PLASMA_USNJ_WORKERS', '1'))
+_CHUNK_SIZE = 16 * 1024 * 1024
+_PAGE_SIZE = 4096
+_STRIDE_SIZE = 1024 * 1024
+_STRIDE_ZEROS = bytes(_STRIDE_SIZE)
+_RECORD_ALIGNMENT = 8
+_UINT32 = Struct('<I')
+_USN_RECORD_PREFIX = Struct('<IHH')
+# file references of v3 records are 128-bit, NTFS uses the low 64 bits
+_USN_RECORD_HDRS = {
+    2: Struct('<IHHQQQQIIIIHH'),
+    3: Struct('<IHHQ8xQ8xQQIIIIHH'),
+}
+# v4 records describe modified ranges, they are skipped
+_USN_RECORD_V4 = 4
+
+UsnRecordHeader = tuple[int, ...]
+UsnRecordHeaderIterator = Iterator[tuple[int, int, UsnRecordHeader | None]]
 
 
 def _parse_mft_ref(buf):
@@ -33,65 +58,203 @@ def _parse_mft_ref(buf):
     return seq_num, ent_num
 
 
-def _find_next_entry(fobj) -> bool:
-    while True:
-        entry_sz_bytes = fobj.peek(4)
-        if not entry_sz_bytes:
-            return False
-        entry_sz = Int32ul.parse(entry_sz_bytes)
-        if entry_sz:
-            return True
-        fobj.read(4)
+def _first_non_zero(mem, offset: int, stop: int) -> int | None:
+    chunk = mem[offset:stop]
+    if len(chunk) == _STRIDE_SIZE and chunk == _STRIDE_ZEROS:
+        return None
+    remaining = len(chunk.lstrip(b'\x00'))
+    if not remaining:
+        return None
+    return offset + len(chunk) - remaining
+
+
+def _seek_data(fileno: int, offset: int, end: int) -> int:
+    """Skip holes of sparse file"""
+    if SEEK_DATA is None:
+        return offset
+    try:
+        return min(end, lseek(fileno, offset, SEEK_DATA))
+    except OSError as exc:
+        # ENXIO means there is no data after offset
+        return end if exc.errno == ENXIO else offset
+
+
+def _next_data(mem, fileno: int, offset: int, end: int) -> int:
+    """Offset of next aligned non-zero data, records do not cross pages
+    which end with zero padding
+    """
+    page_end = min(end, offset - offset % _PAGE_SIZE + _PAGE_SIZE)
+    found = _first_non_zero(mem, offset, page_end)
+    if found is None:
+        offset = _seek_data(fileno, page_end, end)
+        while offset < end:
+            stop = min(end, offset + _STRIDE_SIZE)
+            found = _first_non_zero(mem, offset, stop)
+            if found is not None:
+                break
+            offset = stop
+        else:
+            return end
+    return found - found % _RECORD_ALIGNMENT
+
+
+def _record_header(
+    mem, offset: int, end: int
+) -> tuple[int, UsnRecordHeader | None]:
+    """Decode record header, entry size is 0 if offset does not hold a
+    valid record
+    """
+    entry_sz, major_version, minor_version = (
+        _USN_RECORD_PREFIX.unpack_from(mem, offset)
+    )
+    if (
+        minor_version != 0
+        or entry_sz % _RECORD_ALIGNMENT
+        or offset + entry_sz > end
+    ):
+        return 0, None
+    if major_version == _USN_RECORD_V4:
+        return entry_sz, None
+    usn_record_hdr = _USN_RECORD_HDRS.get(major_version)
+    if usn_record_hdr is None or entry_sz < usn_record_hdr.size:
+        return 0, None
+    header = usn_record_hdr.unpack_from(mem, offset)
+    filename_sz, filename_offset = header[-2:]
+    if (
+        filename_offset < usn_record_hdr.size
+        or filename_offset + filename_sz > entry_sz
+    ):
+        return 0, None
+    return entry_sz, header
+
+
+def _record_headers(
+    mem, fileno: int, offset: int, end: int
+) -> UsnRecordHeaderIterator:
+    """Yield offset, size and header of records starting between offset
+    and end
+    """
+    size = len(mem)
+    end = min(end, size - _USN_RECORD_PREFIX.size + 1)
+    while offset < end:
+        if not _UINT32.unpack_from(mem, offset)[0]:
+            next_offset = _next_data(mem, fileno, offset, end)
+            # non-zero data may be in the upper half of aligned quadword
+            offset = max(next_offset, offset + _RECORD_ALIGNMENT)
+            continue
+        entry_sz, header = _record_header(mem, offset, size)
+        if not entry_sz:
+            offset += _RECORD_ALIGNMENT
+            continue
+        yield offset, entry_sz, header
+        offset += entry_sz
+
+
+_USNJ_KEYS = (
+    'usnj_time',
+    'usnj_reason',
+    'usnj_source',
+    'usnj_filename',
+    'usnj_file_flags',
+    'usnj_mft_seq_num',
+    'usnj_mft_ent_num',
+    'usnj_mft_parent_seq_num',
+    'usnj_mft_parent_ent_num',
+)
+
+
+def _usnj_values(mem, offset: int, header: UsnRecordHeader) -> tuple:
+    """Record values in _USNJ_KEYS order"""
+    (
+        _,
+        _,
+        _,
+        mft_ref,
+        mft_ref_parent,
+        _,
+        timestamp,
+        reason,
+        source_info,
+        _,
+        file_flags,
+        filename_sz,
+        filename_offset,
+    ) = header
+    filename_offset += offset
+    filename = mem[filename_offset : filename_offset + filename_sz].decode(
+        'utf-16le', errors='replace'
+    )
+    usnj_mft_seq_num, usnj_mft_ent_num = _parse_mft_ref(mft_ref)
+    usnj_mft_parent_seq_num, usnj_mft_parent_ent_num = _parse_mft_ref(
+        mft_ref_parent
+    )
+    return (
+        to_iso_fmt(from_win32_timestamp(timestamp // 10)),
+        parse_usnj_entry_reason(reason),
+        parse_usnj_entry_source(source_info),
+        filename,
+        parse_file_name_flags(file_flags),
+        usnj_mft_seq_num,
+        usnj_mft_ent_num,
+        usnj_mft_parent_seq_num,
+        usnj_mft_parent_ent_num,
+    )
+
+
+def _usnj_values_iter(mem, fileno: int, offset: int, end: int):
+    for record_offset, _, header in _record_headers(mem, fileno, offset, end):
+        if header is None:
+            continue
+        yield _usnj_values(mem, record_offset, header)
+
+
+def _usnj_records(mem, fileno: int, offset: int, end: int) -> RecordIterator:
+    for values in _usnj_values_iter(mem, fileno, offset, end):
+        yield dict(zip(_USNJ_KEYS, values))
 
 
-def usnj_records(ctx: DissectionContext):
+def _usnj_chunk_values(filepath: Path, offset: int, end: int) -> list[tuple]:
+    """Decode records starting in a journal chunk in a worker process,
+    values are sent back as tuples which pickle faster than dicts
+    """
+    with filepath.open('rb') as fobj:
+        with mmap(fobj.fileno(), 0, access=ACCESS_READ) as mem:
+            return list(_usnj_values_iter(mem, fobj.fileno(), offset, end))
+
+
+def _usnj_chunks(fileno: int, size: int) -> Iterator[tuple[int, int]]:
+    """Split journal in page-aligned chunks, holes are skipped"""
+    offset = _seek_data(fileno, 0, size)
+    while offset < size:
+        offset -= offset % _PAGE_SIZE
+        end = min(size, offset + _CHUNK_SIZE)
+        yield offset, end
+        offset = _seek_data(fileno, end, size)
+
+
+def _parallel_usnj_records(
+    filepath: Path, size: int, fileno: int, workers: int
+) -> RecordIterator:
+    chunks = (
+        (filepath, offset, end) for offset, end in _usnj_chunks(fileno, size)
+    )
+    for chunk_values in ordered_process_map(
+        _usnj_chunk_values, chunks, workers
+    ):
+        for values in chunk_values:
+            yield dict(zip(_USNJ_KEYS, values))
+
+
+def usnj_records(ctx: DissectionContext, workers: int = _WORKERS):
     """Retrieve USNJ records from context"""
-    total_size = ctx.filepath.stat().st_size
+    if not ctx.filepath.stat().st_size:
+        return
     with ctx.filepath.open('rb') as fobj:
-        while True:
-            if not _find_next_entry(fobj):
-                break
-            offset = fobj.tell()
-            usnj_ent_hdr_bytes = fobj.read(USN_RECORD_V2_HDR_SZ)
-            usnj_ent_hdr = USN_RECORD_V2_HDR.parse(usnj_ent_hdr_bytes)
-            # perform consistency check before going further
-            if (
-                usnj_ent_hdr.major_version not in (2, 3, 4)
-                or usnj_ent_hdr.minor_version != 0
-            ):
-                if offset + 1 + USN_RECORD_V2_HDR_SZ >= total_size:
-                    break
-                fobj.seek(offset + 1)
-                continue
-            filename = fobj.read(usnj_ent_hdr.filename_sz).decode('utf-16le')
-            padding_sz = (
-                usnj_ent_hdr.entry_sz
-                - USN_RECORD_V2_HDR_SZ
-                - usnj_ent_hdr.filename_sz
-            )
-            if padding_sz:
-                fobj.read(padding_sz)
-            usnj_mft_seq_num, usnj_mft_ent_num = _parse_mft_ref(
-                usnj_ent_hdr.mft_ref
-            )
-            (
-                usnj_mft_parent_seq_num,
-                usnj_mft_parent_ent_num,
-            ) = _parse_mft_ref(usnj_ent_hdr.mft_ref_parent)
-            yield {
-                'usnj_time': to_iso_fmt(
-                    from_win32_timestamp(usnj_ent_hdr.timestamp // 10)
-                ),
-                'usnj_reason': parse_usnj_entry_reason(usnj_ent_hdr.reason),
-                'usnj_source': parse_usnj_entry_source(
-                    usnj_ent_hdr.source_info
-                ),
-                'usnj_filename': filename,
-                'usnj_file_flags': parse_file_name_flags(
-                    usnj_ent_hdr.file_flags
-                ),
-                'usnj_mft_seq_num': usnj_mft_seq_num,
-                'usnj_mft_ent_num': usnj_mft_ent_num,
-                'usnj_mft_parent_seq_num': usnj_mft_parent_seq_num,
-                'usnj_mft_parent_ent_num': usnj_mft_parent_ent_num,
-            }
+        fileno = fobj.fileno()
+        with mmap(fileno, 0, access=ACCESS_READ) as mem:
+            if workers > 1:
+                yield from _parallel_usnj_records(
+                    ctx.filepath, len(mem), fileno, workers
+                )
+                return
+            yield from _usnj_records(mem, fileno, 0, len(mem))
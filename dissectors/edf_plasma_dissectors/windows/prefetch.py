@@ -25,6 +25,7 @@ from .helper.scca import (
     open_file_object,
 )
 
+REQUIRES = ('pyscca',)
 _LOGGER = get_logger('dissectors.windows.prefetch')
 
 
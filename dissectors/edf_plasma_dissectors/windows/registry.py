@@ -32,6 +32,7 @@ from .helper.regf import (
     open_file_object,
 )
 
+REQUIRES = ('pyregf',)
 _LOGGER = get_logger('dissectors.windows.registry')
 _VALUE_TYPE_PARSER = {
     ValueType.REG_SZ: get_value_as_string,
@@ -26,7 +26,11 @@ from .helper.esedb import (
     open_file_object,
 )
 
+REQUIRES = ('pyesedb',)
 _LOGGER = get_logger('dissectors.windows.srudb')
+_ID_MAP_COLUMNS = ('IdIndex', 'IdBlob')
+_APP_USAGE_TABLE = '{5C8CF1C7-7257-4F13-B223-970EF5939312}'
+_APP_USAGE_COLUMNS = ('AppId', 'UserId', 'EndTime', 'DurationMS')
 
 
 def _parse_app(data: bytes | None) -> str:
@@ -59,12 +63,12 @@ def _srudb_records(ctx: DissectionContext):
         srudb_id_mapping = {
             record['IdIndex']: record['IdBlob']
             for record in iter_ese_table_records_as_dicts(
-                ctx, srudb, 'SruDbIdMapTable'
+                ctx, srudb, 'SruDbIdMapTable', _ID_MAP_COLUMNS
             )
         }
         # parse records from {5C8CF1C7-7257-4F13-B223-970EF5939312}
         for record in iter_ese_table_records_as_dicts(
-            ctx, srudb, '{5C8CF1C7-7257-4F13-B223-970EF5939312}'
+            ctx, srudb, _APP_USAGE_TABLE, _APP_USAGE_COLUMNS
         ):
             end_time = from_win32_timestamp(int(record['EndTime']) // 10)
             delta = timedelta(milliseconds=int(record['DurationMS']))
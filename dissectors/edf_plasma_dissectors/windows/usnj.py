@@ -15,6 +15,8 @@ from edf_plasma_core.helper.typing import PathIterator, RecordIterator
 
 from .parser.usnj import usnj_records
 
+REQUIRES = ('pyfsntfs',)
+
 
 def _select_impl(directory: Path) -> PathIterator:
     pattern = ci_glob_pattern('$UsnJrnl*$J')
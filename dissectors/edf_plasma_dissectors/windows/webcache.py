@@ -21,8 +21,11 @@ from .helper.esedb import (
     open_file_object,
 )
 
+REQUIRES = ('pyesedb',)
 _LOGGER = get_logger('dissectors.windows.webcache')
 _SUPPORTED_NAMES = {'History', 'Cookies', 'iedownload'}
+_CONTAINERS_COLUMNS = ('ContainerId', 'Name')
+_CONTAINER_COLUMNS = ('Url', 'AccessedTime')
 
 
 def _select_impl(directory: Path) -> PathIterator:
@@ -40,14 +43,14 @@ def _dissect_impl(ctx: DissectionContext) -> RecordIterator:
         if webcache is None:
             return
         for container in iter_ese_table_records_as_dicts(
-            ctx, webcache, 'Containers'
+            ctx, webcache, 'Containers', _CONTAINERS_COLUMNS
         ):
             name = container['Name']
             if name not in _SUPPORTED_NAMES and not name.startswith('MSHist'):
                 continue
             cid = container['ContainerId']
             for record in iter_ese_table_records_as_dicts(
-                ctx, webcache, f'Container_{cid}'
+                ctx, webcache, f'Container_{cid}', _CONTAINER_COLUMNS
             ):
                 yield {
                     'hist_action': 'visit',
@@ -2,7 +2,9 @@
 
 from dataclasses import dataclass
 from enum import Enum, auto
+from xml.parsers.expat import ExpatError, ParserCreate
 
+from edf_plasma_core.dissector import DissectionContext
 from edf_plasma_core.helper.logging import get_logger
 from edf_plasma_core.helper.xml import (
     XMLSerializableAPI,
@@ -87,3 +89,107 @@ class Event(XMLSerializableAPI):
         datatype, data = _parse_data(element)
         data = element_to_string(data)
         return cls(system=system, datatype=datatype, data=data)
+
+
+_DATA_TYPES = {
+    'EventData': EventDataType.EVENT_DATA,
+    'UserData': EventDataType.USER_DATA,
+    'DebugData': EventDataType.DEBUG_DATA,
+    'BinaryEventData': EventDataType.BINARY_DATA,
+    'DissectionErrorData': EventDataType.ERROR_DATA,
+}
+_SYSTEM_TEXT_TAGS = {'EventID', 'Channel', 'Computer'}
+
+
+def _local_name(tag: str) -> str:
+    return tag.rpartition(':')[2]
+
+
+class _EventHandler:
+    """Expat handlers collecting system fields and event data location"""
+
+    def __init__(self, parser):
+        self._parser = parser
+        self._depth = 0
+        self._in_system = False
+        self._text = None
+        self.fields = {}
+        self.spans = {}
+
+    def start_element(self, tag: str, attrs: dict):
+        self._depth += 1
+        if self._depth == 2:
+            tag = _local_name(tag)
+            self._in_system = tag == 'System'
+            if tag in _DATA_TYPES and tag not in self.spans:
+                self.spans[tag] = [self._parser.CurrentByteIndex, None]
+            return
+        if self._depth == 3 and self._in_system:
+            tag = _local_name(tag)
+            if tag == 'Provider':
+                self.fields[tag] = attrs.get('Name')
+            elif tag in _SYSTEM_TEXT_TAGS:
+                self._text = []
+
+    def end_element(self, tag: str):
+        if self._depth == 3 and self._text is not None:
+            self.fields[_local_name(tag)] = ''.join(self._text)
+            self._text = None
+        elif self._depth == 2:
+            span = self.spans.get(_local_name(tag))
+            if span is not None and span[1] is None:
+                span[1] = self._parser.CurrentByteIndex
+        self._depth -= 1
+
+    def character_data(self, data: str):
+        if self._text is not None:
+            self._text.append(data)
+
+
+def _parse_event_id(ctx: DissectionContext, value: str | None) -> int | None:
+    if value is None or not value.strip():
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        ctx.register_error(f"invalid event identifier: {value!r}")
+        return None
+
+
+def event_from_record_xml(ctx: DissectionContext, string: str) -> Event | None:
+    """Build event from EVTX record XML string in a single parsing pass
+
+    Event data is the fragment of the XML string holding it, it is not
+    serialized again. Empty event identifier is None, invalid one is
+    registered as an error of ctx.
+    """
+    data = string.encode('utf-8')
+    parser = ParserCreate()
+    handler = _EventHandler(parser)
+    parser.StartElementHandler = handler.start_element
+    parser.EndElementHandler = handler.end_element
+    parser.CharacterDataHandler = handler.character_data
+    try:
+        parser.Parse(data, True)
+    except ExpatError:
+        _LOGGER.exception("XML parsing error!")
+        return None
+    fields = handler.fields
+    system = System(
+        channel=fields.get('Channel'),
+        provider=fields.get('Provider'),
+        computer=fields.get('Computer'),
+        event_id=_parse_event_id(ctx, fields.get('EventID')),
+    )
+    for tag, datatype in _DATA_TYPES.items():
+        span = handler.spans.get(tag)
+        if span is None:
+            continue
+        beg, end = span
+        # end of empty element tag is already known, end tag ends at next '>'
+        if data.startswith(b'</', end):
+            end = data.index(b'>', end) + 1
+        fragment = data[beg:end].decode('utf-8')
+        return Event(system=system, datatype=datatype, data=fragment)
+    _LOGGER.warning("cannot find event data in %s", list(handler.spans))
+    return Event(system=system, datatype=None, data=None)